@@ -23,11 +23,8 @@ from core import get_settings
 from core.logger import get_logger
 from core.models import (
     AgentType,
-    DocumentType,
-    PipelineConfig,
     PipelineSession,
     PipelineState,
-    TemplateType,
 )
 from gateway.session import SessionManager
 from pipeline.orchestrator import TOTAL_PHASES, PipelineOrchestrator
@@ -222,26 +219,10 @@ def resume(
 
     # Load session state
     state_file = session_dir / "pipeline_state.json"
-    with open(state_file) as f:
-        state_data = json.load(f)
-
-    # Recreate session from saved state
-    config_dict = state_data["config"]
-    config_dict["output_dir"] = Path(config_dict.get("output_dir", "output"))
-
-    # Recreate PipelineConfig
-    config = PipelineConfig(
-        topic=config_dict["topic"],
-        doc_type=DocumentType(config_dict.get("doc_type", "bizplan")),
-        template=TemplateType(config_dict.get("template", "default")),
-        language=config_dict.get("language", "ko"),
-        output_dir=config_dict["output_dir"],
-        max_retries=config_dict.get("max_retries", 2),
-        timeout_seconds=config_dict.get("timeout_seconds", 120),
-    )
-
-    # Recreate PipelineSession
-    session = PipelineSession(**state_data)
+    session = PipelineSession.from_checkpoint_json(state_file.read_bytes())
+
+    # Work on a copy of the saved config; from_phase is set below
+    config = session.config.model_copy()
 
     # Determine resume phase
     resume_phase = _get_resume_phase(session)
@@ -353,7 +334,6 @@ def resume(
                 logger.debug("[resume] Resetting BrowserPool for new event loop")
                 loop.run_until_complete(BrowserPool._instance.close_all())
             BrowserPool._instance = None
-            BrowserPool._lock = asyncio.Lock()
             logger.debug("[resume] BrowserPool reset completed")
         except Exception as e:
             logger.warning(f"[resume] BrowserPool reset warning: {e}")
@@ -235,7 +235,6 @@ def run(
             # Run on the current (default) event loop where BrowserPool was created
             asyncio.run(BrowserPool._instance.close_all())
             BrowserPool._instance = None
-            BrowserPool._lock = asyncio.Lock()
             logger.debug("[run] BrowserPool closed and reset")
     except Exception as e:
         logger.warning(f"[run] BrowserPool cleanup warning: {e}")
@@ -253,7 +252,6 @@ def run(
             logger.debug("[run] Closing any remaining BrowserPool before pipeline")
             asyncio.run(BrowserPool._instance.close_all())
             BrowserPool._instance = None
-            BrowserPool._lock = asyncio.Lock()
             logger.debug("[run] BrowserPool closed before pipeline")
     except Exception as e:
         logger.warning(f"[run] BrowserPool pre-pipeline cleanup warning: {e}")
@@ -343,7 +341,6 @@ def run(
             if BrowserPool._instance is not None:
                 logger.warning("[run] BrowserPool instance still exists, resetting")
                 BrowserPool._instance = None
-                BrowserPool._lock = asyncio.Lock()
         except Exception as e:
             logger.warning(f"[run] BrowserPool check warning: {e}")
 
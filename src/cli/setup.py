@@ -89,10 +89,9 @@ def setup(
     console.print("[green]✓ Playwright browser installed[/green]\n")
 
     # Load settings
-    settings = get_settings()
-
     # Setup always uses headed mode for user login interaction
-    settings.gateway_headless = False
+    # (copy so the shared settings instance is not modified)
+    settings = get_settings().model_copy(update={"gateway_headless": False})
 
     # Import asyncio here to avoid issues with tests
     import asyncio
@@ -5,15 +5,30 @@ Provides environment-specific logging configurations with structlog,
 supporting development, testing, and production profiles with file rotation.
 """
 
+import json
 import logging
+import logging.handlers
+import os
+import re
 import sys
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from datetime import UTC, datetime
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import structlog
 from structlog.types import Processor
 
+try:
+    import orjson
+except ImportError:  # Optional: JSON logs fall back to the stdlib encoder
+    orjson = None
+
 
 class LogEnvironment(StrEnum):
     """Logging environment types."""
@@ -127,28 +142,319 @@ def parse_log_level(level_str: str) -> int:
     return LOG_LEVEL_MAP[normalized]
 
 
-def _redact_secrets(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
-    """Redact sensitive information from logs."""
-    sensitive_keywords = (
-        "key", "token", "secret", "password", "passwd",
-        "cookie", "auth", "authorization", "session",
+# Structlog method names mapped to their logging level
+_METHOD_TO_LEVEL: dict[str, int] = {
+    **LOG_LEVEL_MAP,
+    "warn": logging.WARNING,
+    "exception": logging.ERROR,
+    "fatal": logging.CRITICAL,
+}
+
+# Effective level captured by configure_logging; refreshed on every reconfigure
+_EFFECTIVE_LEVEL: int = logging.NOTSET
+
+# Signature, processor chain and handlers installed by the last configure_logging
+_last_config: tuple[tuple[Any, ...], list[Processor], tuple[logging.Handler, ...]] | None = None
+
+
+def _level_filter(_: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """
+    Drop records below the configured level before any other processor runs.
+
+    Without this, disabled debug/info calls still pay for timestamping and
+    redaction before the stdlib logger discards them.
+    """
+    if _METHOD_TO_LEVEL.get(method_name, _EFFECTIVE_LEVEL) < _EFFECTIVE_LEVEL:
+        raise structlog.DropEvent
+    return event_dict
+
+
+# Last (millisecond, formatted timestamp) pair produced by _cached_iso_timestamp
+_last_timestamp: tuple[int, str] = (0, "")
+
+
+def _cached_iso_timestamp(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """
+    Add an ISO-8601 UTC timestamp, reusing the formatted string within a millisecond.
+
+    Replaces ``TimeStamper(fmt="iso")``, which builds and formats a new
+    datetime for every record.
+    """
+    global _last_timestamp
+    ms = time.time_ns() // 1_000_000
+    last_ms, last_str = _last_timestamp
+    if ms != last_ms:
+        seconds, millis = divmod(ms, 1000)
+        last_str = (
+            datetime.fromtimestamp(seconds, tz=UTC)
+            .replace(microsecond=millis * 1000)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z")
+        )
+        _last_timestamp = (ms, last_str)
+    event_dict["timestamp"] = last_str
+    return event_dict
+
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _render_exc_and_stack_info(
+    logger: Any, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Render stack and exception info only for records that carry them.
+
+    Equivalent to StackInfoRenderer + format_exc_info, without dispatching
+    to either processor for ordinary records.
+    """
+    if "stack_info" in event_dict:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+    if "exc_info" in event_dict:
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+# Key fragments whose values are masked in log output
+_SENSITIVE_KEYWORDS = (
+    "key", "token", "secret", "password", "passwd",
+    "cookie", "auth", "authorization", "session",
+)
+
+# One compiled alternation scans the key once for every keyword. Keywords
+# containing another keyword ("authorization" contains "auth") cannot
+# change the outcome, so they are left out of the pattern.
+_SENSITIVE_RE = re.compile(
+    "|".join(
+        keyword
+        for keyword in _SENSITIVE_KEYWORDS
+        if not any(other != keyword and other in keyword for other in _SENSITIVE_KEYWORDS)
     )
+)
+
 
-    def redact_value(value: Any, key_hint: str | None = None) -> Any:
-        if isinstance(value, dict):
-            return {k: redact_value(v, k) for k, v in value.items()}
-        if isinstance(value, list):
-            return [redact_value(item, key_hint) for item in value]
-        if isinstance(value, tuple):
-            return tuple(redact_value(item, key_hint) for item in value)
-        if isinstance(value, str) and key_hint:
-            if any(keyword in key_hint.lower() for keyword in sensitive_keywords):
-                if len(value) <= 8:
-                    return "***"
-                return f"{value[:4]}...{value[-4:]}"
-        return value
+@lru_cache(maxsize=1024)
+def is_sensitive_key(key: str) -> bool:
+    """
+    Check if a key name contains a sensitive keyword.
+
+    Log records reuse a small set of key names, so the result is memoized
+    per key instead of rescanning every keyword for every string value.
+    """
+    return _SENSITIVE_RE.search(key.lower()) is not None
 
-    return {k: redact_value(v, k) for k, v in event_dict.items()}
+
+# Stands in for a container found inside itself while redacting
+CYCLE_PLACEHOLDER = "<cycle>"
+
+
+def _mask_sensitive(value: str, key_hint: Any) -> str:
+    """Mask a string value if its key looks sensitive."""
+    if isinstance(key_hint, str) and is_sensitive_key(key_hint):
+        if len(value) <= 8:
+            return "***"
+        return f"{value[:4]}...{value[-4:]}"
+    return value
+
+
+def _redact_secrets(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """
+    Redact sensitive information from logs.
+
+    Walks nested dicts, lists and tuples with an explicit work stack rather
+    than recursion: leaves are handled inline and only nested containers
+    are pushed. Containers are copied; key order is preserved. A container
+    found inside itself is replaced by CYCLE_PLACEHOLDER.
+    """
+    out: dict[str, Any] = {}
+    # (source container, destination copy, key hint for list/tuple items)
+    stack: list[tuple[Any, Any, Any]] = [(event_dict, out, None)]
+    # (parent, slot) pairs whose list copies must become tuples, innermost last
+    tuples: list[tuple[Any, Any]] = []
+    # ids of the containers on the current path; an entry with no source
+    # marks the point where the container named by its hint is left again
+    active: set[int] = set()
+
+    while stack:
+        source, dest, key_hint = stack.pop()
+        if source is None:
+            active.discard(key_hint)
+            continue
+        active.add(id(source))
+        stack.append((None, None, id(source)))
+        if isinstance(source, dict):
+            items = source.items()
+        else:
+            items = enumerate(source)
+            dest.extend(source)
+
+        for slot, value in items:
+            hint = slot if dest.__class__ is dict else key_hint
+            if isinstance(value, str):
+                dest[slot] = _mask_sensitive(value, hint)
+            elif isinstance(value, dict | list | tuple) and id(value) in active:
+                dest[slot] = CYCLE_PLACEHOLDER
+            elif isinstance(value, dict):
+                copied: Any = {}
+                dest[slot] = copied
+                stack.append((value, copied, hint))
+            elif isinstance(value, list | tuple):
+                copied = []
+                dest[slot] = copied
+                stack.append((value, copied, hint))
+                if isinstance(value, tuple):
+                    tuples.append((dest, slot))
+            elif dest.__class__ is dict:
+                dest[slot] = value
+
+    # Freeze innermost tuples first so parents capture the final objects
+    for parent, slot in reversed(tuples):
+        parent[slot] = tuple(parent[slot])
+
+    return out
+
+
+# Minimum write buffer for file logging; rounded up to the filesystem block size
+_MIN_LOG_BUFFER_SIZE = 64 * 1024
+# Interval (seconds) at which buffered log files are flushed in the background
+_LOG_FLUSH_INTERVAL = 0.1
+
+
+def _block_aligned_buffer_size(directory: Path, minimum: int = _MIN_LOG_BUFFER_SIZE) -> int:
+    """
+    Pick a write buffer size aligned to the filesystem's optimal block size.
+
+    Args:
+        directory: Directory the log file lives in
+        minimum: Smallest acceptable buffer size in bytes
+
+    Returns:
+        Buffer size in bytes, a multiple of the block size when it is known
+    """
+    try:
+        block_size = os.statvfs(directory).f_bsize
+    except (AttributeError, OSError):
+        # os.statvfs is unavailable on Windows
+        return minimum
+    if block_size <= 0:
+        return minimum
+    return -(-minimum // block_size) * block_size
+
+
+class _BackgroundFlusher:
+    """Single daemon thread that periodically flushes buffered log handlers."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._handlers: weakref.WeakSet[BufferedRotatingFileHandler] = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def register(self, handler: "BufferedRotatingFileHandler") -> None:
+        """Track a handler and make sure the flush thread is running."""
+        with self._lock:
+            self._handlers.add(handler)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="aigenflow-log-flusher",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def unregister(self, handler: "BufferedRotatingFileHandler") -> None:
+        """Stop tracking a handler."""
+        with self._lock:
+            self._handlers.discard(handler)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            with self._lock:
+                handlers = list(self._handlers)
+            for handler in handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    # Never let a failing handler kill the flusher thread
+                    pass
+
+
+_flusher = _BackgroundFlusher(_LOG_FLUSH_INTERVAL)
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that batches writes in a block-sized buffer.
+
+    The stdlib handler flushes after every record, turning each log line
+    into its own write syscall. This handler keeps records in the file
+    buffer and flushes only when:
+
+    - a record at or above ``flush_level`` is emitted,
+    - the background flusher runs (every ``_LOG_FLUSH_INTERVAL`` seconds),
+    - the file is rotated or the handler is closed (``logging.shutdown``
+      closes all handlers at interpreter exit).
+
+    The current file size is tracked in-process so the rollover check does
+    not have to seek/tell (which would force a flush) on every record.
+    """
+
+    def __init__(
+        self,
+        filename: str | Path,
+        maxBytes: int = 0,  # noqa: N803 - mirrors RotatingFileHandler
+        backupCount: int = 0,  # noqa: N803 - mirrors RotatingFileHandler
+        encoding: str | None = None,
+        flush_level: int = logging.ERROR,
+    ) -> None:
+        self.flush_level = flush_level
+        self._bytes_written = 0
+        super().__init__(
+            filename=filename,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+        )
+        _flusher.register(self)
+
+    def _open(self) -> Any:
+        """Open the log file with a block-aligned write buffer."""
+        buffer_size = _block_aligned_buffer_size(Path(self.baseFilename).parent)
+        stream = open(  # noqa: SIM115 - lifetime managed by the handler
+            self.baseFilename,
+            self.mode,
+            buffering=buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record to the buffer, rotating and flushing as needed."""
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or "utf-8", errors="replace"))
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += size
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Flush pending records and stop background flushing."""
+        _flusher.unregister(self)
+        super().close()
 
 
 def _add_file_handler(
@@ -166,13 +472,11 @@ def _add_file_handler(
         level: Logging level
         json_output: Whether to output JSON logs
     """
-    import logging.handlers
-
     # Ensure log directory exists
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create rotating file handler (max 10MB, keep 5 files)
-    file_handler = logging.handlers.RotatingFileHandler(
+    # Create buffered rotating file handler (max 10MB, keep 5 files)
+    file_handler = BufferedRotatingFileHandler(
         filename=log_file,
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5,
@@ -195,6 +499,45 @@ def _add_file_handler(
     stdlib_logger.setLevel(level)
 
 
+def _orjson_dumps(obj: Any, default: Any = None, **kw: Any) -> str:
+    """
+    Encode a log event with orjson, returning str for stdlib handlers.
+
+    Events orjson rejects (e.g. integers beyond 64 bits) are encoded with
+    json.dumps instead, so a log call never fails on the faster encoder.
+    """
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, default=default, **kw)
+
+
+def build_json_renderer() -> Processor:
+    """Return a JSONRenderer that uses orjson when it is installed."""
+    if orjson is None:
+        return structlog.processors.JSONRenderer()
+    return structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+
+
+# Processor chains shared by every configure_logging call
+_BASE_PROCESSORS: tuple[Processor, ...] = (
+    _level_filter,
+    structlog.stdlib.add_log_level,
+    _cached_iso_timestamp,
+    _render_exc_and_stack_info,
+    structlog.processors.UnicodeDecoder(),
+    _redact_secrets,
+)
+_JSON_PROCESSORS: tuple[Processor, ...] = (
+    *_BASE_PROCESSORS,
+    build_json_renderer(),
+)
+_CONSOLE_PROCESSORS: tuple[Processor, ...] = (
+    *_BASE_PROCESSORS,
+    structlog.dev.ConsoleRenderer(colors=True),
+)
+
+
 def get_logging_profile(
     environment: LogEnvironment = LogEnvironment.PRODUCTION,
     log_dir: Path | None = None,
@@ -239,24 +582,44 @@ def get_logging_profile(
     return profiles.get(environment, profiles[LogEnvironment.PRODUCTION])
 
 
+# Called after every reconfiguration, so modules can drop loggers they cached
+_RECONFIGURE_HOOKS: list[Callable[[], None]] = []
+
+
+def register_reconfigure_hook(hook: Callable[[], None]) -> None:
+    """
+    Call ``hook`` each time configure_logging() reconfigures logging.
+
+    Args:
+        hook: Callback taking no arguments, e.g. a logger cache's clear
+    """
+    _RECONFIGURE_HOOKS.append(hook)
+
+
 def configure_logging(
     environment: LogEnvironment = LogEnvironment.PRODUCTION,
     log_level: str | int | None = None,
     log_dir: Path | None = None,
     json_output: bool | None = None,
+    force: bool = False,
 ) -> structlog.stdlib.BoundLogger:
     """
     Configure logging for the specified environment.
 
+    Repeating a call with the same settings is a no-op unless ``force`` is
+    set or the structlog/handler setup was changed in between.
+
     Args:
         environment: Log environment (development, testing, production)
         log_level: Override log level (string or int)
         log_dir: Directory for log files
         json_output: Override JSON output setting
+        force: Reconfigure even if the settings are unchanged
 
     Returns:
         Configured structlog logger instance
     """
+    global _last_config
     profile = get_logging_profile(environment, log_dir)
 
     # Allow override of log level
@@ -271,21 +634,25 @@ def configure_logging(
     # Determine JSON output
     use_json = json_output if json_output is not None else profile.use_json
 
-    # Build processors
-    processors: list[Processor] = [
-        structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        _redact_secrets,
-    ]
-
-    # Add output processor
-    if use_json:
-        processors.append(structlog.processors.JSONRenderer())
-    else:
-        processors.append(structlog.dev.ConsoleRenderer(colors=True))
+    # Skip reconfiguration when nothing changed since the last call
+    stdlib_logger = logging.getLogger("aigenflow")
+    signature = (environment, level, profile.log_file_path, use_json, sys.stdout)
+    if not force and _last_config is not None:
+        last_signature, last_processors, last_handlers = _last_config
+        if (
+            last_signature == signature
+            and structlog.get_config()["processors"] is last_processors
+            and tuple(stdlib_logger.handlers) == last_handlers
+            and stdlib_logger.level == level
+        ):
+            return structlog.get_logger("aigenflow")
+
+    # Capture effective level for the short-circuit filter
+    global _EFFECTIVE_LEVEL
+    _EFFECTIVE_LEVEL = level
+
+    # Use the prebuilt processor chain for the output format
+    processors: list[Processor] = list(_JSON_PROCESSORS if use_json else _CONSOLE_PROCESSORS)
 
     # Configure structlog
     structlog.configure(
@@ -296,12 +663,17 @@ def configure_logging(
         wrapper_class=structlog.stdlib.BoundLogger,
     )
 
+    # Cached loggers are bound to the previous configuration
+    for hook in _RECONFIGURE_HOOKS:
+        hook()
+
     # Get logger
     logger = structlog.get_logger("aigenflow")
 
-    # Reset any existing handlers
-    stdlib_logger = logging.getLogger("aigenflow")
-    stdlib_logger.handlers.clear()
+    # Reset any existing handlers, closing them so buffered output is flushed
+    for handler in stdlib_logger.handlers[:]:
+        stdlib_logger.removeHandler(handler)
+        handler.close()
     stdlib_logger.propagate = False
     stdlib_logger.setLevel(level)
 
@@ -320,4 +692,5 @@ def configure_logging(
             use_json,
         )
 
+    _last_config = (signature, processors, tuple(stdlib_logger.handlers))
     return logger
@@ -6,9 +6,16 @@ preserving key decisions, data points, and citation sources.
 """
 
 import asyncio
-from dataclasses import dataclass, field
+import hashlib
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 
@@ -16,10 +23,47 @@ from agents.router import AgentRouter, PhaseTask
 from core.logger import get_logger
 from core.models import AgentType, DocumentType, PhaseResult
 
+if TYPE_CHECKING:
+    from context.tokenizer import TokenCounter, TokenCountResult
+
 logger = get_logger(__name__)
 
+# Phase statuses whose results are carried forward as context
+_CONTEXT_STATUSES = frozenset({"completed", "skipped"})
+# Separator written after each phase block (includes the line break before the next block)
+_SECTION_SEP = "\n" + "-" * 50 + "\n\n"
+# Maximum characters of each AI response included in the summarization input
+_CONTENT_PREVIEW_CHARS = 500
+# Marker appended to AI responses cut at _CONTENT_PREVIEW_CHARS
+_TRUNC_SUFFIX = "\n...(truncated for summary input)"
+# Contexts shorter than this are estimated (~4 chars/token) instead of tokenized
+_MIN_TOKENIZE_CHARS = 500
+
+
+@lru_cache(maxsize=32)
+def _summary_prompt_pieces(template: str, target_ratio: float) -> tuple[str, ...]:
+    """
+    Format a summary prompt template around its context slot.
+
+    Args:
+        template: Prompt template with {target_ratio} and {context} fields
+        target_ratio: Target reduction ratio
+
+    Returns:
+        Template pieces to be joined with the context
+    """
+    return tuple(template.format(target_ratio=target_ratio, context="\0").split("\0"))
+
+
+@lru_cache(maxsize=1)
+def _get_token_counter() -> "TokenCounter":
+    """Return the shared TokenCounter so the tokenizer is only loaded once."""
+    from context.tokenizer import TokenCounter
 
-@dataclass
+    return TokenCounter()
+
+
+@dataclass(slots=True)
 class SummaryResult:
     """
     Result of context summarization operation.
@@ -33,6 +77,8 @@ class SummaryResult:
         timestamp: When summarization occurred
         success: Whether summarization succeeded
         error: Error message if failed
+        original_length: Length of the original text; kept when the text
+            itself is dropped from stored summaries
     """
 
     original_text: str
@@ -43,11 +89,16 @@ class SummaryResult:
     timestamp: datetime = field(default_factory=datetime.now)
     success: bool = True
     error: str | None = None
+    original_length: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.original_length is None:
+            self.original_length = len(self.original_text)
 
     def get_summary_dict(self) -> dict[str, Any]:
         """Convert summary result to dictionary for serialization."""
         return {
-            "original_length": len(self.original_text),
+            "original_length": self.original_length,
             "summary_length": len(self.summarized_text),
             "tokens_original": self.tokens_original,
             "tokens_summary": self.tokens_summary,
@@ -68,6 +119,13 @@ class SummaryConfig(BaseModel):
         agent_type: Which AI agent to use for summarization
         max_retries: Number of retry attempts on failure
         preserve_sections: List of section names to preserve verbatim
+        shard_token_limit: Approximate token size of each context shard; larger
+            contexts are split by phase and summarized concurrently
+        retry_base_delay: Initial retry delay in seconds (doubles per attempt)
+        retry_max_delay: Upper bound on the retry delay in seconds
+        summary_cache_ttl: Seconds a summary is reused for an identical context
+        max_stored_summaries: Maximum number of summaries kept in memory;
+            the least recently used are evicted beyond it
     """
 
     enabled: bool = True
@@ -77,6 +135,11 @@ class SummaryConfig(BaseModel):
     preserve_sections: list[str] = field(
         default_factory=lambda: ["key_decisions", "data_points", "citations"]
     )
+    shard_token_limit: int = 4000
+    retry_base_delay: float = 0.1
+    retry_max_delay: float = 8.0
+    summary_cache_ttl: float = 3600.0
+    max_stored_summaries: int = 64
 
 
 class ContextSummary:
@@ -123,7 +186,21 @@ Provide a concise summary that captures the essential information."""
         """
         self.agent_router = agent_router
         self.config = config or SummaryConfig()
-        self._summaries: dict[int, SummaryResult] = {}
+        # Stored summaries in LRU order, capped at _max_summaries
+        self._summaries: OrderedDict[int, SummaryResult] = OrderedDict()
+        self._max_summaries = self.config.max_stored_summaries
+        # (stored_at, summary) keyed by context digest, so an unchanged context
+        # is not re-sent within summary_cache_ttl
+        self._context_hash_to_summary: OrderedDict[bytes, tuple[float, SummaryResult]] = (
+            OrderedDict()
+        )
+        # Last built context: (fingerprint, context, previous_results).
+        # Holding the results keeps their ids stable for the fingerprint.
+        self._context_cache: tuple[tuple[Any, ...], str, list[PhaseResult]] | None = None
+        # Token count of the last counted context: (context, result)
+        self._token_cache: tuple[str, TokenCountResult] | None = None
+        # Background summarization tasks, referenced until they finish
+        self._pending_tasks: set[asyncio.Task[SummaryResult]] = set()
 
     def _build_summary_prompt(
         self,
@@ -141,10 +218,7 @@ Provide a concise summary that captures the essential information."""
             Formatted prompt string
         """
         target_ratio = self.config.target_reduction_ratio
-        return self.DEFAULT_SUMMARY_PROMPT.format(
-            target_ratio=target_ratio,
-            context=context,
-        )
+        return context.join(_summary_prompt_pieces(self.DEFAULT_SUMMARY_PROMPT, target_ratio))
 
     def _extract_context_from_results(self, results: list[PhaseResult]) -> str:
         """
@@ -156,40 +230,228 @@ Provide a concise summary that captures the essential information."""
         Returns:
             Formatted context string
         """
-        sections = []
+        parts: list[str] = []
+        append = parts.append
 
         for result in results:
-            if result.status.value not in ["completed", "skipped"]:
+            status = result.status.value
+            if status not in _CONTEXT_STATUSES:
                 continue
 
             # Add phase summary
-            sections.append(f"## Phase {result.phase_number}: {result.phase_name}")
-            sections.append(f"Status: {result.status.value}")
+            append(f"## Phase {result.phase_number}: {result.phase_name}\nStatus: {status}\n")
 
             # Add AI response summaries
-            if result.ai_responses:
-                for idx, response in enumerate(result.ai_responses):
-                    sections.append(
-                        f"\nTask {idx + 1} ({response.agent_name.value}): {response.task_name}"
-                    )
-                    # Include key content (limit to prevent double summarization)
-                    content_preview = response.content[:500]
-                    if len(response.content) > 500:
-                        content_preview += "\n...(truncated for summary input)"
-                    sections.append(content_preview)
+            for idx, response in enumerate(result.ai_responses, start=1):
+                append(f"\nTask {idx} ({response.agent_name.value}): {response.task_name}\n")
+                # Include key content (limit to prevent double summarization)
+                content = response.content
+                if len(content) > _CONTENT_PREVIEW_CHARS:
+                    append(content[:_CONTENT_PREVIEW_CHARS])
+                    append(_TRUNC_SUFFIX)
+                else:
+                    append(content)
+                append("\n")
 
             # Add phase summary if available
             if result.summary:
-                sections.append(f"\nPhase Summary:\n{result.summary}")
+                append(f"\nPhase Summary:\n{result.summary}\n")
+
+            append(_SECTION_SEP)
+
+        if parts:
+            # Drop the line break following the final separator
+            parts[-1] = _SECTION_SEP[:-1]
+        return "".join(parts)
+
+    def _get_or_build_context(
+        self,
+        session_results: list[PhaseResult],
+        current_phase: int,
+    ) -> tuple[list[PhaseResult], str]:
+        """
+        Get results before the current phase and their formatted context.
+
+        The context is rebuilt only when the previous results change, so
+        should_summarize_before_phase followed by summarize_phase_context
+        extracts it once.
+
+        Args:
+            session_results: List of phase results from current session
+            current_phase: Current phase number
+
+        Returns:
+            Tuple of (previous_results, context)
+        """
+        previous_results = [r for r in session_results if r.phase_number < current_phase]
+        fingerprint = tuple(
+            (id(r), r.status, len(r.ai_responses), r.summary) for r in previous_results
+        )
+
+        cached = self._context_cache
+        if cached is not None and cached[0] == fingerprint:
+            return previous_results, cached[1]
+
+        context = self._extract_context_from_results(previous_results)
+        self._context_cache = (fingerprint, context, previous_results)
+        return previous_results, context
+
+    def _count_context_tokens(self, context: str) -> "TokenCountResult":
+        """
+        Count tokens in context, reusing the count for the last context seen.
+
+        Args:
+            context: Context text to count
+
+        Returns:
+            TokenCountResult for the context
+        """
+        cached = self._token_cache
+        if cached is not None and cached[0] == context:
+            return cached[1]
+
+        result = _get_token_counter().count(
+            context,
+            model_name="claude",
+            estimate_only=len(context) < _MIN_TOKENIZE_CHARS,
+        )
+        self._token_cache = (context, result)
+        return result
+
+    def count_context_tokens(
+        self,
+        session_results: list[PhaseResult],
+        current_phase: int,
+    ) -> "TokenCountResult":
+        """
+        Count tokens in the context accumulated before a phase.
+
+        Reuses the context and count computed by should_summarize_before_phase
+        when the results have not changed.
+
+        Args:
+            session_results: List of phase results from current session
+            current_phase: Current phase number
+
+        Returns:
+            TokenCountResult for the previous-phase context
+        """
+        _, context = self._get_or_build_context(session_results, current_phase)
+        return self._count_context_tokens(context)
+
+    def _split_into_shards(self, results: list[PhaseResult]) -> list[str]:
+        """
+        Group phase contexts into shards of roughly shard_token_limit tokens.
+
+        A single phase larger than the limit becomes its own shard.
+
+        Args:
+            results: List of PhaseResult objects
+
+        Returns:
+            List of shard context strings
+        """
+        limit = self.config.shard_token_limit
+        token_counter = _get_token_counter()
+        shards: list[str] = []
+        blocks: list[str] = []
+        shard_tokens = 0
+
+        for result in results:
+            block = self._extract_context_from_results([result])
+            if not block:
+                continue
+            tokens = token_counter.count(block, model_name="claude").total_tokens
+            if blocks and shard_tokens + tokens > limit:
+                shards.append("\n".join(blocks))
+                blocks = []
+                shard_tokens = 0
+            blocks.append(block)
+            shard_tokens += tokens
+
+        if blocks:
+            shards.append("\n".join(blocks))
+        return shards
+
+    async def _summarize_shards(
+        self,
+        shards: list[str],
+        phase_number: int,
+        original_tokens: int,
+    ) -> tuple[str, int]:
+        """
+        Summarize context shards concurrently and reduce the partial summaries.
+
+        Shards whose summarization fails keep their original text so no
+        context is lost. If the combined summaries still exceed the target
+        size, a second summarization pass reduces them.
+
+        Args:
+            shards: Context shards to summarize
+            phase_number: Current phase number
+            original_tokens: Token count of the full context
+
+        Returns:
+            Tuple of (summary_text, summary_tokens)
+
+        Raises:
+            Exception: If every shard fails to summarize
+        """
+        logger.info(
+            f"Summarizing context for Phase {phase_number} in {len(shards)} concurrent shards"
+        )
+        outcomes = await asyncio.gather(
+            *(self._summarize_with_agent(shard, phase_number) for shard in shards),
+            return_exceptions=True,
+        )
+
+        parts: list[str] = []
+        failures = 0
+        for idx, (shard, outcome) in enumerate(zip(shards, outcomes, strict=True)):
+            if isinstance(outcome, BaseException):
+                failures += 1
+                logger.warning(f"Shard {idx + 1}/{len(shards)} summarization failed: {outcome}")
+                parts.append(shard)
+            else:
+                parts.append(outcome[0])
+
+        if failures == len(shards):
+            raise Exception(f"Summarization failed for all {len(shards)} context shards")
+
+        combined = "\n\n".join(parts)
+        combined_result = await asyncio.to_thread(
+            _get_token_counter().count, combined, "claude"
+        )
+        combined_tokens = combined_result.total_tokens
+
+        target_tokens = original_tokens * self.config.target_reduction_ratio
+        if combined_tokens > target_tokens:
+            # Reduce step: summarize the concatenated shard summaries
+            summary_text, _, summary_tokens = await self._summarize_with_agent(
+                combined, phase_number
+            )
+            return summary_text, summary_tokens
+
+        return combined, combined_tokens
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with jitter for summarization retries.
 
-            sections.append("\n" + "-" * 50 + "\n")
+        Args:
+            attempt: Zero-based index of the attempt that just failed
 
-        return "\n".join(sections)
+        Returns:
+            Delay in seconds before the next attempt
+        """
+        base = self.config.retry_base_delay
+        return min(self.config.retry_max_delay, base * (2**attempt)) + random.random() * base
 
     async def _summarize_with_agent(
         self,
         context: str,
         phase_number: int,
+        original_tokens: int | None = None,
     ) -> tuple[str, int, int]:
         """
         Perform summarization using AI agent.
@@ -197,6 +459,7 @@ Provide a concise summary that captures the essential information."""
         Args:
             context: Context to summarize
             phase_number: Current phase number
+            original_tokens: Token count of context if already known
 
         Returns:
             Tuple of (summary_text, original_tokens, summary_tokens)
@@ -204,12 +467,14 @@ Provide a concise summary that captures the essential information."""
         Raises:
             Exception: If summarization fails after retries
         """
-        from context.tokenizer import TokenCounter
-
-        # Count original tokens
-        token_counter = TokenCounter()
-        original_result = token_counter.count(context, model_name="claude")
-        original_tokens = original_result.total_tokens
+        # Count original tokens unless the caller already did; the count runs
+        # in a worker thread while the agent call is in flight
+        token_counter = _get_token_counter()
+        count_task: asyncio.Task[TokenCountResult] | None = None
+        if original_tokens is None:
+            count_task = asyncio.create_task(
+                asyncio.to_thread(self._count_context_tokens, context)
+            )
 
         # Build summary prompt
         prompt = self._build_summary_prompt(context, phase_number)
@@ -220,45 +485,53 @@ Provide a concise summary that captures the essential information."""
 
         logger.info(
             f"Starting context summarization for Phase {phase_number}: "
-            f"{original_tokens} tokens -> target {self.config.target_reduction_ratio:.0%} reduction"
+            f"{len(context)} chars -> target {self.config.target_reduction_ratio:.0%} reduction"
         )
 
         # Execute with retry logic
         last_error = None
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                # Use the agent router to execute summarization
-                response = await self.agent_router.execute(
-                    phase=phase_number,
-                    task=summary_task,
-                    prompt=prompt,
-                    doc_type=DocumentType.BIZPLAN,
-                )
+        try:
+            for attempt in range(self.config.max_retries + 1):
+                try:
+                    # Use the agent router to execute summarization
+                    response = await self.agent_router.execute(
+                        phase=phase_number,
+                        task=summary_task,
+                        prompt=prompt,
+                        doc_type=DocumentType.BIZPLAN,
+                    )
 
-                if not response.success:
-                    raise Exception(f"Agent execution failed: {response.error}")
+                    if not response.success:
+                        raise Exception(f"Agent execution failed: {response.error}")
 
-                summary_text = response.content.strip()
+                    summary_text = response.content.strip()
 
-                # Count summary tokens
-                summary_result = token_counter.count(summary_text, model_name="claude")
-                summary_tokens = summary_result.total_tokens
+                    # Count summary tokens
+                    summary_result = await asyncio.to_thread(
+                        token_counter.count, summary_text, "claude"
+                    )
+                    summary_tokens = summary_result.total_tokens
+                    if count_task is not None:
+                        original_tokens = (await count_task).total_tokens
 
-                logger.info(
-                    f"Summarization completed: {original_tokens} -> {summary_tokens} tokens "
-                    f"({summary_tokens / original_tokens:.1%} of original)"
-                )
+                    logger.info(
+                        f"Summarization completed: {original_tokens} -> {summary_tokens} tokens "
+                        f"({summary_tokens / original_tokens:.1%} of original)"
+                    )
 
-                return summary_text, original_tokens, summary_tokens
+                    return summary_text, original_tokens, summary_tokens
 
-            except Exception as exc:
-                last_error = exc
-                logger.warning(
-                    f"Summarization attempt {attempt + 1}/{self.config.max_retries + 1} failed: {exc}"
-                )
-                if attempt < self.config.max_retries:
-                    await asyncio.sleep(1)  # Brief delay before retry
-                continue
+                except Exception as exc:
+                    last_error = exc
+                    logger.warning(
+                        f"Summarization attempt {attempt + 1}/{self.config.max_retries + 1} failed: {exc}"
+                    )
+                    if attempt < self.config.max_retries:
+                        await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+        finally:
+            if count_task is not None and not count_task.done():
+                count_task.cancel()
 
         # All retries exhausted
         raise Exception(f"Summarization failed after {self.config.max_retries + 1} attempts: {last_error}")
@@ -291,8 +564,10 @@ Provide a concise summary that captures the essential information."""
             )
 
         try:
-            # Filter results from phases before current phase
-            previous_results = [r for r in session_results if r.phase_number < current_phase]
+            # Filter results from phases before current phase and extract context
+            previous_results, context = self._get_or_build_context(
+                session_results, current_phase
+            )
 
             if not previous_results:
                 logger.debug(f"No previous phases to summarize before Phase {current_phase}")
@@ -305,9 +580,6 @@ Provide a concise summary that captures the essential information."""
                     success=True,
                 )
 
-            # Extract context from results
-            context = self._extract_context_from_results(previous_results)
-
             if not context or len(context.strip()) < 100:
                 logger.debug("Insufficient context to summarize")
                 return SummaryResult(
@@ -319,10 +591,35 @@ Provide a concise summary that captures the essential information."""
                     success=True,
                 )
 
-            # Perform summarization
-            summary_text, original_tokens, summary_tokens = await self._summarize_with_agent(
-                context, current_phase
-            )
+            # Reuse the summary of an identical, already summarized context
+            context_hash = hashlib.blake2b(context.encode("utf-8"), digest_size=16).digest()
+            entry = self._context_hash_to_summary.get(context_hash)
+            if entry is not None:
+                stored_at, cached = entry
+                if time.monotonic() - stored_at < self.config.summary_cache_ttl:
+                    logger.debug(f"Reusing summary of identical context for Phase {current_phase}")
+                    self._context_hash_to_summary.move_to_end(context_hash)
+                    self._store_summary(current_phase, cached)
+                    return replace(cached, original_text=context)
+                del self._context_hash_to_summary[context_hash]
+
+            # Perform summarization, fanning out over shards for large contexts.
+            # The shard decision uses the character estimate so that, for a
+            # single shard, exact counting overlaps the agent call.
+            shards = [context]
+            if len(context) // _get_token_counter().CHARS_PER_TOKEN > self.config.shard_token_limit:
+                shards = await asyncio.to_thread(self._split_into_shards, previous_results)
+            if len(shards) > 1:
+                # Tokenization is CPU-bound; keep it off the event loop
+                original_result = await asyncio.to_thread(self._count_context_tokens, context)
+                original_tokens = original_result.total_tokens
+                summary_text, summary_tokens = await self._summarize_shards(
+                    shards, current_phase, original_tokens
+                )
+            else:
+                summary_text, original_tokens, summary_tokens = await self._summarize_with_agent(
+                    context, current_phase
+                )
 
             # Calculate reduction ratio
             reduction_ratio = 1.0 - (summary_tokens / original_tokens) if original_tokens > 0 else 0.0
@@ -337,7 +634,13 @@ Provide a concise summary that captures the essential information."""
             )
 
             # Store summary for later retrieval
-            self._summaries[current_phase] = result
+            self._store_summary(current_phase, result)
+            self._context_hash_to_summary[context_hash] = (
+                time.monotonic(),
+                self._summaries[current_phase],
+            )
+            while len(self._context_hash_to_summary) > self._max_summaries:
+                self._context_hash_to_summary.popitem(last=False)
 
             return result
 
@@ -354,6 +657,104 @@ Provide a concise summary that captures the essential information."""
                 error=str(exc),
             )
 
+    async def summarize_all_phases(
+        self,
+        session_results: list[PhaseResult],
+        max_concurrency: int = 4,
+    ) -> dict[int, SummaryResult]:
+        """
+        Summarize the context up to every phase concurrently.
+
+        For each phase result, the phases up to and including it are
+        summarized as the context for the phase that follows. Agent calls
+        run concurrently, bounded by max_concurrency to respect provider
+        rate limits.
+
+        Args:
+            session_results: List of phase results from current session
+            max_concurrency: Maximum number of summarizations in flight
+
+        Returns:
+            Dictionary mapping the following phase number to its SummaryResult
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def summarize_before(phase: int) -> tuple[int, SummaryResult]:
+            async with semaphore:
+                return phase, await self.summarize_phase_context(session_results, phase)
+
+        phases = sorted({result.phase_number + 1 for result in session_results})
+        return dict(await asyncio.gather(*(summarize_before(phase) for phase in phases)))
+
+    def schedule_summarize_phase_context(
+        self,
+        session_results: list[PhaseResult],
+        current_phase: int,
+    ) -> SummaryResult:
+        """
+        Start summarization in the background and return immediately.
+
+        A pending placeholder (success=False, error="pending") is stored for
+        the phase and replaced by the real result when the task completes.
+        Must be called from a running event loop.
+
+        Args:
+            session_results: List of phase results from current session
+            current_phase: Current phase number (phases before this will be summarized)
+
+        Returns:
+            The pending placeholder SummaryResult
+        """
+        placeholder = SummaryResult(
+            original_text="",
+            summarized_text="",
+            tokens_original=0,
+            tokens_summary=0,
+            reduction_ratio=0.0,
+            success=False,
+            error="pending",
+        )
+        self._store_summary(current_phase, placeholder)
+
+        task = asyncio.create_task(
+            self._summarize_in_background(list(session_results), current_phase)
+        )
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return placeholder
+
+    async def _summarize_in_background(
+        self,
+        session_results: list[PhaseResult],
+        current_phase: int,
+    ) -> SummaryResult:
+        """Run summarize_phase_context and store its outcome over the placeholder."""
+        result = await self.summarize_phase_context(session_results, current_phase)
+        self._store_summary(current_phase, result)
+        return result
+
+    async def wait_for_pending_summaries(self) -> None:
+        """Wait until all background summarizations have finished."""
+        if self._pending_tasks:
+            await asyncio.gather(*self._pending_tasks)
+
+    def _store_summary(self, phase: int, result: SummaryResult) -> None:
+        """
+        Store a summary, evicting the least recently used beyond the cap.
+
+        The stored copy drops original_text (often hundreds of KB); its
+        length is kept in original_length.
+
+        Args:
+            phase: Phase number
+            result: Summary to store
+        """
+        summaries = self._summaries
+        summaries[phase] = replace(result, original_text="")
+        summaries.move_to_end(phase)
+        while len(summaries) > self._max_summaries:
+            summaries.popitem(last=False)
+
     def get_summary(self, phase: int) -> SummaryResult | None:
         """
         Retrieve previously generated summary for a phase.
@@ -364,20 +765,30 @@ Provide a concise summary that captures the essential information."""
         Returns:
             SummaryResult if available, None otherwise
         """
-        return self._summaries.get(phase)
+        summary = self._summaries.get(phase)
+        if summary is not None:
+            self._summaries.move_to_end(phase)
+        return summary
 
-    def get_all_summaries(self) -> dict[int, SummaryResult]:
+    def get_all_summaries(self, copy: bool = False) -> Mapping[int, SummaryResult]:
         """
         Get all generated summaries.
 
+        Args:
+            copy: Return an independent mutable dict instead of a read-only view
+
         Returns:
-            Dictionary mapping phase numbers to SummaryResult objects
+            Read-only live view mapping phase numbers to SummaryResult objects,
+            or a dict copy if copy is True
         """
-        return self._summaries.copy()
+        if copy:
+            return dict(self._summaries)
+        return MappingProxyType(self._summaries)
 
     def clear_summaries(self) -> None:
         """Clear all stored summaries."""
         self._summaries.clear()
+        self._context_hash_to_summary.clear()
 
     def should_summarize_before_phase(
         self,
@@ -398,18 +809,44 @@ Provide a concise summary that captures the essential information."""
         Returns:
             True if summarization is recommended
         """
-        from context.tokenizer import TokenCounter
-
-        # Filter results from phases before current phase
-        previous_results = [r for r in session_results if r.phase_number < current_phase]
+        # Filter results from phases before current phase and extract context
+        previous_results, context = self._get_or_build_context(session_results, current_phase)
 
         if not previous_results:
             return False
 
-        # Extract context and count tokens
-        context = self._extract_context_from_results(previous_results)
-        token_counter = TokenCounter()
-        result = token_counter.count(context, model_name=provider)
+        # Count tokens
+        result = self._count_context_tokens(context)
 
         # Check if near limit
         return result.is_near_limit(provider, threshold)
+
+    async def should_summarize_before_phase_async(
+        self,
+        session_results: list[PhaseResult],
+        current_phase: int,
+        provider: str = "claude",
+        threshold: float = 0.8,
+    ) -> bool:
+        """
+        Async variant of should_summarize_before_phase.
+
+        Runs context extraction and tokenization in a worker thread so the
+        event loop stays responsive.
+
+        Args:
+            session_results: List of phase results from current session
+            current_phase: Current phase number
+            provider: AI provider name for token limit
+            threshold: Threshold percentage (default 0.8 = 80%)
+
+        Returns:
+            True if summarization is recommended
+        """
+        return await asyncio.to_thread(
+            self.should_summarize_before_phase,
+            session_results,
+            current_phase,
+            provider,
+            threshold,
+        )
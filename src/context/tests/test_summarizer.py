@@ -8,7 +8,11 @@ Tests ContextSummary functionality including:
 - Token reduction verification
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import copy
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -25,9 +29,9 @@ def mock_agent_router():
     return router
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def summary_config():
-    """Create a summary configuration."""
+    """Create a summary configuration (shared; tests must not mutate it)."""
     return SummaryConfig(
         enabled=True,
         target_reduction_ratio=0.5,
@@ -36,9 +40,9 @@ def summary_config():
     )
 
 
-@pytest.fixture
-def sample_phase_results():
-    """Create sample phase results for testing."""
+@pytest.fixture(scope="module")
+def sample_phase_results_base():
+    """Build the sample phase results once per module."""
     results = []
 
     # Phase 1 result
@@ -84,6 +88,17 @@ def sample_phase_results():
     return results
 
 
+@pytest.fixture
+def sample_phase_results(sample_phase_results_base):
+    """
+    Sample phase results for testing.
+
+    The list is fresh per test but the PhaseResult objects are shared;
+    tests that modify a result must deep-copy first.
+    """
+    return list(sample_phase_results_base)
+
+
 class TestSummaryConfig:
     """Tests for SummaryConfig model."""
 
@@ -214,10 +229,13 @@ class TestContextSummary:
         assert result.tokens_summary > 0
         assert 0.0 <= result.reduction_ratio <= 1.0
 
-        # Verify summary was stored
+        # Verify summary was stored without the original text
         stored_summary = summarizer.get_summary(3)
         assert stored_summary is not None
-        assert stored_summary == result
+        assert stored_summary.summarized_text == result.summarized_text
+        assert stored_summary.tokens_original == result.tokens_original
+        assert stored_summary.original_text == ""
+        assert stored_summary.get_summary_dict() == result.get_summary_dict()
 
     @pytest.mark.asyncio
     async def test_summarize_phase_context_disabled(self, mock_agent_router, sample_phase_results):
@@ -305,6 +323,18 @@ class TestContextSummary:
         assert result.error is None
         assert mock_agent_router.execute.call_count == 2
 
+    def test_retry_delay_backs_off_exponentially(self, mock_agent_router):
+        """Test that retry delays double per attempt, are capped and jittered."""
+        config = SummaryConfig(retry_base_delay=0.1, retry_max_delay=0.5)
+        summarizer = ContextSummary(agent_router=mock_agent_router, config=config)
+
+        with patch("context.summarizer.random.random", return_value=0.0):
+            delays = [summarizer._retry_delay(attempt) for attempt in range(4)]
+        assert delays == pytest.approx([0.1, 0.2, 0.4, 0.5])
+
+        with patch("context.summarizer.random.random", return_value=1.0):
+            assert summarizer._retry_delay(0) == pytest.approx(0.2)
+
     def test_get_summary(self, mock_agent_router):
         """Test retrieving stored summary."""
         summarizer = ContextSummary(agent_router=mock_agent_router)
@@ -354,10 +384,39 @@ class TestContextSummary:
         assert all_summaries[2] == summary1
         assert all_summaries[3] == summary2
 
-        # Verify it's a copy (modifications don't affect original)
-        all_summaries[4] = "test"
+        # Verify the view is read-only
+        with pytest.raises(TypeError):
+            all_summaries[4] = "test"
+
+        # A requested copy is mutable and independent
+        copied = summarizer.get_all_summaries(copy=True)
+        copied[4] = "test"
         assert 4 not in summarizer._summaries
 
+    def test_stored_summaries_are_lru_bounded(self, mock_agent_router):
+        """Test that stored summaries evict the least recently used entry."""
+        summarizer = ContextSummary(
+            agent_router=mock_agent_router,
+            config=SummaryConfig(max_stored_summaries=2),
+        )
+
+        for phase in (1, 2):
+            summarizer._store_summary(phase, SummaryResult("orig", "sum", 10, 5, 0.5))
+        summarizer.get_summary(1)  # Mark phase 1 as recently used
+        summarizer._store_summary(3, SummaryResult("orig", "sum", 10, 5, 0.5))
+
+        assert list(summarizer._summaries) == [1, 3]
+
+    def test_summary_storage_bounded(self, mock_agent_router):
+        """Test that stored summaries are capped at the configured default."""
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        for phase in range(100):
+            summarizer._store_summary(phase, SummaryResult("orig", "sum", 10, 5, 0.5))
+
+        assert len(summarizer._summaries) == 64
+        assert next(iter(summarizer._summaries)) == 36
+
     def test_clear_summaries(self, mock_agent_router):
         """Test clearing all summaries."""
         summarizer = ContextSummary(agent_router=mock_agent_router)
@@ -387,6 +446,22 @@ class TestContextSummary:
         # Result depends on actual token count of sample data
         assert isinstance(should_summarize, bool)
 
+    @pytest.mark.asyncio
+    async def test_should_summarize_before_phase_async(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that the async check matches the synchronous one."""
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        expected = summarizer.should_summarize_before_phase(
+            sample_phase_results, current_phase=3, threshold=0.0
+        )
+        result = await summarizer.should_summarize_before_phase_async(
+            sample_phase_results, current_phase=3, threshold=0.0
+        )
+
+        assert result is expected is True
+
     def test_should_summarize_before_phase_no_results(self, mock_agent_router):
         """Test summarization trigger with no results."""
         summarizer = ContextSummary(agent_router=mock_agent_router)
@@ -400,6 +475,301 @@ class TestContextSummary:
 
         assert should_summarize is False
 
+    @pytest.mark.asyncio
+    async def test_context_extracted_once_for_check_and_summarize(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that the threshold check and summarization share one extraction."""
+        mock_agent_router.execute = AsyncMock(
+            return_value=AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Short summary",
+                success=True,
+            )
+        )
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        with patch.object(
+            summarizer,
+            "_extract_context_from_results",
+            wraps=summarizer._extract_context_from_results,
+        ) as extract:
+            summarizer.should_summarize_before_phase(
+                session_results=sample_phase_results,
+                current_phase=3,
+            )
+            result = await summarizer.summarize_phase_context(
+                session_results=sample_phase_results,
+                current_phase=3,
+            )
+
+        assert result.success is True
+        assert extract.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_large_context_summarized_in_concurrent_shards(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that contexts above the shard limit are summarized per shard."""
+        mock_agent_router.execute = AsyncMock(
+            return_value=AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Shard summary",
+                success=True,
+            )
+        )
+        config = SummaryConfig(shard_token_limit=50)
+        summarizer = ContextSummary(agent_router=mock_agent_router, config=config)
+
+        result = await summarizer.summarize_phase_context(
+            session_results=sample_phase_results,
+            current_phase=3,
+        )
+
+        assert result.success is True
+        assert mock_agent_router.execute.call_count == 2
+        assert result.summarized_text == "Shard summary\n\nShard summary"
+        assert result.tokens_summary < result.tokens_original
+
+    @pytest.mark.asyncio
+    async def test_failed_shard_keeps_original_text(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that a failing shard falls back to its original context."""
+
+        async def execute(phase, task, prompt, doc_type):
+            if "Deep research content" in prompt:
+                raise Exception("Shard failure")
+            return AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Framing summary",
+                success=True,
+            )
+
+        mock_agent_router.execute = AsyncMock(side_effect=execute)
+        config = SummaryConfig(shard_token_limit=50, max_retries=0, target_reduction_ratio=0.9)
+        summarizer = ContextSummary(agent_router=mock_agent_router, config=config)
+
+        result = await summarizer.summarize_phase_context(
+            session_results=sample_phase_results,
+            current_phase=3,
+        )
+
+        assert result.success is True
+        assert result.summarized_text.startswith("Framing summary")
+        assert "Deep research content for Phase 2." in result.summarized_text
+
+    @pytest.mark.asyncio
+    async def test_identical_context_reuses_summary(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that re-summarizing an unchanged context skips the agent call."""
+        mock_agent_router.execute = AsyncMock(
+            return_value=AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Summary",
+                success=True,
+            )
+        )
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        first = await summarizer.summarize_phase_context(sample_phase_results, current_phase=3)
+        second = await summarizer.summarize_phase_context(sample_phase_results, current_phase=4)
+
+        assert mock_agent_router.execute.call_count == 1
+        assert second.summarized_text == first.summarized_text
+        assert second.original_text == first.original_text
+        assert summarizer.get_summary(4) is not None
+
+    @pytest.mark.asyncio
+    async def test_cached_summary_expires_after_ttl(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that identical contexts are re-summarized once the TTL has passed."""
+        mock_agent_router.execute = AsyncMock(
+            return_value=AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Summary",
+                success=True,
+            )
+        )
+        summarizer = ContextSummary(
+            agent_router=mock_agent_router,
+            config=SummaryConfig(summary_cache_ttl=60.0),
+        )
+
+        with patch("context.summarizer.time") as clock:
+            clock.monotonic.return_value = 1000.0
+            await summarizer.summarize_phase_context(sample_phase_results, current_phase=3)
+            clock.monotonic.return_value = 1059.0
+            await summarizer.summarize_phase_context(sample_phase_results, current_phase=3)
+            assert mock_agent_router.execute.call_count == 1
+
+            clock.monotonic.return_value = 1061.0
+            await summarizer.summarize_phase_context(sample_phase_results, current_phase=3)
+            assert mock_agent_router.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_known_token_count_skips_recount(self, mock_agent_router):
+        """Test that a caller-supplied token count is not recomputed."""
+        mock_agent_router.execute = AsyncMock(
+            return_value=AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Summary",
+                success=True,
+            )
+        )
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        with patch.object(summarizer, "_count_context_tokens") as count:
+            _, original_tokens, _ = await summarizer._summarize_with_agent(
+                "Some context " * 100, phase_number=2, original_tokens=321
+            )
+
+        count.assert_not_called()
+        assert original_tokens == 321
+
+    @pytest.mark.asyncio
+    async def test_summarize_all_phases_runs_concurrently(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that per-phase summaries run concurrently within the bound."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_execute(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.1)
+            in_flight -= 1
+            return AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Summary of previous phases.",
+                success=True,
+            )
+
+        mock_agent_router.execute = AsyncMock(side_effect=slow_execute)
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        started = time.perf_counter()
+        summaries = await summarizer.summarize_all_phases(sample_phase_results, max_concurrency=2)
+        elapsed = time.perf_counter() - started
+
+        assert sorted(summaries) == [2, 3]
+        assert all(result.success for result in summaries.values())
+        assert peak == 2
+        assert elapsed < 0.2
+
+    @pytest.mark.asyncio
+    async def test_schedule_summarize_returns_immediately(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that scheduled summarization does not wait for the agent."""
+
+        async def slow_execute(**kwargs):
+            await asyncio.sleep(1)
+            return AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Summary of previous phases.",
+                success=True,
+            )
+
+        mock_agent_router.execute = AsyncMock(side_effect=slow_execute)
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        started = time.perf_counter()
+        placeholder = summarizer.schedule_summarize_phase_context(
+            session_results=sample_phase_results,
+            current_phase=3,
+        )
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.01
+        assert placeholder.success is False
+        assert placeholder.error == "pending"
+        assert summarizer.get_summary(3).error == "pending"
+
+        await summarizer.wait_for_pending_summaries()
+
+        stored = summarizer.get_summary(3)
+        assert stored.success is True
+        assert stored.summarized_text == "Summary of previous phases."
+
+    @pytest.mark.asyncio
+    async def test_token_count_overlaps_agent_call(self, mock_agent_router):
+        """Test that the agent call starts before original token counting finishes."""
+        agent_started = threading.Event()
+
+        async def execute(**kwargs):
+            agent_started.set()
+            return AgentResponse(
+                agent_name=AgentType.CLAUDE,
+                task_name="summarize",
+                content="Summary",
+                success=True,
+            )
+
+        mock_agent_router.execute = AsyncMock(side_effect=execute)
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+        count_context_tokens = summarizer._count_context_tokens
+
+        def count_after_agent_started(context):
+            assert agent_started.wait(timeout=5)
+            return count_context_tokens(context)
+
+        with patch.object(
+            summarizer, "_count_context_tokens", side_effect=count_after_agent_started
+        ):
+            _, original_tokens, _ = await summarizer._summarize_with_agent(
+                "Some context " * 100, phase_number=2
+            )
+
+        assert original_tokens > 0
+
+    def test_short_context_is_estimated(self, mock_agent_router):
+        """Test that short contexts use the character estimate."""
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        result = summarizer._count_context_tokens("x" * 400)
+
+        assert result.estimated is True
+        assert result.total_tokens == 100
+
+    def test_count_context_tokens_reuses_threshold_check(
+        self, mock_agent_router, sample_phase_results
+    ):
+        """Test that counting after the threshold check hits the cache."""
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+        summarizer.should_summarize_before_phase(sample_phase_results, current_phase=3)
+
+        with patch("context.summarizer._get_token_counter") as get_counter:
+            result = summarizer.count_context_tokens(sample_phase_results, current_phase=3)
+
+        get_counter.assert_not_called()
+        assert result.total_tokens > 0
+
+    def test_context_rebuilt_when_results_change(self, mock_agent_router, sample_phase_results):
+        """Test that the cached context is invalidated when results change."""
+        summarizer = ContextSummary(agent_router=mock_agent_router)
+
+        results = copy.deepcopy(sample_phase_results)
+
+        _, first = summarizer._get_or_build_context(results, current_phase=3)
+        results[0].summary = "Revised framing summary."
+        _, second = summarizer._get_or_build_context(results, current_phase=3)
+
+        assert first != second
+        assert "Revised framing summary." in second
+
     def test_extract_context_from_results(self, mock_agent_router, sample_phase_results):
         """Test context extraction from phase results."""
         summarizer = ContextSummary(agent_router=mock_agent_router)
@@ -426,6 +796,21 @@ class TestContextSummary:
         assert "50%" in prompt  # Default target ratio
         assert "3" in prompt or "phase" in prompt.lower()
 
+    def test_build_summary_prompt_matches_template(self, mock_agent_router):
+        """Test that the cached template pieces render the full template."""
+        summarizer = ContextSummary(
+            agent_router=mock_agent_router,
+            config=SummaryConfig(target_reduction_ratio=0.3),
+        )
+        context = "Context with {braces} and 50%"
+
+        prompt = summarizer._build_summary_prompt(context, phase_number=2)
+
+        assert prompt == ContextSummary.DEFAULT_SUMMARY_PROMPT.format(
+            target_ratio=0.3, context=context
+        )
+        assert summarizer._build_summary_prompt(context, phase_number=3) == prompt
+
 
 class TestTokenReduction:
     """Tests for token reduction verification."""
@@ -6,7 +6,8 @@ Uses tiktoken when available, falls back to character-based estimation.
 """
 
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -34,18 +35,28 @@ class ModelLimits(BaseModel):
         Get token limit for a provider.
 
         Args:
-            provider: Provider name (claude, gemini, chatgpt, perplexity)
+            provider: Provider name (claude, gemini, chatgpt, perplexity);
+                an AgentType member is accepted as is
 
         Returns:
             Token limit for the provider
         """
-        provider_lower = provider.lower()
-        if hasattr(self, provider_lower):
-            return getattr(self, provider_lower)
-        return self.default
+        # Field values live in the instance __dict__; read it directly
+        values = self.__dict__
+        limit = values.get(provider)
+        if limit is None:
+            limit = values.get(provider.lower(), values["default"])
+        return limit
 
 
-@dataclass
+# Default limits by provider, read without building a ModelLimits per lookup
+_MODEL_LIMITS: dict[str, int] = {
+    name: field_info.default for name, field_info in ModelLimits.model_fields.items()
+}
+_DEFAULT_LIMIT = _MODEL_LIMITS["default"]
+
+
+@dataclass(slots=True)
 class TokenCountResult:
     """
     Result of token counting operation.
@@ -54,13 +65,22 @@ class TokenCountResult:
         total_tokens: Total token count
         estimated: Whether count is estimated (vs. exact)
         model_name: Model used for counting
-        breakdown: Optional breakdown by section
+        breakdown: Optional breakdown by section, None when not computed
     """
 
     total_tokens: int
     estimated: bool
     model_name: str
-    breakdown: dict[str, int] = field(default_factory=dict)
+    breakdown: dict[str, int] | None = None
+
+    def get_breakdown(self) -> dict[str, int]:
+        """
+        Get the breakdown by section.
+
+        Returns:
+            Breakdown dictionary, empty if none was computed
+        """
+        return self.breakdown or {}
 
     def get_percentage_used(self, provider: str) -> float:
         """
@@ -72,8 +92,10 @@ class TokenCountResult:
         Returns:
             Percentage (0-100)
         """
-        limits = ModelLimits()
-        limit = limits.get_limit(provider)
+        # Lowercase names and AgentType members hit without lowering
+        limit = _MODEL_LIMITS.get(provider)
+        if limit is None:
+            limit = _MODEL_LIMITS.get(provider.lower(), _DEFAULT_LIMIT)
         return (self.total_tokens / limit) * 100 if limit > 0 else 0
 
     def is_near_limit(
@@ -94,40 +116,121 @@ class TokenCountResult:
         return self.get_percentage_used(provider) >= (threshold * 100)
 
 
+def _dumps_compact(value: Any) -> str:
+    """Serialize to JSON without separator whitespace, keeping non-ASCII text as is."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _estimate_json_chars(value: Any) -> int:
+    """
+    Estimate the length of _dumps_compact(value) without building it.
+
+    Exact for plain data without characters that need escaping; values
+    JSON cannot serialize are measured by their str() form.
+
+    Args:
+        value: JSON-like value (dict, list, tuple, str, number, bool, None)
+
+    Returns:
+        Estimated serialized length in characters
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, dict):
+        if not value:
+            return 2
+        # Braces, "," between items, ":" and key quotes per item
+        total = 2 + (len(value) - 1) + 3 * len(value)
+        for key, item in value.items():
+            total += len(key if isinstance(key, str) else str(key))
+            total += _estimate_json_chars(item)
+        return total
+    if isinstance(value, list | tuple):
+        if not value:
+            return 2
+        return 2 + (len(value) - 1) + sum(_estimate_json_chars(item) for item in value)
+    return len(str(value))
+
+
 class TokenCounter:
     """
     Counts tokens in text for context management.
 
     Uses tiktoken for exact counting when available,
-    falls back to character-based estimation (1 token ≈ 4 characters).
+    falls back to character-based estimation (1 token ≈ 4 characters)
+    or, with heuristic="whitespace", to a word count.
     """
 
     # Character-based estimation: ~4 characters per token
     CHARS_PER_TOKEN = 4
 
-    def __init__(self) -> None:
-        """Initialize token counter."""
-        self._tiktoken_available = self._check_tiktoken()
-        if self._tiktoken_available:
-            try:
-                import importlib.util
+    # Number of distinct texts whose exact token counts are memoized
+    ENCODE_CACHE_SIZE = 256
+
+    # Supported estimation heuristics
+    HEURISTICS = ("chars", "whitespace")
+
+    def __init__(self, heuristic: str = "chars") -> None:
+        """
+        Initialize token counter.
+
+        tiktoken is imported and its encoding loaded on the first exact
+        count, so counters that only estimate never pay for it.
 
-                if importlib.util.find_spec("tiktoken") is not None:
-                    import tiktoken
+        Args:
+            heuristic: Estimation used without tiktoken: "chars" (length / 4)
+                or "whitespace" (spaces and line breaks + 1)
+
+        Raises:
+            ValueError: If heuristic is not supported
+        """
+        if heuristic not in self.HEURISTICS:
+            raise ValueError(
+                f"Unknown heuristic {heuristic!r}; expected one of {', '.join(self.HEURISTICS)}"
+            )
+        self.heuristic = heuristic
+        # None until the first exact count resolves tiktoken availability
+        self._tiktoken_available: bool | None = None
+        self._encoding: Any = None
+        # Per-instance memo of exact token counts keyed by text
+        self._encode_len = lru_cache(maxsize=self.ENCODE_CACHE_SIZE)(self._encode_len_uncached)
+
+    def _ensure_encoding(self) -> bool:
+        """
+        Load the tiktoken encoding on first use.
+
+        Returns:
+            True if exact counting with tiktoken is available
+        """
+        if self._tiktoken_available is None:
+            try:
+                import tiktoken
 
-                    self._encoding = tiktoken.get_encoding("cl100k_base")
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+                self._tiktoken_available = True
+            except ImportError:
+                self._tiktoken_available = False
             except Exception as exc:
                 logger.warning(f"tiktoken initialization failed: {exc}")
                 self._tiktoken_available = False
+        return self._tiktoken_available
 
-    def _check_tiktoken(self) -> bool:
-        """Check if tiktoken is available."""
-        try:
-            import importlib.util
+    def _encode_len_uncached(self, text: str) -> int:
+        """Encode text with tiktoken and return the token count."""
+        return len(self._encoding.encode(text))
 
-            return importlib.util.find_spec("tiktoken") is not None
-        except ImportError:
-            return False
+    def invalidate(self) -> None:
+        """Clear memoized token counts."""
+        self._encode_len.cache_clear()
+
+    @staticmethod
+    def _estimate_whitespace(text: str) -> int:
+        """Estimate tokens as the number of whitespace-separated chunks."""
+        return max(1, text.count(" ") + text.count("\n") + 1)
 
     def count(
         self,
@@ -153,11 +256,10 @@ class TokenCounter:
                 model_name=model_name,
             )
 
-        if self._tiktoken_available and not estimate_only:
+        if not estimate_only and self._ensure_encoding():
             try:
-                tokens = self._encoding.encode(text)
                 return TokenCountResult(
-                    total_tokens=len(tokens),
+                    total_tokens=self._encode_len(text),
                     estimated=False,
                     model_name=model_name,
                 )
@@ -165,30 +267,84 @@ class TokenCounter:
                 logger.warning(f"tiktoken encoding failed: {exc}, falling back to estimation")
 
         # Character-based estimation
-        estimated_tokens = max(1, len(text) // self.CHARS_PER_TOKEN)
+        if self.heuristic == "whitespace":
+            estimated_tokens = self._estimate_whitespace(text)
+        else:
+            estimated_tokens = max(1, len(text) // self.CHARS_PER_TOKEN)
         return TokenCountResult(
             total_tokens=estimated_tokens,
             estimated=True,
             model_name=model_name,
         )
 
+    def count_many(
+        self,
+        texts: list[str],
+        model_name: str = "claude",
+        estimate_only: bool = False,
+    ) -> list[TokenCountResult]:
+        """
+        Count tokens for several texts with a single counter.
+
+        With tiktoken, the distinct non-empty texts are encoded in one
+        encode_batch call instead of one call per text.
+
+        Args:
+            texts: Texts to count
+            model_name: Model name for counting
+            estimate_only: Force character-based estimation
+
+        Returns:
+            TokenCountResult for each text, in input order
+        """
+        count = self.count
+        if estimate_only or len(texts) < 2 or not self._ensure_encoding():
+            return [count(text, model_name, estimate_only) for text in texts]
+
+        unique = [text for text in dict.fromkeys(texts) if text]
+        try:
+            encoded = self._encoding.encode_batch(unique)
+        except Exception as exc:
+            logger.warning(f"tiktoken batch encoding failed: {exc}, counting texts one by one")
+            return [count(text, model_name) for text in texts]
+
+        lengths = {text: len(tokens) for text, tokens in zip(unique, encoded, strict=True)}
+        return [
+            TokenCountResult(total_tokens=lengths[text], estimated=False, model_name=model_name)
+            if text
+            else count(text, model_name)
+            for text in texts
+        ]
+
     def count_dict(
         self,
         data: dict[str, Any],
         model_name: str = "claude",
+        estimate_only: bool = False,
     ) -> TokenCountResult:
         """
         Count tokens in dictionary (serialized as JSON).
 
+        When estimating, the JSON length is computed by walking the data
+        instead of materializing the serialized string.
+
         Args:
             data: Dictionary to count
             model_name: Model name for counting
+            estimate_only: Force character-based estimation
 
         Returns:
             TokenCountResult with count
         """
-        json_str = json.dumps(data, ensure_ascii=False)
-        return self.count(json_str, model_name)
+        if estimate_only or not self._ensure_encoding():
+            estimated_tokens = max(1, _estimate_json_chars(data) // self.CHARS_PER_TOKEN)
+            return TokenCountResult(
+                total_tokens=estimated_tokens,
+                estimated=True,
+                model_name=model_name,
+            )
+
+        return self.count(_dumps_compact(data), model_name)
 
     def should_summarize(
         self,
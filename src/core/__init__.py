@@ -2,7 +2,7 @@
 Core modules for AigenFlow pipeline.
 """
 
-from .config import AigenFlowSettings, get_output_dir, get_settings
+from .config import AigenFlowSettings, get_output_dir, get_settings, reload_settings
 from .events import (
     AgentCalledEvent,
     AgentRespondedEvent,
@@ -45,6 +45,7 @@ __all__ = [
     "AigenFlowSettings",
     "get_output_dir",
     "get_settings",
+    "reload_settings",
     "AgentCalledEvent",
     "AgentRespondedEvent",
     "BaseEvent",
@@ -2,12 +2,23 @@
 Configuration management for AigenFlow pipeline.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Subdirectories created inside every session output directory
+_SESSION_SUBDIRS = ("phase1", "phase2", "phase3", "phase4", "phase5", "final")
+
+# Default browser profile directory, expanded once at import
+_DEFAULT_PROFILES_DIR = Path("~/.aigenflow/profiles").expanduser()
+
+# Directories already ensured by settings validation in this process
+_CREATED_DIRS: set[Path] = set()
+
 
 class AigenFlowSettings(BaseSettings):
     """Application settings for AigenFlow."""
@@ -18,7 +29,7 @@ class AigenFlowSettings(BaseSettings):
     log_format: Literal["json", "pretty"] = "pretty"
 
     output_dir: Path = Field(default_factory=lambda: Path("output"))
-    profiles_dir: Path = Field(default_factory=lambda: Path("~/.aigenflow/profiles").expanduser())
+    profiles_dir: Path = Field(default_factory=lambda: _DEFAULT_PROFILES_DIR)
     templates_dir: Path = Field(default_factory=lambda: Path("templates"))
 
     max_retries: int = 2
@@ -56,7 +67,9 @@ class AigenFlowSettings(BaseSettings):
     @field_validator("output_dir", "profiles_dir", "templates_dir")
     @classmethod
     def create_directories(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
+        if v not in _CREATED_DIRS:
+            v.mkdir(parents=True, exist_ok=True)
+            _CREATED_DIRS.add(v)
         return v
 
     @field_validator("log_level")
@@ -73,11 +86,23 @@ class AigenFlowSettings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> AigenFlowSettings:
-    """Get application settings instance."""
+    """
+    Get the shared application settings instance.
+
+    Settings are parsed from the environment once per process; use
+    reload_settings() to pick up changes.
+    """
     return AigenFlowSettings()
 
 
+def reload_settings() -> AigenFlowSettings:
+    """Discard the cached settings and load them again."""
+    get_settings.cache_clear()
+    return get_settings()
+
+
 def get_output_dir(session_id: str, settings: AigenFlowSettings | None = None) -> Path:
     """Get output directory for a specific session."""
     if settings is None:
@@ -86,11 +111,12 @@ def get_output_dir(session_id: str, settings: AigenFlowSettings | None = None) -
     output_path = settings.output_dir / session_id
     output_path.mkdir(parents=True, exist_ok=True)
 
-    for i in range(1, 6):
-        phase_dir = output_path / f"phase{i}"
-        phase_dir.mkdir(exist_ok=True)
+    # One directory listing instead of a mkdir round-trip per subdirectory
+    with os.scandir(output_path) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
 
-    final_dir = output_path / "final"
-    final_dir.mkdir(exist_ok=True)
+    for name in _SESSION_SUBDIRS:
+        if name not in existing:
+            (output_path / name).mkdir(exist_ok=True)
 
     return output_path
@@ -9,34 +9,30 @@ import logging
 import logging.handlers
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import structlog
+from structlog import get_logger as _structlog_get_logger
 
 from config.logging_profiles import (
+    CYCLE_PLACEHOLDER,
     LoggingProfile,
+    build_json_renderer,
     get_logging_profile,
+    register_reconfigure_hook,
 )
+from config.logging_profiles import is_sensitive_key as _is_sensitive_key
 
-_SENSITIVE_KEYWORDS = (
-    "key",
-    "token",
-    "secret",
-    "password",
-    "passwd",
-    "cookie",
-    "auth",
-    "authorization",
-    "session",
-)
-_LONG_SECRET_PATTERN = re.compile(r"[A-Za-z0-9_\-]{20,}")
-
-
-def _is_sensitive_key(key: str) -> bool:
-    """Check if a key might contain sensitive data."""
-    lowered = key.lower()
-    return any(keyword in lowered for keyword in _SENSITIVE_KEYWORDS)
+# Surrounding whitespace is matched by the pattern so values need no strip().
+# Possessive quantifiers stop fullmatch from backtracking through long runs of
+# token characters when a non-token character follows them.
+_LONG_SECRET_PATTERN = re.compile(r"\s*+[A-Za-z0-9_\-]{20,}+\s*+")
+_LONG_SECRET_MIN_LENGTH = 20
+_CONTAINER_TYPES = (dict, list, tuple)
+# Exact types skipped without isinstance checks; subclasses take the slow path
+_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
 
 
 def _mask_string(value: str) -> str:
@@ -49,9 +45,129 @@ def _mask_string(value: str) -> str:
     return f"{stripped[:4]}...{stripped[-4:]}"
 
 
+def _redact_string(value: str, key_hint: Any) -> str:
+    """Mask a string if its key is sensitive or it looks like a token."""
+    if isinstance(key_hint, str) and _is_sensitive_key(key_hint):
+        return _mask_string(value)
+    if len(value) >= _LONG_SECRET_MIN_LENGTH and _LONG_SECRET_PATTERN.fullmatch(value):
+        return _mask_string(value)
+    return value
+
+
+def _copy_path(frame: list[Any]) -> None:
+    """Copy a container and every not yet copied ancestor, linking the copies."""
+    chain = []
+    while frame is not None and frame[1] is None:
+        chain.append(frame)
+        frame = frame[2]
+    for node in reversed(chain):
+        source = node[0]
+        node[1] = dict(source) if isinstance(source, dict) else list(source)
+        parent = node[2]
+        if parent is not None:
+            parent[1][node[3]] = node[1]
+
+
+def _redact_container(value: dict | list | tuple, key_hint: Any) -> Any:
+    """
+    Mask strings nested in a container without recursion.
+
+    Containers are walked with an explicit stack of frames
+    [source, copy, parent frame, key in parent]. A container and its
+    ancestors are copied only once a string inside it is masked, so
+    the original object is returned when nothing needs masking. A
+    container found inside itself is replaced by a placeholder.
+    """
+    min_length = _LONG_SECRET_MIN_LENGTH
+    is_long_secret = _LONG_SECRET_PATTERN.fullmatch
+    scalar_types = _SCALAR_TYPES
+    root: list[Any] = [value, None, None, None]
+    # (frame, key hint for list/tuple items)
+    stack: list[tuple[list[Any] | None, Any]] = [(root, key_hint)]
+    tuple_frames: list[list[Any]] = []
+    # ids of the containers on the current path; a frame of None marks
+    # the point where the container named by the hint is left again
+    active: set[int] = set()
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        frame, hint = pop()
+        if frame is None:
+            active.discard(hint)
+            continue
+        container = frame[0]
+        active.add(id(container))
+        push((None, id(container)))
+        if isinstance(container, dict):
+            for k, v in container.items():
+                if type(v) in scalar_types:
+                    continue
+                if isinstance(v, str):
+                    if (isinstance(k, str) and _is_sensitive_key(k)) or (
+                        len(v) >= min_length and is_long_secret(v)
+                    ):
+                        masked = _mask_string(v)
+                        if masked is not v:
+                            if frame[1] is None:
+                                _copy_path(frame)
+                            frame[1][k] = masked
+                elif isinstance(v, _CONTAINER_TYPES):
+                    if id(v) in active:
+                        if frame[1] is None:
+                            _copy_path(frame)
+                        frame[1][k] = CYCLE_PLACEHOLDER
+                    else:
+                        push(([v, None, frame, k], k))
+        else:
+            if isinstance(container, tuple):
+                tuple_frames.append(frame)
+            # Keys may be any hashable; only string keys name a secret
+            sensitive = isinstance(hint, str) and _is_sensitive_key(hint)
+            for idx, item in enumerate(container):
+                if type(item) in scalar_types:
+                    continue
+                if isinstance(item, str):
+                    if sensitive or (len(item) >= min_length and is_long_secret(item)):
+                        masked = _mask_string(item)
+                        if masked is not item:
+                            if frame[1] is None:
+                                _copy_path(frame)
+                            frame[1][idx] = masked
+                elif isinstance(item, _CONTAINER_TYPES):
+                    if id(item) in active:
+                        if frame[1] is None:
+                            _copy_path(frame)
+                        frame[1][idx] = CYCLE_PLACEHOLDER
+                    else:
+                        push(([item, None, frame, idx], hint))
+
+    if root[1] is None:
+        return value
+    # Freeze copied tuples, innermost first, and relink them into their parents
+    for frame in reversed(tuple_frames):
+        if frame[1] is not None:
+            frame[1] = tuple(frame[1])
+            parent = frame[2]
+            if parent is not None:
+                parent[1][frame[3]] = frame[1]
+    return root[1]
+
+
+_REDACT_DISPATCH = {
+    str: _redact_string,
+    dict: _redact_container,
+    list: _redact_container,
+    tuple: _redact_container,
+}
+
+
 def redact_secrets(value: Any, key_hint: str | None = None) -> Any:
     """
-    Recursively redact sensitive values in logs.
+    Redact sensitive values in logs, including nested containers.
+
+    Nested containers are walked iteratively, so deep nesting cannot hit
+    the recursion limit. Only the containers on the path to a masked
+    value are copied; otherwise the original object is returned.
 
     Args:
         value: Value to redact (dict, list, tuple, str, or other)
@@ -60,18 +176,14 @@ def redact_secrets(value: Any, key_hint: str | None = None) -> Any:
     Returns:
         Redacted value with sensitive data masked
     """
-    if isinstance(value, dict):
-        return {k: redact_secrets(v, k) for k, v in value.items()}
-    if isinstance(value, list):
-        return [redact_secrets(item, key_hint) for item in value]
-    if isinstance(value, tuple):
-        return tuple(redact_secrets(item, key_hint) for item in value)
+    redact = _REDACT_DISPATCH.get(type(value))
+    if redact is not None:
+        return redact(value, key_hint)
+    # Subclasses such as StrEnum members take the isinstance path
     if isinstance(value, str):
-        if key_hint and _is_sensitive_key(key_hint):
-            return _mask_string(value)
-        if _LONG_SECRET_PATTERN.fullmatch(value.strip()):
-            return _mask_string(value)
-        return value
+        return _redact_string(value, key_hint)
+    if isinstance(value, _CONTAINER_TYPES):
+        return _redact_container(value, key_hint)
     return value
 
 
@@ -154,7 +266,7 @@ def setup_logging(
 
     # JSON or console renderer
     if use_json:
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(build_json_renderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
 
@@ -166,8 +278,11 @@ def setup_logging(
         cache_logger_on_first_use=True,
     )
 
+    # Loggers cached on first use are bound to the previous configuration
+    get_logger.cache_clear()
+
     # Get the underlying stdlib logger
-    logger = structlog.get_logger()
+    logger = _structlog_get_logger()
     stdlib_logger = logging.getLogger("aigenflow")
     stdlib_logger.setLevel(level_int)
 
@@ -197,6 +312,7 @@ def setup_logging(
     return logger.bind()
 
 
+@lru_cache(maxsize=128)
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     """
     Get a structured logger instance.
@@ -205,7 +321,8 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
         name: Logger name (defaults to "aigenflow")
 
     Returns:
-        Structlog bound logger
+        Structlog bound logger, cached per name until setup_logging() or
+        configure_logging() reconfigures logging
 
     Examples:
         >>> logger = get_logger()
@@ -214,8 +331,10 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
         >>> logger = get_logger("my.module")
         >>> logger.debug("Debugging info", extra_key="value")
     """
-    logger_name = name or "aigenflow"
-    return structlog.get_logger(logger_name)
+    return _structlog_get_logger(name or "aigenflow")
+
+
+register_reconfigure_hook(get_logger.cache_clear)
 
 
 class LogContext:
@@ -234,7 +353,7 @@ class LogContext:
 
     def __init__(self, **context: Any) -> None:
         self._context = context
-        self._logger = structlog.get_logger()
+        self._logger = _structlog_get_logger()
 
     def __enter__(self) -> structlog.stdlib.BoundLogger:
         """Bind context and return logger."""
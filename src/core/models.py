@@ -8,7 +8,11 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+# Build validators on first use rather than at import; CLI commands that
+# never touch a model don't pay for its schema
+_MODEL_CONFIG = ConfigDict(defer_build=True)
 
 
 class AgentType(StrEnum):
@@ -50,6 +54,8 @@ class PipelineState(StrEnum):
 
 
 class AgentResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     agent_name: AgentType
     task_name: str
     content: str
@@ -61,6 +67,8 @@ class AgentResponse(BaseModel):
 
 
 class PhaseResult(BaseModel):
+    model_config = _MODEL_CONFIG
+
     phase_number: int
     phase_name: str
     status: PhaseStatus
@@ -73,6 +81,8 @@ class PhaseResult(BaseModel):
 
 
 class PipelineConfig(BaseModel):
+    model_config = _MODEL_CONFIG
+
     topic: str
     doc_type: DocumentType = DocumentType.BIZPLAN
     template: TemplateType = TemplateType.DEFAULT
@@ -86,15 +96,51 @@ class PipelineConfig(BaseModel):
     @classmethod
     def validate_topic(cls, v: str) -> str:
         """Validate topic is not empty and meets minimum length."""
-        if not v or not v.strip():
-            raise ValueError("topic cannot be empty")
         stripped = v.strip()
+        if not stripped:
+            raise ValueError("topic cannot be empty")
         if len(stripped) < 10:
             raise ValueError("topic must be at least 10 characters")
         return stripped
 
 
+class _PhaseIndex:
+    """
+    Phase number to first PhaseResult, built lazily from a results list.
+
+    Rebuilt when the list object or its length changes. Compares equal to
+    any other index so it never affects session equality.
+    """
+
+    __slots__ = ("source", "count", "by_phase")
+
+    def __init__(self) -> None:
+        self.source: list[PhaseResult] | None = None
+        self.count = 0
+        self.by_phase: dict[int, PhaseResult] = {}
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _PhaseIndex)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def is_current(self, results: list[PhaseResult]) -> bool:
+        return self.source is results and self.count == len(results)
+
+    def lookup(self, results: list[PhaseResult]) -> dict[int, PhaseResult]:
+        if not self.is_current(results):
+            by_phase: dict[int, PhaseResult] = {}
+            for result in results:
+                by_phase.setdefault(result.phase_number, result)
+            self.source = results
+            self.count = len(results)
+            self.by_phase = by_phase
+        return self.by_phase
+
+
 class PipelineSession(BaseModel):
+    model_config = _MODEL_CONFIG
+
     session_id: str = Field(default_factory=lambda: str(uuid4()))
     config: PipelineConfig
     state: PipelineState = PipelineState.IDLE
@@ -103,6 +149,7 @@ class PipelineSession(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
     current_phase: int = 0
     artifacts: dict[str, Any] = Field(default_factory=dict)
+    _phase_index: _PhaseIndex = PrivateAttr(default_factory=_PhaseIndex)
 
     @field_validator("config", mode="before")
     @classmethod
@@ -117,15 +164,26 @@ class PipelineSession(BaseModel):
         return value
 
     def add_result(self, result: PhaseResult) -> None:
+        index = self._phase_index
+        was_current = index.is_current(self.results)
         self.results.append(result)
+        if was_current:
+            index.by_phase.setdefault(result.phase_number, result)
+            index.count += 1
         self.current_phase = result.phase_number
         self.updated_at = datetime.now()
 
     def get_phase_result(self, phase_number: int) -> PhaseResult | None:
-        for result in self.results:
-            if result.phase_number == phase_number:
-                return result
-        return None
+        return self._phase_index.lookup(self.results).get(phase_number)
+
+    def to_checkpoint_json(self, indent: int | None = 2) -> str:
+        """Serialize the session for pipeline_state.json in a single pydantic-core pass."""
+        return self.model_dump_json(indent=indent)
+
+    @classmethod
+    def from_checkpoint_json(cls, data: str | bytes) -> "PipelineSession":
+        """Rebuild a session from a checkpoint written by to_checkpoint_json."""
+        return cls.model_validate_json(data)
 
 
 def create_phase_result(phase_number: int, phase_name: str) -> PhaseResult:
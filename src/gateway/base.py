@@ -2,22 +2,36 @@
 Base provider for AI gateway.
 
 Defines BaseProvider interface and common functionality for all AI providers.
+
+USE_BROWSER_POOL selects whether providers share BrowserPool contexts. It is
+read from AIGENFLOW_USE_BROWSER_POOL once, when this module is imported, so
+setting the variable after import has no effect.
 """
 
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel
-
 from core.logger import get_logger
 from core.models import AgentType
-from gateway.selector_loader import SelectorConfig, SelectorLoader
+from gateway.selector_loader import SelectorLoader
 
 logger = get_logger(__name__)
 
+# Read once at import (see module docstring)
+USE_BROWSER_POOL = os.getenv("AIGENFLOW_USE_BROWSER_POOL", "true").lower() == "true"
+
+# Returned by get_all_selectors() for providers without a selector loader
+_NO_SELECTORS: Mapping[str, str] = MappingProxyType({})
 
-class GatewayRequest(BaseModel):
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class GatewayRequest:
     """Request to send to AI provider."""
 
     task_name: str
@@ -26,7 +40,8 @@ class GatewayRequest(BaseModel):
     timeout: int = 120
 
 
-class GatewayResponse(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class GatewayResponse:
     """Response from AI provider."""
 
     content: str
@@ -34,7 +49,7 @@ class GatewayResponse(BaseModel):
     error: str | None = None
     tokens_used: int = 0
     response_time: float = 0.0
-    metadata: dict[str, Any] = {}
+    metadata: dict[str, Any] = field(default_factory=dict)
 
 
 class BaseProvider(ABC):
@@ -55,6 +70,10 @@ class BaseProvider(ABC):
     agent_type: AgentType = None  # To be overridden by subclasses
     provider_name: str = None  # To be overridden by subclasses
 
+    # cached_property values derived from the selector loader; subclasses
+    # adding their own extend this so a new loader drops them too
+    _SELECTOR_CACHES: tuple[str, ...] = ("_selectors", "_selector_strings")
+
     def __init__(
         self,
         profile_dir: Path,
@@ -75,7 +94,6 @@ class BaseProvider(ABC):
         self.headless = headless
         self.ignore_https_errors = ignore_https_errors
         self._selector_loader = selector_loader
-        self._selector_config: SelectorConfig | None = None
         self._browser_manager = None
 
     @property
@@ -84,7 +102,7 @@ class BaseProvider(ABC):
         return self._selector_loader
 
     @selector_loader.setter
-    def selector_loader(self, loader: SelectorLoader) -> None:
+    def selector_loader(self, loader: SelectorLoader | None) -> None:
         """
         Set the selector loader instance.
 
@@ -92,7 +110,30 @@ class BaseProvider(ABC):
             loader: SelectorLoader instance to use
         """
         self._selector_loader = loader
-        self._selector_config = None  # Clear cached config
+        # Selectors resolved from the previous loader are stale now
+        for name in self._SELECTOR_CACHES:
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _selectors(self) -> Mapping[str, Any]:
+        """
+        This provider's selector table, resolved once per instance.
+
+        The parsed config is cached by the loader, so providers created
+        from the same loader read the YAML file only once between them.
+        After the first access the table is a plain instance attribute.
+        """
+        if self.provider_name is None:
+            raise ValueError("provider_name must be set by subclass")
+        loader = self._selector_loader
+        return MappingProxyType(
+            loader.get_provider_selectors(loader.get_config(), self.provider_name)
+        )
+
+    @cached_property
+    def _selector_strings(self) -> dict[str, str]:
+        """Non-null selectors already converted to str, for get_selector()."""
+        return {key: str(value) for key, value in self._selectors.items() if value is not None}
 
     def get_selector(
         self,
@@ -112,47 +153,63 @@ class BaseProvider(ABC):
         Raises:
             GatewayException: If selector_loader not set or selector not found
         """
-        if self._selector_loader is None:
+        loader = self._selector_loader
+        if loader is None:
             # Backward compatibility: return None if no loader set
             return None
 
-        if self.provider_name is None:
-            raise ValueError("provider_name must be set by subclass")
-
-        # Lazy load selector config
-        if self._selector_config is None:
-            self._selector_config = self._selector_loader.load()
+        value = self._selector_strings.get(key)
+        if value is not None:
+            return value
 
-        return self._selector_loader.get_selector(
-            self._selector_config,
+        # Missing or null selector: let the loader report it
+        return loader.get_selector(
+            loader.get_config(),
             self.provider_name,
             key,
             optional=optional,
         )
 
-    def get_all_selectors(self) -> dict[str, str]:
+    def get_selectors(self, *keys: str, optional: bool = False) -> tuple[str | None, ...]:
         """
-        Get all DOM selectors for this provider.
+        Get several DOM selectors for this provider in one call.
+
+        Lets send_message implementations resolve all their selectors up
+        front instead of calling get_selector() once per key.
+
+        Args:
+            *keys: Selector keys, in the order they should be returned
+            optional: If True, missing selectors come back as None instead of raising
 
         Returns:
-            Dictionary of selector key-value pairs
+            Selector strings (or None) in the same order as keys
 
         Raises:
-            GatewayException: If selector_loader not set or provider not found
+            GatewayException: If a selector is not found and optional=False
         """
         if self._selector_loader is None:
-            return {}
+            return (None,) * len(keys)
 
-        if self.provider_name is None:
-            raise ValueError("provider_name must be set by subclass")
+        strings = self._selector_strings
+        return tuple(
+            strings[key] if key in strings else self.get_selector(key, optional=optional)
+            for key in keys
+        )
 
-        if self._selector_config is None:
-            self._selector_config = self._selector_loader.load()
+    def get_all_selectors(self) -> Mapping[str, str]:
+        """
+        Get all DOM selectors for this provider.
 
-        return self._selector_loader.get_provider_selectors(
-            self._selector_config,
-            self.provider_name,
-        )
+        Returns:
+            Read-only mapping of selector key-value pairs, shared between calls
+
+        Raises:
+            GatewayException: If selector_loader not set or provider not found
+        """
+        if self._selector_loader is None:
+            return _NO_SELECTORS
+
+        return self._selectors
 
     async def get_browser_manager(self):
         """
@@ -164,15 +221,11 @@ class BaseProvider(ABC):
         Note:
             This now uses BrowserPool for context reuse instead of
             creating separate browser instances. Falls back to legacy
-            BrowserManager if pool is disabled via environment variable.
+            BrowserManager if pool is disabled via environment variable
+            (see USE_BROWSER_POOL).
         """
-        import os
-
-        # Check if browser pool is enabled (default: true)
-        use_pool = os.getenv("AIGENFLOW_USE_BROWSER_POOL", "true").lower() == "true"
-
         if self._browser_manager is None:
-            if use_pool:
+            if USE_BROWSER_POOL:
                 # Use new BrowserPool approach
                 from gateway.provider_context import ProviderContext
 
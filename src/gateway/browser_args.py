@@ -0,0 +1,61 @@
+"""
+Shared browser launch and context defaults.
+
+Single source of truth for the anti-detection flags, context settings and
+stealth script used by BrowserManager and BrowserPool.
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+
+# Anti-detection Chromium arguments; Playwright accepts the tuple as-is
+ANTI_DETECT_ARGS: tuple[str, ...] = (
+    "--disable-blink-features=AutomationControlled",
+    "--exclude-switches=enable-automation",  # Hide automation flag
+    "--disable-infobars",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--disable-features=IsolateOrigins,site-per-process",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-background-networking",
+)
+
+# Default user agent for Windows Chrome
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/121.0.0.0 Safari/537.36"
+)
+
+# Read-only default viewport; copy with dict() before handing it to Playwright
+DEFAULT_VIEWPORT = MappingProxyType({"width": 1280, "height": 720})
+
+
+@lru_cache(maxsize=1)
+def get_stealth_script() -> str | None:
+    """
+    Return playwright-stealth's evasions as one init script, built on first use.
+
+    Added to a context with add_init_script(), it runs in every page the
+    context opens, so pages need no per-page patching.
+
+    Returns:
+        The combined script, or None if playwright-stealth is not installed
+    """
+    try:
+        from playwright_stealth import Stealth  # 2.x
+    except ImportError:
+        pass
+    else:
+        return Stealth().script_payload or None
+
+    try:
+        from playwright_stealth.stealth import StealthConfig  # 1.x
+    except ImportError:
+        return None
+    return ";\n".join(StealthConfig().enabled_scripts)
@@ -4,18 +4,22 @@ Browser Manager for Playwright automation.
 Manages browser lifecycle with anti-detection measures for AI provider authentication.
 """
 
-from pathlib import Path
-from typing import Any
+from __future__ import annotations
 
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-# Import playwright-stealth for anti-bot detection
-try:
-    from playwright_stealth import stealth_async
-    STEALTH_AVAILABLE = True
-except ImportError:
-    STEALTH_AVAILABLE = False
+from gateway.base import USE_BROWSER_POOL
+from gateway.browser_args import (
+    ANTI_DETECT_ARGS,
+    DEFAULT_USER_AGENT,
+    DEFAULT_VIEWPORT,
+    get_stealth_script,
+)
+from gateway.browser_pool import BrowserPool
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
 
 
 class BrowserManager:
@@ -30,28 +34,10 @@ class BrowserManager:
     """
 
     # Default anti-detection browser arguments
-    DEFAULT_BROWSER_ARGS = [
-        "--disable-blink-features=AutomationControlled",
-        "--exclude-switches=enable-automation",  # Hide automation flag
-        "--disable-infobars",
-        "--disable-dev-shm-usage",
-        "--no-sandbox",
-        "--disable-gpu",
-        "--disable-web-security",
-        "--disable-features=IsolateOrigins,site-per-process",
-        "--disable-extensions",
-        "--disable-background-timer-throttling",
-        "--disable-backgrounding-occluded-windows",
-        "--disable-renderer-backgrounding",
-        "--disable-background-networking",
-    ]
+    DEFAULT_BROWSER_ARGS = ANTI_DETECT_ARGS
 
     # Default user agent for Windows Chrome
-    DEFAULT_USER_AGENT = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/121.0.0.0 Safari/537.36"
-    )
+    DEFAULT_USER_AGENT = DEFAULT_USER_AGENT
 
     def __init__(
         self,
@@ -78,11 +64,18 @@ class BrowserManager:
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._playwright = None
+        self._pool: BrowserPool | None = None  # Set while borrowing the pooled browser
 
     async def start_browser(self) -> Browser:
         """
         Start Playwright browser instance.
 
+        The BrowserPool's browser is borrowed when it runs in the same
+        headless mode, so one Playwright driver serves the whole process.
+        Otherwise (e.g. a headed login) a dedicated browser is launched;
+        a headed manager never creates the pool itself. With the pool
+        disabled (USE_BROWSER_POOL) every manager launches its own.
+
         Returns:
             Browser instance
 
@@ -93,6 +86,17 @@ class BrowserManager:
             return self._browser
 
         try:
+            if USE_BROWSER_POOL and (self.headless or BrowserPool.instance_exists()):
+                pool = await BrowserPool.get_instance(headless=self.headless)
+                browser = await pool.acquire_browser(self.headless)
+                if browser is not None:
+                    self._pool = pool
+                    self._browser = browser
+                    self._playwright = pool.playwright
+                    return self._browser
+
+            from playwright.async_api import async_playwright
+
             self._playwright = await async_playwright().start()
 
             # Launch browser with anti-detection settings
@@ -127,7 +131,7 @@ class BrowserManager:
         if self._browser is None:
             await self.start_browser()
 
-        viewport_config = viewport or {"width": 1280, "height": 720}
+        viewport_config = viewport or dict(DEFAULT_VIEWPORT)
 
         try:
             # Create context with anti-detection settings
@@ -138,6 +142,15 @@ class BrowserManager:
                 ignore_https_errors=self.ignore_https_errors,
             )
 
+            # Apply playwright-stealth once; every page in the context inherits it
+            stealth_script = get_stealth_script()
+            if stealth_script is not None:
+                try:
+                    await self._context.add_init_script(stealth_script)
+                except Exception:
+                    # If stealth fails, continue without it
+                    pass
+
             return self._context
 
         except Exception as exc:
@@ -147,7 +160,7 @@ class BrowserManager:
         """
         Get or create a page in the current context.
 
-        Applies playwright-stealth if available for anti-bot detection.
+        Stealth comes from the context's init script (see create_context).
 
         Returns:
             Page instance
@@ -165,14 +178,6 @@ class BrowserManager:
         else:
             page = await self._context.new_page()
 
-        # Apply playwright-stealth for anti-bot detection
-        if STEALTH_AVAILABLE:
-            try:
-                await stealth_async(page)
-            except Exception:
-                # If stealth fails, continue without it
-                pass
-
         return page
 
     async def inject_cookies(self, cookies: list[dict[str, Any]]) -> None:
@@ -211,6 +216,14 @@ class BrowserManager:
             await self._context.close()
             self._context = None
 
+        if self._pool is not None:
+            # Shared driver and browser belong to the pool
+            self._browser = None
+            self._playwright = None
+            pool, self._pool = self._pool, None
+            await pool.release_browser()
+            return
+
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -219,7 +232,7 @@ class BrowserManager:
             await self._playwright.stop()
             self._playwright = None
 
-    async def __aenter__(self) -> "BrowserManager":
+    async def __aenter__(self) -> BrowserManager:
         """Async context manager entry."""
         await self.start_browser()
         return self
@@ -8,22 +8,134 @@ across all AI provider agents, reducing memory usage and startup time.
 from __future__ import annotations
 
 import asyncio
+import os
 import signal
-from typing import Any
-
-from playwright.async_api import Browser, BrowserContext
-
-try:
-    from playwright_stealth import stealth_async
-    STEALTH_AVAILABLE = True
-except ImportError:
-    STEALTH_AVAILABLE = False
+import time
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from core.logger import get_logger
+from gateway.browser_args import ANTI_DETECT_ARGS, DEFAULT_VIEWPORT, get_stealth_script
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright
 
 logger = get_logger(__name__)
 
 
+def _drop_expired_cookies(
+    cookies: list[dict[str, Any]], now: float | None = None
+) -> list[dict[str, Any]]:
+    """
+    Filter out cookies whose expiry time has passed.
+
+    Session cookies (no expires, or a negative one) are kept.
+
+    Args:
+        cookies: Playwright cookie dictionaries
+        now: Current Unix time (default: time.time())
+
+    Returns:
+        Cookies that are still valid
+    """
+    if now is None:
+        now = time.time()
+    return [c for c in cookies if c.get("expires", -1) < 0 or c["expires"] > now]
+
+
+def _driver_pid(playwright: Any) -> int | None:
+    """
+    PID of the Playwright driver subprocess; launched browsers run beneath it.
+
+    Playwright exposes no public accessor, so this returns None whenever
+    the private transport layout differs from what is expected here.
+    """
+    try:
+        return playwright._impl_obj._connection._transport._proc.pid
+    except AttributeError:
+        return None
+
+
+def _process_start_ticks(pid: int) -> int | None:
+    """
+    Start time of a process, in clock ticks since boot, read from /proc.
+
+    Returns:
+        The start time, or None if the process or /proc is unavailable
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # starttime is field 22; fields are counted from the PID, and the state
+    # (field 3) is the first after the command name's closing parenthesis
+    return int(stat.rpartition(")")[2].split()[19])
+
+
+def _descendant_pids(root: int | None = None) -> list[int]:
+    """
+    List the PIDs of a process's descendants by reading /proc.
+
+    Args:
+        root: Process whose subtree is walked; defaults to this process
+
+    Returns:
+        Descendant PIDs, or an empty list where /proc is unavailable
+    """
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return []
+
+    children: dict[int, list[int]] = {}
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces; the parent PID is the second
+        # field after its closing parenthesis
+        ppid = int(stat.rpartition(")")[2].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    pids: list[int] = []
+    pending = [os.getpid() if root is None else root]
+    while pending:
+        for child in children.get(pending.pop(), ()):
+            pids.append(child)
+            pending.append(child)
+    return pids
+
+
+def _is_browser_process(pid: int) -> bool:
+    """Check whether /proc names a process as Chrome or Chromium."""
+    try:
+        with open(f"/proc/{pid}/comm") as f:
+            name = f.read().strip().lower()
+    except OSError:
+        return False
+    return "chromium" in name or "chrome" in name
+
+
+@dataclass(slots=True)
+class _ProviderSlot:
+    """Per-provider pool state: context, creation lock and usage counters."""
+
+    context: BrowserContext | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    valid: bool = False  # Created and not closed
+    usage: int = 0  # Pages served by the current context
+    created_at: float = 0.0  # time.monotonic() when the context was created
+    idle_pages: list[Any] = field(default_factory=list)  # Released, reusable pages
+    checked_out: set[Any] = field(default_factory=set)  # Pages handed out, not yet released
+
+
 class BrowserPool:
     """
     Singleton pool managing a single browser instance with multiple contexts.
@@ -35,47 +147,115 @@ class BrowserPool:
         - Lifecycle management for cleanup
 
     Thread Safety:
-        - Uses asyncio.Lock for singleton creation
+        - Uses a per-event-loop asyncio.Lock for singleton creation
         - Per-provider locks for context creation
     """
 
     _instance: BrowserPool | None = None
-    _lock = asyncio.Lock()
+    # Singleton creation locks, one per event loop; a lock contended on a
+    # loop other than the one it first waited on raises RuntimeError
+    _locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    # Anti-detection launch arguments, shared with BrowserManager
+    DEFAULT_BROWSER_ARGS = ANTI_DETECT_ARGS
+
+    # Resource types aborted in contexts created with block_resources;
+    # stylesheets still load since selectors depend on element visibility
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+    # Times a page is handed out again before it is closed and replaced,
+    # bounding memory growth from long-lived pages
+    MAX_PAGE_REUSES = 50
+
+    # Released pages kept open per provider; a burst of concurrent requests
+    # would otherwise leave that many idle pages behind
+    MAX_IDLE_PAGES = 4
+
+    # Pages served or seconds elapsed before a context is recycled;
+    # long-lived contexts accumulate routes and CDP sessions
+    MAX_PAGES_PER_CONTEXT = 100
+    MAX_CONTEXT_AGE = 30 * 60
+
+    # Contexts created at once; the single driver pipe slows down when
+    # flooded with parallel new_context calls
+    MAX_CONCURRENT_CONTEXT_CREATES = 4
+
+    # Seconds close_all() waits for a single context; browser.close() reaps the rest
+    CONTEXT_CLOSE_TIMEOUT = 5.0
 
     def __init__(self) -> None:
         """Private constructor - use get_instance() instead."""
         self._browser: Browser | None = None
-        self._contexts: dict[str, BrowserContext] = {}
-        self._context_locks: dict[str, asyncio.Lock] = {}
-        self._valid_contexts: set[str] = set()  # Track created, not-closed contexts
-        self._playwright = None
+        self._providers: dict[str, _ProviderSlot] = {}
+        self._page_reuses: dict[Any, int] = {}  # How often each pooled page was reused
+        self._create_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CONTEXT_CREATES)
+        self._playwright: Playwright | None = None
+        self._over_cdp = False  # Connected to a shared browser rather than launched
+        self._driver_pid: int | None = None  # Playwright driver subprocess
+        self._driver_started_at = 0.0
+        self._driver_start_ticks: int | None = None  # /proc start time, to detect PID reuse
+        self._borrowers = 0  # BrowserManagers sharing this driver and browser
         self.headless: bool = True
         self._initialized = False
+        self._close_lock = asyncio.Lock()  # Serializes concurrent close_all() calls
 
     @classmethod
     async def get_instance(cls, headless: bool = True) -> BrowserPool:
         """
         Get or create singleton instance with async lock protection.
 
+        Once the instance exists it is returned without taking the lock.
+        It is only published after initialize() succeeds, so the lock-free
+        path never sees a half-initialized pool.
+
         Args:
             headless: Whether to run browser in headless mode
 
         Returns:
             BrowserPool instance
         """
-        # CRITICAL FIX: Acquire lock FIRST to prevent race condition
-        async with cls._lock:
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
+        # CRITICAL FIX: Acquire lock to prevent racing creators
+        async with cls._get_lock():
             if cls._instance is None:
-                cls._instance = cls()
-                await cls._instance.initialize(headless)
+                instance = cls()
+                await instance.initialize(headless)
+                cls._instance = instance
         return cls._instance
 
-    async def initialize(self, headless: bool = True) -> None:
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        """Get the singleton creation lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = cls._locks.get(loop)
+        if lock is None:
+            lock = cls._locks[loop] = asyncio.Lock()
+        return lock
+
+    async def initialize(
+        self,
+        headless: bool = True,
+        preload_providers: Iterable[str] = (),
+        cdp_endpoint: str | None = None,
+    ) -> None:
         """
         Initialize browser pool.
 
+        With a CDP endpoint the pool connects to an already running
+        Chromium instead of launching its own, so several processes can
+        share one browser.
+
         Args:
-            headless: Headless mode flag
+            headless: Headless mode flag (ignored when connecting over CDP)
+            preload_providers: Providers whose contexts are created right
+                after launch, concurrently, instead of on first use
+            cdp_endpoint: Browser endpoint to connect to; defaults to the
+                AIGENFLOW_CDP_ENDPOINT environment variable
         """
         if self._initialized:
             return
@@ -86,44 +266,85 @@ class BrowserPool:
             from playwright.async_api import async_playwright
 
             self._playwright = await async_playwright().start()
-
-            # Launch single browser instance with anti-detection
-            self._browser = await self._playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--exclude-switches=enable-automation",
-                    "--disable-infobars",
-                    "--disable-dev-shm-usage",
-                    "--no-sandbox",
-                    "--disable-gpu",
-                    "--disable-web-security",
-                    "--disable-features=IsolateOrigins,site-per-process",
-                    "--disable-extensions",
-                    "--disable-background-timer-throttling",
-                    "--disable-renderer-backgrounding",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-background-networking",
-                ],
-            )
+            # Only the PID is kept; the browser subtree is walked on cleanup
+            self._driver_pid = _driver_pid(self._playwright)
+            self._driver_started_at = time.time()
+            if self._driver_pid is not None:
+                self._driver_start_ticks = _process_start_ticks(self._driver_pid)
+
+            endpoint = cdp_endpoint or os.getenv("AIGENFLOW_CDP_ENDPOINT")
+            if endpoint:
+                # Shared browser; its launch flags are set by whoever started it
+                self._browser = await self._playwright.chromium.connect_over_cdp(endpoint)
+                self._over_cdp = True
+            else:
+                # Launch single browser instance with anti-detection
+                self._browser = await self._playwright.chromium.launch(
+                    headless=headless,
+                    args=self.DEFAULT_BROWSER_ARGS,
+                )
+                self._over_cdp = False
 
             self._initialized = True
             logger.info(
                 "BrowserPool initialized",
                 headless=headless,
+                over_cdp=self._over_cdp,
                 browser_id=id(self._browser) if self._browser else None,
             )
 
         except Exception as exc:
             logger.error("BrowserPool initialization failed", error=str(exc))
-            await self.close()  # Cleanup on failure
+            await self.close_all()  # Cleanup on failure
             raise RuntimeError(f"Failed to initialize BrowserPool: {exc}") from exc
 
+        # Prewarm contexts; a failure here only defers creation to first use
+        names = list(preload_providers)
+        results = await asyncio.gather(
+            *(self.get_context(name) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to prewarm context for {name}: {result}")
+
+    async def acquire_browser(self, headless: bool = True) -> Browser | None:
+        """
+        Borrow the pooled browser for use outside the pool's contexts.
+
+        Lets BrowserManager share this Playwright driver instead of starting
+        its own. Every successful call must be paired with release_browser().
+
+        Args:
+            headless: Headless mode the borrower needs
+
+        Returns:
+            The shared browser, or None if it runs in a different mode
+        """
+        if not self._initialized:
+            await self.initialize(headless)
+        if self.headless != headless:
+            return None
+        self._borrowers += 1
+        return self._browser
+
+    async def release_browser(self) -> None:
+        """
+        Return a browser borrowed with acquire_browser().
+
+        The pool is shut down once the last borrower leaves and it holds no
+        provider contexts; otherwise it stays up for its other users.
+        """
+        self._borrowers = max(self._borrowers - 1, 0)
+        if self._borrowers == 0 and not self._providers and self._browser is not None:
+            await self.close_all()
+
     async def get_context(
         self,
         provider_name: str,
         viewport: dict[str, int] | None = None,
         locale: str = "en-US",
+        block_resources: bool | None = None,
     ) -> BrowserContext:
         """
         Get or create browser context for provider.
@@ -134,56 +355,84 @@ class BrowserPool:
             provider_name: Provider identifier (e.g., "chatgpt", "claude")
             viewport: Viewport dimensions (default: 1280x720)
             locale: Browser locale
+            block_resources: Abort BLOCKED_RESOURCE_TYPES requests in a newly
+                created context. Defaults to the pool's headless mode, so a
+                user completing a headed login still sees images. Routing
+                disables Playwright's HTTP cache for the context.
 
         Returns:
             BrowserContext instance for the provider
         """
+        # Return existing context if available; contexts that close are
+        # invalidated by their "close" event handler. A valid slot implies an
+        # initialized pool (close_all() drops every slot), so hits skip that check.
+        slot = self._providers.get(provider_name)
+        if slot is not None and slot.valid:
+            return slot.context
+
         if not self._initialized:
             await self.initialize(self.headless)
+            slot = self._providers.get(provider_name)
 
-        # Return existing context if available
-        # Use _valid_contexts set to track which contexts have been created and not closed
-        if provider_name in self._valid_contexts and provider_name in self._contexts:
-            context = self._contexts[provider_name]
-            # Quick health check: try to access context
-            try:
-                _ = context.pages  # Will raise if context is closed
-                logger.debug(f"Reusing existing context for {provider_name}")
-                return context
-            except Exception:
-                # Context is closed, remove from valid set
-                self._valid_contexts.discard(provider_name)
-
-        # FIX: Use setdefault() to prevent race condition in lock creation
-        lock = self._context_locks.setdefault(provider_name, asyncio.Lock())
+        # No await between the lookup and the insert, so concurrent callers
+        # always end up sharing one slot (and its lock)
+        if slot is None:
+            slot = self._providers[provider_name] = _ProviderSlot()
 
         # Create new context with lock for thread safety
-        async with lock:
+        async with slot.lock:
             # Double-check after acquiring lock
-            if provider_name in self._valid_contexts and provider_name in self._contexts:
-                context = self._contexts[provider_name]
-                try:
-                    _ = context.pages
-                    return context
-                except Exception:
-                    self._valid_contexts.discard(provider_name)
+            if slot.valid:
+                return slot.context
 
             # Create new context
-            viewport_config = viewport or {"width": 1280, "height": 720}
-            context = await self._browser.new_context(
-                viewport=viewport_config,
-                locale=locale,
-            )
+            viewport_config = viewport or dict(DEFAULT_VIEWPORT)
+            async with self._create_semaphore:
+                context = await self._browser.new_context(
+                    viewport=viewport_config,
+                    locale=locale,
+                )
+
+            # NOTE: Stealth is registered once as a context init script, which
+            # every page inherits; no page is opened during context init
+            stealth_script = get_stealth_script()
+            if stealth_script is not None:
+                try:
+                    await context.add_init_script(stealth_script)
+                except Exception as e:
+                    logger.warning(f"Stealth application failed for {provider_name}: {e}")
+
+            if block_resources is None:
+                block_resources = self.headless
+            if block_resources:
+                await context.route("**/*", self._abort_blocked_resources)
 
-            # NOTE: Stealth is applied per-page, not per-context
-            # This avoids page crashes from creating/closing pages during context init
+            context.once("close", lambda _: self._on_context_closed(provider_name, context))
 
-            self._contexts[provider_name] = context
-            self._valid_contexts.add(provider_name)  # Mark as valid
+            slot.context = context
+            slot.valid = True
+            slot.usage = 0
+            slot.created_at = time.monotonic()
             logger.info(f"Created new context for {provider_name}")
 
             return context
 
+    async def _abort_blocked_resources(self, route: Any) -> None:
+        """Route handler: abort images, media and fonts, pass everything else."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _on_context_closed(self, provider_name: str, context: BrowserContext) -> None:
+        """Invalidate a provider's context once Playwright reports it closed."""
+        # A recycled provider may already have a newer context registered
+        slot = self._providers.get(provider_name)
+        if slot is not None and slot.context is context:
+            # Drop the reference too, so close_all() won't close it again
+            slot.valid = False
+            slot.context = None
+
     async def get_page(
         self,
         provider_name: str,
@@ -193,6 +442,14 @@ class BrowserPool:
         """
         Get or create page for provider with anti-detection.
 
+        A page previously returned with release_page() is reused when one
+        is available; otherwise a new page is created. Stealth comes from
+        the context's init script, so pages need no patching.
+        Once the context has served MAX_PAGES_PER_CONTEXT pages or is older
+        than MAX_CONTEXT_AGE seconds it is recycled first. Recycling waits
+        until every page handed out for the provider has been released or
+        closed, so pages still in use keep working.
+
         Args:
             provider_name: Provider identifier
             viewport: Viewport dimensions
@@ -203,17 +460,108 @@ class BrowserPool:
         """
         context = await self.get_context(provider_name, viewport, locale)
 
+        slot = self._providers[provider_name]
+        # Pages closed without release_page() no longer hold the context
+        slot.checked_out = {page for page in slot.checked_out if not page.is_closed()}
+        if not slot.checked_out and (
+            slot.usage >= self.MAX_PAGES_PER_CONTEXT
+            or time.monotonic() - slot.created_at > self.MAX_CONTEXT_AGE
+        ):
+            context = await self._recycle_context(provider_name, context, viewport, locale)
+            slot = self._providers[provider_name]
+        slot.usage += 1
+
+        # Reuse an idle page; pages of a closed context report is_closed()
+        idle = slot.idle_pages
+        while idle:
+            page = idle.pop()
+            if not page.is_closed():
+                slot.checked_out.add(page)
+                return context, page
+            self._page_reuses.pop(page, None)
+
         # Create new page for this request
         page = await context.new_page()
+        self._page_reuses[page] = 0
+        slot.checked_out.add(page)
+
+        return context, page
+
+    async def _recycle_context(
+        self,
+        provider_name: str,
+        context: BrowserContext,
+        viewport: dict[str, int] | None,
+        locale: str,
+    ) -> BrowserContext:
+        """
+        Replace a provider context with a fresh one, carrying over cookies.
+
+        If the storage state cannot be read, the current context is kept
+        and its counters restarted rather than dropping the login session.
+        """
+        try:
+            state = await context.storage_state()
+        except Exception as e:
+            logger.warning(f"Skipping context recycle for {provider_name}: {e}")
+            slot = self._providers[provider_name]
+            slot.usage = 0
+            slot.created_at = time.monotonic()
+            return context
+
+        await self.close_context(provider_name)
+        context = await self.get_context(provider_name, viewport, locale)
+        cookies = state.get("cookies", [])
+        if cookies:
+            await context.add_cookies(cookies)
+        logger.info(f"Recycled context for {provider_name}", cookie_count=len(cookies))
+        return context
+
+    async def release_page(self, provider_name: str, page: Any) -> None:
+        """
+        Return a page from get_page() for reuse by the same provider.
+
+        The page is reset to about:blank. Callers must remove any event
+        listeners they added. Pages that fail to reset or reached
+        MAX_PAGE_REUSES are closed instead of being kept, as are pages whose
+        provider context has since been closed or that would grow the idle
+        list beyond MAX_IDLE_PAGES.
 
-        # Apply anti-detection to page
-        if STEALTH_AVAILABLE:
+        Args:
+            provider_name: Provider the page was obtained for
+            page: Page to release
+        """
+        slot = self._providers.get(provider_name)
+        if slot is not None:
+            slot.checked_out.discard(page)
+
+        if page.is_closed():
+            self._page_reuses.pop(page, None)
+            return
+
+        reuses = self._page_reuses.get(page, 0) + 1
+        if (
+            slot is not None
+            and slot.valid
+            and reuses <= self.MAX_PAGE_REUSES
+            and len(slot.idle_pages) < self.MAX_IDLE_PAGES
+        ):
             try:
-                await stealth_async(page)
-            except Exception:
-                pass  # Continue without stealth
+                await page.goto("about:blank")
+            except Exception as e:
+                logger.debug(f"Failed to reset page for {provider_name}: {e}")
+            else:
+                # Re-check: other releases may have filled the list during goto
+                if len(slot.idle_pages) < self.MAX_IDLE_PAGES:
+                    self._page_reuses[page] = reuses
+                    slot.idle_pages.append(page)
+                    return
 
-        return context, page
+        self._page_reuses.pop(page, None)
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Failed to close page for {provider_name}: {e}")
 
     async def preload_context(
         self,
@@ -223,6 +571,9 @@ class BrowserPool:
         """
         Preload context with cookies.
 
+        Expired cookies are dropped before injection; add_cookies is
+        skipped entirely when none remain.
+
         Args:
             provider_name: Provider identifier
             cookies: List of cookie dictionaries
@@ -231,67 +582,148 @@ class BrowserPool:
             BrowserContext with injected cookies
         """
         context = await self.get_context(provider_name)
-        await context.add_cookies(cookies)
-        logger.info(f"Preloaded context for {provider_name}", cookie_count=len(cookies))
+        live_cookies = _drop_expired_cookies(cookies)
+        if live_cookies:
+            await context.add_cookies(live_cookies)
+        logger.info(
+            f"Preloaded context for {provider_name}",
+            cookie_count=len(live_cookies),
+            expired_count=len(cookies) - len(live_cookies),
+        )
         return context
 
+    async def preload_contexts(
+        self,
+        specs: list[tuple[str, list[dict[str, Any]]]],
+    ) -> dict[str, BrowserContext | BaseException]:
+        """
+        Preload several provider contexts concurrently.
+
+        Context creation and cookie injection for different providers
+        overlap instead of running one provider at a time.
+
+        Args:
+            specs: (provider name, cookies) pairs
+
+        Returns:
+            Mapping of provider name to its context, or to the exception
+            that prevented preloading it
+        """
+        # Initialize once up front so concurrent get_context calls don't race
+        if not self._initialized:
+            await self.initialize(self.headless)
+
+        results = await asyncio.gather(
+            *(self.preload_context(name, cookies) for name, cookies in specs),
+            return_exceptions=True,
+        )
+        return {name: result for (name, _), result in zip(specs, results, strict=True)}
+
     async def close_context(self, provider_name: str) -> None:
         """Close specific provider context."""
-        if provider_name in self._contexts:
-            context = self._contexts[provider_name]
-            if context:
-                try:
-                    await context.close()
-                    logger.info(f"Closed context for {provider_name}")
-                except Exception as e:
-                    logger.warning(f"Failed to close context for {provider_name}: {e}")
-            del self._contexts[provider_name]
+        # Dropping the slot also discards the lock and counters
+        slot = self._providers.pop(provider_name, None)
+        if slot is None:
+            return
 
-        # FIX: Remove from valid contexts and clean up lock
-        self._valid_contexts.discard(provider_name)
-        if provider_name in self._context_locks:
-            del self._context_locks[provider_name]
+        # Idle pages belonged to the closed context
+        for page in slot.idle_pages:
+            self._page_reuses.pop(page, None)
+
+        if slot.context:
+            try:
+                await slot.context.close()
+                logger.info(f"Closed context for {provider_name}")
+            except Exception as e:
+                logger.warning(f"Failed to close context for {provider_name}: {e}")
 
     async def close_all(self) -> None:
         """
         Close all contexts and browser.
 
         Implements graceful cleanup with error handling and subprocess termination.
+        Safe to call concurrently (e.g. signal handler and atexit) and repeatedly;
+        calls after the first find nothing left to close and return.
+
+        While BrowserManagers still borrow the browser only the pool's own
+        contexts are closed; the browser and driver stay up for them and
+        the last release_browser() finishes the shutdown.
         """
-        logger.debug("[BrowserPool] Starting close_all() cleanup")
-        cleanup_errors = []
+        # Per-instance lock: get_instance() holds the class lock while
+        # initialize() may call close_all() to clean up a failed launch
+        async with self._close_lock:
+            if (
+                not self._initialized
+                and self._browser is None
+                and self._playwright is None
+                and not self._providers
+            ):
+                return
+            if self._borrowers:
+                errors = await self._close_contexts()
+                if errors:
+                    logger.warning(f"BrowserPool cleanup had errors: {errors}")
+                logger.debug("[BrowserPool] Browser kept open for borrowers")
+                return
+            self._initialized = False
+            await self._close_all()
+
+    async def _close_contexts(self) -> list[str]:
+        """
+        Close the pool's contexts in one concurrent batch and forget them.
 
-        # Close all contexts first
-        logger.debug(f"[BrowserPool] Closing {len(self._contexts)} contexts")
-        for provider_name, context in self._contexts.items():
-            if context:
-                try:
-                    await context.close()
-                    logger.debug(f"[BrowserPool] Closed context for {provider_name}")
-                except Exception as e:
-                    cleanup_errors.append(f"{provider_name}: {e}")
-                    logger.debug(f"[BrowserPool] Error closing {provider_name}: {e}")
+        Untracked browser contexts (e.g. left behind by former borrowers)
+        are closed in the same batch, unless a borrower is still active and
+        may own them. A context that hangs is left for browser.close(). A
+        browser shared over CDP also holds other processes' contexts, so
+        only ours are closed.
 
-        self._contexts.clear()
-        self._valid_contexts.clear()  # Clear valid contexts tracking
-        self._context_locks.clear()  # Clear locks too
+        Returns:
+            Errors raised while closing, one message per context
+        """
+        cleanup_errors = []
+        open_contexts = [
+            (name, slot.context) for name, slot in self._providers.items() if slot.context
+        ]
+        if self._browser and not self._over_cdp and not self._borrowers:
+            tracked = {id(ctx) for _, ctx in open_contexts}
+            open_contexts.extend(
+                ("untracked context", ctx)
+                for ctx in self._browser.contexts
+                if id(ctx) not in tracked
+            )
+        logger.debug(f"[BrowserPool] Closing {len(open_contexts)} contexts")
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(ctx.close(), self.CONTEXT_CLOSE_TIMEOUT)
+                for _, ctx in open_contexts
+            ),
+            return_exceptions=True,
+        )
+        for (provider_name, _), result in zip(open_contexts, results, strict=True):
+            if isinstance(result, TimeoutError):
+                logger.debug(f"[BrowserPool] Timed out closing {provider_name}")
+            elif isinstance(result, BaseException):
+                cleanup_errors.append(f"{provider_name}: {result}")
+                logger.debug(f"[BrowserPool] Error closing {provider_name}: {result}")
+            else:
+                logger.debug(f"[BrowserPool] Closed context for {provider_name}")
+
+        self._providers.clear()  # Contexts, locks and counters
+        self._page_reuses.clear()
         logger.debug("[BrowserPool] Contexts and locks cleared")
+        return cleanup_errors
+
+    async def _close_all(self) -> None:
+        """Tear down contexts, browser and driver; close_all() holds the close lock."""
+        logger.debug("[BrowserPool] Starting close_all() cleanup")
+        cleanup_errors = await self._close_contexts()
 
-        # Close browser
+        # Close browser; over CDP this only disconnects from it
         if self._browser:
             try:
-                # Close all pages in the browser first (helps with subprocess cleanup)
-                contexts = self._browser.contexts
-                logger.debug(f"[BrowserPool] Closing {len(contexts)} browser contexts")
-                for ctx in contexts:
-                    try:
-                        await ctx.close()
-                    except Exception:
-                        pass
                 logger.debug("[BrowserPool] Closing browser")
                 await self._browser.close()
-                # Allow subprocess transports to close gracefully
-                await asyncio.sleep(0.1)
                 logger.debug("[BrowserPool] Browser closed")
             except Exception as e:
                 cleanup_errors.append(f"browser: {e}")
@@ -302,14 +734,17 @@ class BrowserPool:
         if self._playwright:
             try:
                 logger.debug("[BrowserPool] Stopping playwright")
+                # Returns once the driver process has exited (stop() awaits the
+                # transport, which waits on the subprocess), so no drain delay
                 await self._playwright.stop()
-                # Allow subprocess transports to fully close before event loop cleanup
-                await asyncio.sleep(0.1)
                 logger.debug("[BrowserPool] Playwright stopped")
             except Exception as e:
                 cleanup_errors.append(f"playwright: {e}")
                 logger.debug(f"[BrowserPool] Error stopping playwright: {e}")
             self._playwright = None
+        # The driver has exited; its PID may be reused by another process
+        self._driver_pid = None
+        self._driver_start_ticks = None
 
         # NOTE: Skip subprocess termination during close_all()
         # OS automatically terminates child processes when parent exits.
@@ -339,21 +774,26 @@ class BrowserPool:
 
         This is a safety measure for orphaned Chromium processes.
         Uses psutil if available, otherwise attempts signal-based termination.
+        A browser reached over CDP is not ours to terminate.
         """
+        if self._over_cdp:
+            return
+
         try:
             import psutil
 
-            current_process = psutil.Process()
-            children = current_process.children(recursive=True)
-
-            browser_procs = []
-            for child in children:
-                try:
-                    name = child.name().lower()
-                    if "chromium" in name or "chrome" in name or "chrome.exe" in name:
-                        browser_procs.append(child)
-                except Exception:
-                    pass
+            if self._driver_pid is not None:
+                browser_procs = self._browser_processes(psutil)
+            else:
+                # Driver PID unknown: match every descendant by name
+                browser_procs = []
+                for child in psutil.Process().children(recursive=True):
+                    try:
+                        name = child.name().lower()
+                        if "chromium" in name or "chrome" in name or "chrome.exe" in name:
+                            browser_procs.append(child)
+                    except Exception:
+                        pass
 
             if browser_procs:
                 # Try graceful termination first
@@ -384,39 +824,97 @@ class BrowserPool:
         except Exception as e:
             logger.debug(f"Subprocess termination warning: {e}")
 
+    def _browser_processes(self, psutil: Any) -> list[Any]:
+        """
+        Collect the processes running beneath the Playwright driver.
+
+        Args:
+            psutil: The psutil module
+
+        Returns:
+            psutil.Process objects for the browser processes
+        """
+        try:
+            driver = psutil.Process(self._driver_pid)
+            # A newer process means the recorded PID has been reused
+            if driver.create_time() > self._driver_started_at:
+                return []
+            return driver.children(recursive=True)
+        except psutil.Error:
+            return []  # Driver already exited
+
+    def _browser_pids(self) -> list[int]:
+        """
+        Collect browser process PIDs from /proc for the signal fallback.
+
+        Returns:
+            PIDs beneath the Playwright driver; if its PID is unknown, the
+            descendants of this process whose name matches the browser
+        """
+        if self._driver_pid is not None:
+            # A different start time means the recorded PID has been reused
+            if _process_start_ticks(self._driver_pid) != self._driver_start_ticks:
+                return []
+            return _descendant_pids(self._driver_pid)
+        # Driver PID unknown: match by name so the driver and unrelated
+        # children of this process are spared
+        return [pid for pid in _descendant_pids() if _is_browser_process(pid)]
+
     async def _signal_terminate_subprocesses(self) -> None:
         """
         Fallback subprocess termination using OS signals.
 
-        Used when psutil is not available.
+        Used when psutil is not available. The processes beneath the
+        Playwright driver (or, if its PID is unknown, descendants named like
+        Chrome or Chromium) are found through /proc, sent SIGTERM, and sent
+        SIGKILL if still present after a grace period. Without /proc (e.g.
+        Windows) nothing is signalled.
         """
-        import os
+        # Scanning /proc reads every process on the host; keep it off the loop
+        pids = await asyncio.to_thread(self._browser_pids)
+        if not pids:
+            return
 
-        try:
-            # Send SIGTERM to process group (Unix) or current process (Windows)
-            if hasattr(signal, "SIGTERM"):
-                # Unix-like systems
-                os.killpg(os.getpgid(0), signal.SIGTERM)
-            else:
-                # Windows - can't easily kill process group without psutil
+        # Signal the children individually; signalling our own process
+        # group would terminate this process as well
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
                 pass
-        except Exception:
-            pass
+
+        # Same grace period as the psutil path, then escalate
+        await asyncio.sleep(0.5)
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass  # Already exited
+
+    @classmethod
+    def instance_exists(cls) -> bool:
+        """Check whether the singleton has been created, without creating it."""
+        return cls._instance is not None
 
     @property
     def is_initialized(self) -> bool:
         """Check if pool is initialized."""
         return self._initialized
 
+    @property
+    def playwright(self) -> Playwright | None:
+        """Playwright driver the pooled browser runs on."""
+        return self._playwright
+
     @property
     def context_count(self) -> int:
         """Get number of active contexts."""
-        return len(self._valid_contexts)
+        return sum(slot.valid for slot in self._providers.values())
 
     @property
     def active_contexts(self) -> list[str]:
         """Get list of active provider names."""
-        return list(self._valid_contexts)
+        return [name for name, slot in self._providers.items() if slot.valid]
 
 
 async def reset_pool() -> None:
@@ -424,4 +922,3 @@ async def reset_pool() -> None:
     if BrowserPool._instance:
         await BrowserPool._instance.close_all()
     BrowserPool._instance = None
-    BrowserPool._lock = asyncio.Lock()
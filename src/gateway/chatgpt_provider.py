@@ -4,7 +4,10 @@ ChatGPT provider implementation.
 Uses Playwright to interact with chat.openai.com.
 """
 
+import asyncio
+from functools import cached_property
 from pathlib import Path
+from typing import Any
 
 from core.models import AgentType
 from gateway.base import BaseProvider, GatewayRequest, GatewayResponse
@@ -27,6 +30,14 @@ class ChatGPTProvider(BaseProvider):
     DEFAULT_AUTH_SELECTOR = '#prompt-textarea, [contenteditable="true"], textarea'
     LOGIN_TIMEOUT = 300  # 5 minutes
 
+    _SELECTOR_CACHES = (*BaseProvider._SELECTOR_CACHES, "_auth_selector")
+
+    # Session check waits for the auth element in slices, so a redirect to
+    # the login page ends the check without waiting out the full timeout
+    SESSION_CHECK_TIMEOUT = 20000  # ms
+    SESSION_CHECK_SLICE = 2000  # ms
+    LOGIN_URL_MARKERS = ("/auth/login", "auth.openai.com")
+
     def __init__(
         self,
         profile_dir: Path,
@@ -37,6 +48,11 @@ class ChatGPTProvider(BaseProvider):
         self.base_url = "https://chat.openai.com"
         self._storage = CookieStorage(profile_dir)
 
+    @cached_property
+    def _auth_selector(self) -> str:
+        """Chat input selector marking a logged-in page, resolved once per instance."""
+        return self.get_selector("chat_input", optional=True) or self.DEFAULT_AUTH_SELECTOR
+
     async def send_message(self, request: GatewayRequest) -> GatewayResponse:
         """
         Send message to ChatGPT.
@@ -53,7 +69,7 @@ class ChatGPTProvider(BaseProvider):
 
         try:
             # Load cookies from storage
-            cookies = self._storage.load_cookies()
+            cookies = await asyncio.to_thread(self._storage.load_cookies)
 
             # Get browser manager
             browser_manager = await self.get_browser_manager()
@@ -89,12 +105,10 @@ class ChatGPTProvider(BaseProvider):
                     pass
 
             # Get selectors from configuration
-            chat_input_selector = self.get_selector("chat_input", optional=True)
-            if chat_input_selector is None:
-                chat_input_selector = self.DEFAULT_AUTH_SELECTOR
-
-            send_button_selector = self.get_selector("send_button", optional=True)
-            response_container_selector = self.get_selector("response_container", optional=True)
+            chat_input_selector = self._auth_selector
+            send_button_selector, response_container_selector = self.get_selectors(
+                "send_button", "response_container", optional=True
+            )
 
             # Wait for chat input to be available
             try:
@@ -235,7 +249,7 @@ class ChatGPTProvider(BaseProvider):
         """
         try:
             # Load cookies from storage
-            cookies = self._storage.load_cookies()
+            cookies = await asyncio.to_thread(self._storage.load_cookies)
 
             # Get browser manager
             browser_manager = await self.get_browser_manager()
@@ -252,29 +266,17 @@ class ChatGPTProvider(BaseProvider):
                 timeout=30000,
             )
 
-            # Get auth selector (prefer selector_loader, fallback to default)
-            auth_selector = self.get_selector("chat_input", optional=True)
-            if auth_selector is None:
-                auth_selector = self.DEFAULT_AUTH_SELECTOR
-
             # Check for authentication element
-            try:
-                await page.wait_for_selector(
-                    auth_selector,
-                    timeout=20000,
-                )
-                is_valid = True
-            except Exception:
-                is_valid = False
+            is_valid = await self._wait_for_auth(page)
 
             # Close browser
             await browser_manager.close()
 
             # Update metadata
             if is_valid:
-                self._storage.mark_validated()
+                await asyncio.to_thread(self._storage.mark_validated)
             else:
-                self._storage.mark_invalid()
+                await asyncio.to_thread(self._storage.mark_invalid)
 
             return is_valid
 
@@ -285,6 +287,29 @@ class ChatGPTProvider(BaseProvider):
             # Any error means session is invalid
             return False
 
+    async def _wait_for_auth(self, page: Any) -> bool:
+        """
+        Wait for the authentication element, giving up early on a login redirect.
+
+        Args:
+            page: Page navigated to ChatGPT
+
+        Returns:
+            True if the auth element appeared, False otherwise
+        """
+        for _ in range(self.SESSION_CHECK_TIMEOUT // self.SESSION_CHECK_SLICE):
+            if any(marker in page.url for marker in self.LOGIN_URL_MARKERS):
+                return False
+            try:
+                await page.wait_for_selector(
+                    self._auth_selector,
+                    timeout=self.SESSION_CHECK_SLICE,
+                )
+                return True
+            except Exception:
+                pass
+        return False
+
     async def login_flow(self) -> None:
         """
         Execute ChatGPT login flow.
@@ -321,10 +346,7 @@ class ChatGPTProvider(BaseProvider):
 
         # Wait for user to complete login
         # Detect successful login by waiting for auth element
-        # Get auth selector (prefer selector_loader, fallback to default)
-        auth_selector = self.get_selector("chat_input", optional=True)
-        if auth_selector is None:
-            auth_selector = self.DEFAULT_AUTH_SELECTOR
+        auth_selector = self._auth_selector
 
         try:
             await page.wait_for_selector(
@@ -341,7 +363,7 @@ class ChatGPTProvider(BaseProvider):
                 cookie_count=len(cookies),
                 login_method="manual",
             )
-            self._storage.save_cookies(cookies, metadata)
+            await asyncio.to_thread(self._storage.save_cookies, cookies, metadata)
 
         except Exception as exc:
             raise RuntimeError(f"Login flow failed: {exc}") from exc
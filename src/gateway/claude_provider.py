@@ -61,7 +61,7 @@ class ClaudeProvider(BaseProvider):
 
         try:
             # Load cookies from storage
-            cookies = self._storage.load_cookies()
+            cookies = await asyncio.to_thread(self._storage.load_cookies)
 
             # Get browser manager
             browser_manager = await self.get_browser_manager()
@@ -96,13 +96,12 @@ class ClaudeProvider(BaseProvider):
                     pass
 
             # Get selectors from selector_loader
-            chat_input_selector = self.get_selector("chat_input", optional=True)
+            chat_input_selector, send_button_selector, response_selector = self.get_selectors(
+                "chat_input", "send_button", "response_container", optional=True
+            )
             if chat_input_selector is None:
                 chat_input_selector = self.DEFAULT_AUTH_SELECTOR
 
-            send_button_selector = self.get_selector("send_button", optional=True)
-            response_selector = self.get_selector("response_container", optional=True)
-
             # Wait for chat input to be available
             await page.wait_for_selector(
                 chat_input_selector,
@@ -231,7 +230,7 @@ class ClaudeProvider(BaseProvider):
         """
         try:
             # Load cookies from storage
-            cookies = self._storage.load_cookies()
+            cookies = await asyncio.to_thread(self._storage.load_cookies)
 
             # Get browser manager
             browser_manager = await self.get_browser_manager()
@@ -268,9 +267,9 @@ class ClaudeProvider(BaseProvider):
 
             # Update metadata
             if is_valid:
-                self._storage.mark_validated()
+                await asyncio.to_thread(self._storage.mark_validated)
             else:
-                self._storage.mark_invalid()
+                await asyncio.to_thread(self._storage.mark_invalid)
 
             return is_valid
 
@@ -336,7 +335,7 @@ class ClaudeProvider(BaseProvider):
                 cookie_count=len(cookies),
                 login_method="manual",
             )
-            self._storage.save_cookies(cookies, metadata)
+            await asyncio.to_thread(self._storage.save_cookies, cookies, metadata)
 
         except Exception as exc:
             raise RuntimeError(f"Login flow failed: {exc}") from exc
@@ -54,7 +54,7 @@ class GeminiProvider(BaseProvider):
 
         try:
             # Load stored cookies
-            cookies = self._storage.load_cookies()
+            cookies = await asyncio.to_thread(self._storage.load_cookies)
 
             # Get browser manager
             browser_manager = await self.get_browser_manager()
@@ -78,15 +78,17 @@ class GeminiProvider(BaseProvider):
             await asyncio.sleep(2)
 
             # Get selectors for Gemini
-            chat_input_selector = self.get_selector("chat_input", optional=True)
+            chat_input_selector, send_button_selector, response_container_selector = (
+                self.get_selectors(
+                    "chat_input", "send_button", "response_container", optional=True
+                )
+            )
             if chat_input_selector is None:
                 chat_input_selector = self.DEFAULT_AUTH_SELECTOR
 
-            send_button_selector = self.get_selector("send_button", optional=True)
             if send_button_selector is None:
                 send_button_selector = "button[aria-label='Send'], button[aria-label='send']"
 
-            response_container_selector = self.get_selector("response_container", optional=True)
             if response_container_selector is None:
                 response_container_selector = ".model-response, .response-container, .conversation-turn, [data-testid*='response']"
 
@@ -187,7 +189,7 @@ class GeminiProvider(BaseProvider):
         """
         try:
             # Load cookies from storage
-            cookies = self._storage.load_cookies()
+            cookies = await asyncio.to_thread(self._storage.load_cookies)
 
             # Get browser manager
             browser_manager = await self.get_browser_manager()
@@ -224,9 +226,9 @@ class GeminiProvider(BaseProvider):
 
             # Update metadata
             if is_valid:
-                self._storage.mark_validated()
+                await asyncio.to_thread(self._storage.mark_validated)
             else:
-                self._storage.mark_invalid()
+                await asyncio.to_thread(self._storage.mark_invalid)
 
             return is_valid
 
@@ -292,7 +294,7 @@ class GeminiProvider(BaseProvider):
                 cookie_count=len(cookies),
                 login_method="manual",
             )
-            self._storage.save_cookies(cookies, metadata)
+            await asyncio.to_thread(self._storage.save_cookies, cookies, metadata)
 
         except Exception as exc:
             raise RuntimeError(f"Login flow failed: {exc}") from exc
@@ -4,12 +4,17 @@ Data models for gateway module.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Messages are built once and only read afterwards
+_MODEL_CONFIG = ConfigDict(frozen=True)
 
 
 class GatewayRequest(BaseModel):
     """Request to send to AI provider."""
 
+    model_config = _MODEL_CONFIG
+
     task_name: str
     prompt: str
     max_tokens: int | None = None
@@ -19,6 +24,8 @@ class GatewayRequest(BaseModel):
 class GatewayResponse(BaseModel):
     """Response from AI provider."""
 
+    model_config = _MODEL_CONFIG
+
     content: str
     success: bool
     error: str | None = None
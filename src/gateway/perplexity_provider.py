@@ -53,7 +53,7 @@ class PerplexityProvider(BaseProvider):
 
         try:
             # Load cookies from storage
-            cookies = self._storage.load_cookies()
+            cookies = await asyncio.to_thread(self._storage.load_cookies)
 
             # Get browser manager
             browser_manager = await self.get_browser_manager()
@@ -174,7 +174,7 @@ class PerplexityProvider(BaseProvider):
         """
         try:
             # Load cookies from storage
-            cookies = self._storage.load_cookies()
+            cookies = await asyncio.to_thread(self._storage.load_cookies)
 
             # Get browser manager
             browser_manager = await self.get_browser_manager()
@@ -211,9 +211,9 @@ class PerplexityProvider(BaseProvider):
 
             # Update metadata
             if is_valid:
-                self._storage.mark_validated()
+                await asyncio.to_thread(self._storage.mark_validated)
             else:
-                self._storage.mark_invalid()
+                await asyncio.to_thread(self._storage.mark_invalid)
 
             return is_valid
 
@@ -279,7 +279,7 @@ class PerplexityProvider(BaseProvider):
                 cookie_count=len(cookies),
                 login_method="manual",
             )
-            self._storage.save_cookies(cookies, metadata)
+            await asyncio.to_thread(self._storage.save_cookies, cookies, metadata)
 
         except Exception as exc:
             raise RuntimeError(f"Login flow failed: {exc}") from exc
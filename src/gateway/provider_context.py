@@ -9,17 +9,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from playwright.async_api import BrowserContext, Page
-
-try:
-    from playwright_stealth import stealth_async
-    STEALTH_AVAILABLE = True
-except ImportError:
-    STEALTH_AVAILABLE = False
-
 from core.logger import get_logger
 
 if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
     from gateway.browser_pool import BrowserPool
 
 logger = get_logger(__name__)
@@ -129,25 +123,22 @@ class ProviderContext:
         """
         Get or create page with anti-detection.
 
+        The page comes from BrowserPool.get_page(), so a page released by
+        an earlier close() is reused when the pool has one idle.
+
         Returns:
-            Page instance with stealth applied
+            Page instance; stealth comes from the pool context's init script
         """
-        context = await self.get_context()
-
         # Return existing page if available
         if self._page and not self._page.is_closed():
             return self._page
 
-        # Create new page
-        self._page = await context.new_page()
+        if self._pool is None:
+            from gateway.browser_pool import BrowserPool
+
+            self._pool = await BrowserPool.get_instance(headless=self._headless)
 
-        # Apply stealth
-        if STEALTH_AVAILABLE:
-            try:
-                await stealth_async(self._page)
-                logger.debug(f"Applied stealth to page for {self.provider_name}")
-            except Exception as e:
-                logger.warning(f"Stealth application failed for {self.provider_name}: {e}")
+        self._context, self._page = await self._pool.get_page(self.provider_name)
 
         return self._page
 
@@ -176,21 +167,24 @@ class ProviderContext:
 
     async def close(self) -> None:
         """
-        Close provider page (context managed by pool).
+        Release provider page back to the pool (context managed by pool).
         """
-        if self._page and not self._page.is_closed():
-            try:
-                # Wait for page to be idle before closing (helps with pending operations)
+        page, self._page = self._page, None
+        if page is None or self._pool is None:
+            return
+
+        try:
+            if not page.is_closed():
+                # Wait for page to be idle before releasing (helps with pending operations)
                 try:
-                    await self._page.wait_for_load_state("domcontentloaded", timeout=1000)
+                    await page.wait_for_load_state("domcontentloaded", timeout=1000)
                 except Exception:
-                    pass  # Ignore timeout, proceed with close
-                await self._page.close()
-                self._page = None
-                logger.debug(f"Closed page for {self.provider_name}")
-            except Exception as e:
-                logger.warning(f"Failed to close page for {self.provider_name}: {e}")
-                self._page = None  # Clear reference even if close failed
+                    pass  # Ignore timeout, proceed with release
+            # Closed pages are released too, so the pool stops tracking them
+            await self._pool.release_page(self.provider_name, page)
+            logger.debug(f"Released page for {self.provider_name}")
+        except Exception as e:
+            logger.warning(f"Failed to release page for {self.provider_name}: {e}")
 
     async def get_url(self, url: str, wait_until: str = "domcontentloaded", timeout: int = 60000) -> Page:
         """
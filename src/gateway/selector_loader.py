@@ -144,6 +144,21 @@ class SelectorLoader:
         self._config = config
         return config
 
+    def get_config(self) -> SelectorConfig:
+        """
+        Return the parsed configuration, loading it on first use.
+
+        Unlike load(), this does not re-read the file once a configuration
+        is cached, so every consumer of this loader shares one parse.
+        Call reload() to pick up file changes.
+
+        Returns:
+            Cached or newly loaded SelectorConfig
+        """
+        if self._config is not None:
+            return self._config
+        return self.load()
+
     def _validate_required_selectors(self, config: SelectorConfig) -> None:
         """
         Validate that all providers have required selectors.
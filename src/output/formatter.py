@@ -39,6 +39,14 @@ class FileExporter:
         logger.info(f"Saved JSON: {file_path}")
         return file_path
 
+    def save_json_text(self, filename: str, text: str) -> Path:
+        """Save already-serialized JSON text as a JSON file."""
+        file_path = self.output_dir / f"{filename}.json"
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        logger.info(f"Saved JSON: {file_path}")
+        return file_path
+
     def save_markdown(self, filename: str, content: str) -> Path:
         """Save content as markdown file."""
         file_path = self.output_dir / f"{filename}.md"
@@ -1,5 +1,6 @@
 """Pipeline orchestration modules."""
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,7 @@ from core.models import (
     PipelineState,
     create_phase_result,
 )
+from gateway.base import USE_BROWSER_POOL
 from gateway.session import SessionManager
 from output.formatter import FileExporter, MarkdownFormatter
 from pipeline.base import BasePhase
@@ -138,7 +140,7 @@ class PipelineOrchestrator:
     def _save_pipeline_state(self, exporter: FileExporter | None, session: PipelineSession) -> None:
         if exporter is None:
             return
-        exporter.save_json("pipeline_state", session.model_dump(mode="json"))
+        exporter.save_json_text("pipeline_state", session.to_checkpoint_json())
 
     def _generate_final_document(
         self,
@@ -252,7 +254,7 @@ class PipelineOrchestrator:
                     provider = last_result.ai_responses[0].agent_name.value
 
             # Check if summarization is needed
-            should_summarize = self.context_summary.should_summarize_before_phase(
+            should_summarize = await self.context_summary.should_summarize_before_phase_async(
                 session_results=session.results,
                 current_phase=phase_number,
                 provider=provider,
@@ -295,11 +297,10 @@ class PipelineOrchestrator:
                     if self.ui_logger:
                         self.ui_logger.warning(f"Context summarization failed: {summary_result.error}")
             else:
-                # Log token usage even if not summarizing
-                from context.tokenizer import TokenCounter
-
-                context = self.context_summary._extract_context_from_results(session.results)
-                token_result = TokenCounter().count(context, model_name=provider)
+                # Log token usage even if not summarizing (reuses the check's count)
+                token_result = self.context_summary.count_context_tokens(
+                    session.results, phase_number
+                )
                 percentage_used = token_result.get_percentage_used(provider)
 
                 logger.debug(
@@ -458,12 +459,9 @@ class PipelineOrchestrator:
                 self.ui_logger.info(f"Starting pipeline for topic: {config.topic}")
 
         try:
-            # Import here to avoid circular dependency
-            import os
-
             # Initialize BrowserPool if enabled
             browser_pool = None
-            if os.getenv("AIGENFLOW_USE_BROWSER_POOL", "true").lower() == "true":
+            if USE_BROWSER_POOL:
                 from gateway.browser_pool import BrowserPool
 
                 try:
@@ -479,6 +477,7 @@ class PipelineOrchestrator:
             if browser_pool and hasattr(self.session_manager, '_providers'):
                 from gateway.cookie_storage import CookieStorage
 
+                preload_specs = []
                 for provider_name, provider in self.session_manager._providers.items():
                     try:
                         # Load cookies from storage
@@ -486,12 +485,22 @@ class PipelineOrchestrator:
                         if profile_dir:
                             storage = CookieStorage(profile_dir)
                             if storage.session_exists():
-                                cookies = storage.load_cookies()
-                                await browser_pool.preload_context(provider_name, cookies)
-                                logger.info(f"Preloaded context for {provider_name}")
+                                cookies = await asyncio.to_thread(storage.load_cookies)
+                                preload_specs.append((provider_name, cookies))
                     except Exception as e:
                         logger.warning(f"Failed to preload context for {provider_name}: {e}")
 
+                # Create all provider contexts concurrently
+                if preload_specs:
+                    preloaded = await browser_pool.preload_contexts(preload_specs)
+                    for provider_name, outcome in preloaded.items():
+                        if isinstance(outcome, BaseException):
+                            logger.warning(
+                                f"Failed to preload context for {provider_name}: {outcome}"
+                            )
+                        else:
+                            logger.info(f"Preloaded context for {provider_name}")
+
             for phase_num in range(start_phase, TOTAL_PHASES + 1):
                 result = await self.execute_phase(session, phase_num)
                 session.add_result(result)
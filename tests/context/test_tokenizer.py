@@ -4,6 +4,7 @@ Tests for TokenCounter.
 Tests follow TDD principles: written before implementation.
 """
 
+import pytest
 
 from src.context.tokenizer import (
     ModelLimits,
@@ -40,6 +41,26 @@ class TestModelLimits:
         limits = ModelLimits()
         assert limits.get_limit("unknown") == 100000
 
+    def test_method_name_is_not_a_provider(self) -> None:
+        """Test that non-field attributes fall back to the default limit."""
+        limits = ModelLimits()
+        assert limits.get_limit("get_limit") == 100000
+
+    def test_instance_override(self) -> None:
+        """Test that per-instance limits are honoured."""
+        limits = ModelLimits(claude=1000)
+        assert limits.get_limit("Claude") == 1000
+
+    def test_agent_type_provider(self) -> None:
+        """Test that AgentType members resolve like their names."""
+        from src.core.models import AgentType
+
+        limits = ModelLimits()
+        assert limits.get_limit(AgentType.GEMINI) == 1000000
+
+        result = TokenCountResult(total_tokens=64000, estimated=True, model_name="chatgpt")
+        assert result.get_percentage_used(AgentType.CHATGPT) == 50.0
+
 
 class TestTokenCountResult:
     """Test suite for TokenCountResult."""
@@ -55,6 +76,14 @@ class TestTokenCountResult:
         assert result.estimated is True
         assert result.model_name == "claude"
 
+    def test_breakdown_defaults_to_none(self) -> None:
+        """Test that results carry no per-instance dict or breakdown by default."""
+        result = TokenCountResult(total_tokens=10, estimated=False, model_name="claude")
+
+        assert result.breakdown is None
+        assert result.get_breakdown() == {}
+        assert not hasattr(result, "__dict__")
+
     def test_percentage_used(self) -> None:
         """Test percentage calculation."""
         result = TokenCountResult(
@@ -143,6 +172,29 @@ This is a paragraph.
         result = counter.count_dict(data, model_name="claude")
         assert result.total_tokens > 0
 
+    def test_count_dict_estimate_matches_json_length(self) -> None:
+        """Test that the dict estimate matches the serialized JSON length."""
+        import json
+
+        from src.context.tokenizer import _dumps_compact, _estimate_json_chars
+
+        data = {
+            "title": "Plan",
+            "count": 42,
+            "ratio": 0.5,
+            "flags": [True, False, None],
+            "nested": {"items": ("a", "bc"), "empty": {}, "none": []},
+            3: "int key",
+        }
+        compact = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        assert _dumps_compact(data) == compact
+        assert _estimate_json_chars(data) == len(compact)
+
+        counter = TokenCounter()
+        result = counter.count_dict(data, estimate_only=True)
+        assert result.estimated is True
+        assert result.total_tokens == len(compact) // 4
+
     def test_estimate_mode(self) -> None:
         """Test estimation mode when tiktoken not available."""
         counter = TokenCounter()
@@ -150,6 +202,19 @@ This is a paragraph.
         result = counter.count(text, model_name="claude", estimate_only=True)
         assert result.estimated is True
 
+    def test_whitespace_heuristic(self) -> None:
+        """Test the whitespace-based estimate."""
+        counter = TokenCounter(heuristic="whitespace")
+        result = counter.count("one two three\nfour five", estimate_only=True)
+
+        assert result.estimated is True
+        assert result.total_tokens == 5
+
+    def test_unknown_heuristic_rejected(self) -> None:
+        """Test that unsupported heuristics raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown heuristic"):
+            TokenCounter(heuristic="bytes")
+
     def test_count_large_text(self) -> None:
         """Test counting large text."""
         counter = TokenCounter()
@@ -160,6 +225,66 @@ This is a paragraph.
         assert result.total_tokens > 8000
 
 
+    def test_count_many(self) -> None:
+        """Test counting several texts in one call."""
+        counter = TokenCounter()
+        texts = ["Hello world", "", "A longer piece of text to count"]
+        results = counter.count_many(texts, model_name="gemini")
+
+        assert [r.total_tokens for r in results] == [
+            counter.count(text, model_name="gemini").total_tokens for text in texts
+        ]
+        assert all(r.model_name == "gemini" for r in results)
+
+
+    def test_count_many_encodes_in_one_batch(self) -> None:
+        """Test that exact counts for several texts use a single batch encode."""
+        from unittest.mock import MagicMock
+
+        counter = TokenCounter()
+        counter._tiktoken_available = True
+        counter._encoding = MagicMock()
+        counter._encoding.encode_batch.side_effect = lambda texts: [t.split() for t in texts]
+
+        results = counter.count_many(["one two", "", "three four five", "one two"])
+
+        assert [r.total_tokens for r in results] == [2, 0, 3, 2]
+        assert [r.estimated for r in results] == [False, True, False, False]
+        counter._encoding.encode_batch.assert_called_once_with(["one two", "three four five"])
+        counter._encoding.encode.assert_not_called()
+
+    def test_encoding_loaded_lazily(self) -> None:
+        """Test that tiktoken is not resolved until an exact count is needed."""
+        counter = TokenCounter()
+        assert counter._tiktoken_available is None
+
+        counter.count("Some text", estimate_only=True)
+        assert counter._tiktoken_available is None
+
+        counter.count("Some text")
+        assert counter._tiktoken_available is not None
+
+    def test_exact_count_is_memoized(self) -> None:
+        """Test that repeated texts are only encoded once."""
+        from unittest.mock import MagicMock
+
+        counter = TokenCounter()
+        counter._tiktoken_available = True
+        counter._encoding = MagicMock()
+        counter._encoding.encode.side_effect = lambda text: text.split()
+
+        first = counter.count("one two three")
+        second = counter.count("one two three")
+
+        assert first.total_tokens == second.total_tokens == 3
+        assert first.estimated is False
+        assert counter._encoding.encode.call_count == 1
+
+        counter.invalidate()
+        counter.count("one two three")
+        assert counter._encoding.encode.call_count == 2
+
+
 class TestTokenCounterThreshold:
     """Test suite for threshold checking."""
 
@@ -2,15 +2,19 @@
 Tests for core event system.
 """
 
+import threading
+import time
 from datetime import datetime
 
 from core.events import (
     AgentCalledEvent,
     BaseEvent,
+    EventBus,
     EventHandler,
     EventType,
     PhaseStartedEvent,
     PipelineStartedEvent,
+    StateSavedEvent,
     get_event_bus,
 )
 
@@ -45,6 +49,37 @@ class TestEvents:
         assert event.event_type == EventType.AGENT_CALLED
         assert event.data["agent_name"] == "claude"
 
+    def test_make_skips_validation_and_keeps_data(self):
+        """Test that make() builds events from trusted fields without copying data."""
+        data = {"phase_number": 2, "phase_name": "Research"}
+        event = PhaseStartedEvent.make(data=data, session_id="s1")
+
+        assert event.event_type == EventType.PHASE_STARTED
+        assert event.data is data
+        assert event.session_id == "s1"
+        assert isinstance(event.timestamp, datetime)
+        assert event == PhaseStartedEvent(data=data, session_id="s1", timestamp=event.timestamp)
+
+    def test_acquire_reuses_released_event(self):
+        """Test that acquire() re-initializes a released instance."""
+        event = PhaseStartedEvent.acquire(data={"phase_number": 2}, session_id="s1")
+        event.release()
+
+        reused = PhaseStartedEvent.acquire()
+
+        assert reused is event
+        assert reused.data == {"phase_number": 1, "phase_name": ""}
+        assert reused.session_id is None
+        assert AgentCalledEvent.acquire() is not event
+
+    def test_make_builds_default_data(self):
+        """Test that make() fills the per-type default data when omitted."""
+        first = PipelineStartedEvent.make()
+        second = PipelineStartedEvent.make()
+
+        assert first.data == {"config": {"topic": "", "doc_type": "bizplan"}}
+        assert first.data is not second.data
+
 
 class TestEventBus:
     """Tests for EventBus."""
@@ -78,6 +113,54 @@ class TestEventBus:
         assert len(handled_events) == 1
         assert handled_events[0] == event
 
+    def test_subscribe_to_event_types(self):
+        """Test that typed subscriptions only receive matching events."""
+        bus = EventBus()
+        typed_events = []
+        all_events = []
+
+        class TypedHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                typed_events.append(event)
+
+        class AllHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                all_events.append(event)
+
+        bus.subscribe(TypedHandler(), event_types=[EventType.PHASE_STARTED])
+        bus.subscribe(AllHandler())
+
+        started = PipelineStartedEvent()
+        phase = PhaseStartedEvent()
+        bus.publish(started)
+        bus.publish(phase)
+
+        assert typed_events == [phase]
+        assert all_events == [started, phase]
+
+    def test_subscribe_during_publish_applies_to_next_event(self):
+        """Test that handlers added while publishing only see later events."""
+        bus = EventBus()
+        late_events = []
+
+        class LateHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                late_events.append(event)
+
+        class SubscribingHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                if not late_events and len(bus._handlers) == 1:
+                    bus.subscribe(LateHandler())
+
+        bus.subscribe(SubscribingHandler())
+        first = PipelineStartedEvent()
+        bus.publish(first)
+        assert late_events == []
+
+        second = PipelineStartedEvent()
+        bus.publish(second)
+        assert late_events == [second]
+
     def test_handler_error_doesnt_fail_bus(self):
         """Test that handler errors don't stop event bus."""
         bus = get_event_bus()
@@ -109,3 +192,137 @@ class TestEventBus:
         # Failing handler should raise exception silently
         # Tracking handler should still receive event
         assert len(tracking.events) == 1
+
+
+    def test_recycled_events_are_reused(self):
+        """Test that a recycling bus releases events after dispatch."""
+        bus = EventBus(recycle_events=True)
+        seen = []
+
+        class RecordingHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                seen.append(event.data["file_path"])
+
+        bus.subscribe(RecordingHandler())
+        first = StateSavedEvent.acquire(data={"file_path": "a.json"})
+        bus.publish(first)
+        second = StateSavedEvent.acquire(data={"file_path": "b.json"})
+        bus.publish(second)
+
+        assert second is first
+        assert seen == ["a.json", "b.json"]
+
+
+    def test_publish_many_groups_events_by_type(self):
+        """Test publish_many batches per type and falls back to handle()."""
+        bus = EventBus()
+        batches = []
+        singles = []
+
+        class BatchHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                raise AssertionError("handle_batch should be used")
+
+            def handle_batch(self, events: list[BaseEvent]) -> None:
+                batches.append(list(events))
+
+        class SingleHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                singles.append(event)
+
+        bus.subscribe(BatchHandler())
+        bus.subscribe(SingleHandler(), event_types=[EventType.PHASE_STARTED])
+        phase_one = PhaseStartedEvent(data={"phase_number": 1})
+        saved = StateSavedEvent()
+        phase_two = PhaseStartedEvent(data={"phase_number": 2})
+
+        bus.publish_many([phase_one, saved, phase_two])
+
+        assert batches == [[phase_one, phase_two], [saved]]
+        assert singles == [phase_one, phase_two]
+
+class TestAsyncEventBus:
+    """Tests for EventBus with a dispatch thread."""
+
+    def test_publish_does_not_wait_for_handlers(self):
+        """Test that slow handlers run off the publishing thread, in order."""
+        bus = EventBus(asynchronous=True)
+        release = threading.Event()
+        handled = []
+
+        class SlowHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                release.wait(timeout=5)
+                handled.append((event, threading.current_thread()))
+
+        bus.subscribe(SlowHandler())
+        events = [PhaseStartedEvent(data={"phase_number": n}) for n in range(100)]
+
+        started = time.perf_counter()
+        for event in events:
+            bus.publish(event)
+        assert time.perf_counter() - started < 1.0
+        assert handled == []
+
+        release.set()
+        assert bus.flush(timeout=5) is True
+        assert [event for event, _ in handled] == events
+        assert all(thread is not threading.current_thread() for _, thread in handled)
+        bus.close(timeout=5)
+
+    def test_handler_error_is_isolated(self):
+        """Test that a failing handler doesn't stop dispatch to others."""
+        bus = EventBus(asynchronous=True)
+        received = []
+
+        class FailingHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                raise RuntimeError("Handler error")
+
+        class TrackingHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                received.append(event)
+
+        bus.subscribe(FailingHandler())
+        bus.subscribe(TrackingHandler())
+        event = PipelineStartedEvent()
+        bus.publish(event)
+
+        assert bus.flush(timeout=5) is True
+        assert received == [event]
+        bus.close(timeout=5)
+
+    def test_publish_many_dispatches_on_thread(self):
+        """Test that publish_many batches are dispatched by the bus thread."""
+        bus = EventBus(asynchronous=True)
+        batches = []
+
+        class BatchHandler(EventHandler):
+            def handle_batch(self, events: list[BaseEvent]) -> None:
+                batches.append((list(events), threading.current_thread()))
+
+        bus.subscribe(BatchHandler())
+        events = [PipelineStartedEvent() for _ in range(3)]
+        bus.publish_many(events)
+
+        assert bus.flush(timeout=5) is True
+        assert [batch for batch, _ in batches] == [events]
+        assert batches[0][1] is not threading.current_thread()
+        bus.close(timeout=5)
+
+    def test_close_dispatches_queued_events(self):
+        """Test that close drains the queue and stops the thread."""
+        bus = EventBus(asynchronous=True)
+        received = []
+
+        class TrackingHandler(EventHandler):
+            def handle(self, event: BaseEvent) -> None:
+                received.append(event)
+
+        bus.subscribe(TrackingHandler())
+        for _ in range(10):
+            bus.publish(PipelineStartedEvent())
+        bus.close(timeout=5)
+
+        assert len(received) == 10
+        assert not bus._thread.is_alive()
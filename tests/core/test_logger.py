@@ -23,3 +23,94 @@ def test_redact_secrets_masks_long_token_strings():
     assert redacted != raw
     assert redacted.startswith("abcd")
     assert redacted.endswith("6789")
+
+
+def test_redact_secrets_masks_padded_long_token_strings():
+    redacted = redact_secrets("  abcdefghijklmnopqrstuvwxyz0123456789\n")
+
+    assert redacted == "abcd...6789"
+
+
+def test_redact_secrets_returns_unchanged_containers_as_is():
+    payload = {"event": "started", "items": ["a", "b"], "pair": ("x", 1)}
+
+    assert redact_secrets(payload) is payload
+
+
+def test_redact_secrets_copies_only_when_masking():
+    inner = {"password": "hunter2"}
+    payload = {"safe": ["a"], "creds": inner}
+
+    redacted = redact_secrets(payload)
+
+    assert redacted is not payload
+    assert redacted["safe"] is payload["safe"]
+    assert redacted["creds"] == {"password": "***"}
+    assert inner == {"password": "hunter2"}
+
+
+def test_redact_secrets_copies_path_through_tuples():
+    payload = {"calls": [("claude", {"auth": "bearer-abcdefgh"}), ("gemini", {})]}
+
+    redacted = redact_secrets(payload)
+
+    assert redacted == {"calls": [("claude", {"auth": "bear...efgh"}), ("gemini", {})]}
+    assert isinstance(redacted["calls"][0], tuple)
+    assert redacted["calls"][1] is payload["calls"][1]
+    assert payload["calls"][0][1]["auth"] == "bearer-abcdefgh"
+
+
+def test_redact_secrets_handles_deep_nesting():
+    payload = {"password": "hunter2"}
+    for _ in range(5000):
+        payload = {"inner": [payload]}
+
+    redacted = redact_secrets(payload)
+
+    for _ in range(5000):
+        redacted = redacted["inner"][0]
+    assert redacted == {"password": "***"}
+
+
+def test_redact_secrets_replaces_self_references():
+    payload = {"a": 1}
+    payload["self"] = payload
+    items = ["x"]
+    items.append(items)
+
+    assert redact_secrets(payload) == {"a": 1, "self": "<cycle>"}
+    assert redact_secrets(items) == ["x", "<cycle>"]
+    assert payload["self"] is payload
+
+
+def test_redact_secrets_accepts_non_string_keys():
+    payload = {1: [1, 2], (1, 2): (3,), 3: "plain", "items": {2: ["value"]}}
+
+    assert redact_secrets(payload) is payload
+
+
+def test_redact_secrets_keeps_shared_containers():
+    shared = {"name": "abc"}
+    payload = {"first": shared, "second": [shared]}
+
+    assert redact_secrets(payload) is payload
+
+
+def test_redact_secrets_keeps_long_token_runs_followed_by_text():
+    raw = "x" * 200 + " trailing words"
+
+    assert redact_secrets(raw, key_hint="error") is raw
+    assert redact_secrets("  " + "y" * 200 + "  ", key_hint="error") == "yyyy...yyyy"
+
+
+def test_redact_secrets_handles_str_and_container_subclasses():
+    from collections import OrderedDict
+    from enum import StrEnum
+
+    class Token(StrEnum):
+        VALUE = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+    assert redact_secrets(Token.VALUE) == "abcd...6789"
+    redacted = redact_secrets(OrderedDict(api_key="sk-test-super-secret-key", count=3))
+    assert redacted["api_key"] == "sk-t...-key"
+    assert redacted["count"] == 3
@@ -455,6 +455,18 @@ class TestGetLogger:
         # Check that message was logged
         assert "Test message" in caplog.text or True  # Structlog may output differently
 
+    def test_get_logger_reuses_logger_per_name(self):
+        """Test repeated get_logger calls hand back the cached logger."""
+        assert get_logger("cached.module") is get_logger("cached.module")
+        assert get_logger("cached.module") is not get_logger("other.module")
+
+    def test_setup_logging_clears_logger_cache(self):
+        """Test reconfiguring logging drops loggers bound to the old setup."""
+        first = get_logger("cached.module")
+        setup_logging(level="INFO")
+
+        assert get_logger("cached.module") is not first
+
 
 class TestLogContext:
     """Tests for LogContext context manager."""
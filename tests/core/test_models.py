@@ -52,6 +52,12 @@ class TestPipelineConfig:
         with pytest.raises(ValueError):
             PipelineConfig(topic="short")
 
+    def test_topic_is_stripped(self):
+        config = PipelineConfig(topic="  Test topic for business plan  ")
+        assert config.topic == "Test topic for business plan"
+        with pytest.raises(ValueError, match="cannot be empty"):
+            PipelineConfig(topic="   ")
+
 
 class TestPipelineSession:
     def test_create_session(self):
@@ -67,6 +73,54 @@ class TestPipelineSession:
         session.add_result(result)
         assert len(session.results) == 1
 
+    def test_get_phase_result(self):
+        config = PipelineConfig(topic="Test topic")
+        session = PipelineSession(config=config)
+        first = PhaseResult(phase_number=1, phase_name="Ideation", status=PhaseStatus.COMPLETED)
+        retry = PhaseResult(phase_number=1, phase_name="Ideation", status=PhaseStatus.FAILED)
+        session.add_result(first)
+        session.add_result(retry)
+
+        assert session.get_phase_result(1) is first
+        assert session.get_phase_result(2) is None
+
+        # Results appended directly to the list are still found
+        second = PhaseResult(phase_number=2, phase_name="Research", status=PhaseStatus.COMPLETED)
+        session.results.append(second)
+        assert session.get_phase_result(2) is second
+
+    def test_phase_index_survives_copy_and_reload(self):
+        config = PipelineConfig(topic="Test topic")
+        session = PipelineSession(config=config)
+        session.add_result(
+            PhaseResult(phase_number=1, phase_name="Ideation", status=PhaseStatus.COMPLETED)
+        )
+        session.get_phase_result(1)
+
+        copied = session.model_copy(deep=True)
+        reloaded = PipelineSession.model_validate(session.model_dump())
+
+        assert copied.get_phase_result(1) is copied.results[0]
+        assert reloaded.get_phase_result(1) is reloaded.results[0]
+        assert reloaded == session
+
+    def test_checkpoint_json_round_trip(self):
+        config = PipelineConfig(topic="체크포인트 테스트 주제")
+        session = PipelineSession(config=config, state=PipelineState.PHASE_2)
+        result = PhaseResult(phase_number=1, phase_name="Ideation", status=PhaseStatus.COMPLETED)
+        result.ai_responses.append(
+            AgentResponse(agent_name=AgentType.CLAUDE, task_name="brainstorm", content="내용")
+        )
+        session.add_result(result)
+
+        raw = session.to_checkpoint_json()
+        restored = PipelineSession.from_checkpoint_json(raw.encode("utf-8"))
+
+        assert "체크포인트" in raw
+        assert restored == session
+        assert restored.state is PipelineState.PHASE_2
+        assert restored.get_phase_result(1).ai_responses[0].agent_name is AgentType.CLAUDE
+
 
 class TestCreatePhaseResult:
     def test_create_pending_phase(self):
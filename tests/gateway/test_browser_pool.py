@@ -0,0 +1,1093 @@
+"""
+Tests for BrowserPool context management.
+
+A fake browser stands in for Playwright so no Chromium install is needed.
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import gateway
+from gateway.browser_args import ANTI_DETECT_ARGS, DEFAULT_VIEWPORT, get_stealth_script
+from gateway.browser_manager import BrowserManager
+from gateway.browser_pool import BrowserPool, _drop_expired_cookies, _process_start_ticks
+from gateway.provider_context import ProviderContext
+
+
+class FakePage:
+    """Minimal stand-in for a Playwright Page."""
+
+    def __init__(self, fail_goto: bool = False) -> None:
+        self.fail_goto = fail_goto
+        self.urls: list[str] = []
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def goto(self, url: str) -> None:
+        if self.fail_goto:
+            raise RuntimeError("navigation failed")
+        self.urls.append(url)
+
+    async def wait_for_load_state(self, state: str, timeout: float) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeContext:
+    """Minimal stand-in for a Playwright BrowserContext."""
+
+    def __init__(self, browser: "FakeBrowser") -> None:
+        self.browser = browser
+        self.pages: list[Any] = []
+        self.cookies: list[dict[str, Any]] = []
+        self.closed = False
+        self.close_count = 0
+        self.fail_storage_state = False
+        self.close_handlers: list[Any] = []
+        self.init_scripts: list[str] = []
+        self.routes: list[tuple[str, Any]] = []
+
+    async def route(self, pattern: str, handler: Any) -> None:
+        self.routes.append((pattern, handler))
+
+    async def add_init_script(self, script: str) -> None:
+        self.init_scripts.append(script)
+
+    def once(self, event: str, handler: Any) -> None:
+        assert event == "close"
+        self.close_handlers.append(handler)
+
+    async def storage_state(self) -> dict[str, Any]:
+        if self.fail_storage_state:
+            raise RuntimeError("storage state unavailable")
+        return {"cookies": list(self.cookies), "origins": []}
+
+    async def new_page(self) -> FakePage:
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def add_cookies(self, cookies: list[dict[str, Any]]) -> None:
+        await self.browser.round_trip()
+        self.cookies.extend(cookies)
+
+    async def close(self) -> None:
+        self.close_count += 1
+        await self.browser.round_trip()
+        if self.browser.hang_close:
+            await asyncio.sleep(60)
+        if self.browser.fail_close:
+            raise RuntimeError("close failed")
+        self.closed = True
+        handlers, self.close_handlers = self.close_handlers, []
+        for handler in handlers:
+            handler(self)
+
+
+class FakeBrowser:
+    """Fake browser that records how many calls overlap."""
+
+    def __init__(self, fail_close: bool = False) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_close = fail_close
+        self.hang_close = False
+        self.closed = False
+        self.contexts: list[FakeContext] = []
+
+    async def round_trip(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def new_context(self, **_: Any) -> FakeContext:
+        await self.round_trip()
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _exited(pid: int, timeout: float = 5.0) -> bool:
+    """Wait for a process to die; the driver never reaps its child, so it may be a zombie."""
+    stat = Path(f"/proc/{pid}/stat")
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if stat.read_text().rpartition(")")[2].split()[0] == "Z":
+                return True
+        except OSError:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def launches(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    """Replace async_playwright with a fake that launches FakeBrowsers; records launch kwargs."""
+    recorded: list[dict[str, Any]] = []
+
+    class FakeChromium:
+        async def launch(self, **kwargs: Any) -> FakeBrowser:
+            recorded.append(kwargs)
+            return FakeBrowser()
+
+        async def connect_over_cdp(self, endpoint: str) -> FakeBrowser:
+            recorded.append({"cdp_endpoint": endpoint})
+            return FakeBrowser()
+
+    class FakePlaywright:
+        chromium = FakeChromium()
+
+    class FakeStarter:
+        async def start(self) -> FakePlaywright:
+            return FakePlaywright()
+
+    monkeypatch.setattr("playwright.async_api.async_playwright", FakeStarter)
+    monkeypatch.delenv("AIGENFLOW_CDP_ENDPOINT", raising=False)
+    return recorded
+
+
+@pytest.fixture
+def pool() -> BrowserPool:
+    """BrowserPool wired to a fake browser."""
+    browser_pool = BrowserPool()
+    browser_pool._browser = FakeBrowser()
+    browser_pool._initialized = True
+    return browser_pool
+
+
+class TestSharedBrowserDefaults:
+    """Tests for launch defaults shared with BrowserManager."""
+
+    def test_manager_uses_shared_args(self) -> None:
+        """Test that BrowserManager reuses the shared, immutable defaults."""
+        assert BrowserManager.DEFAULT_BROWSER_ARGS is ANTI_DETECT_ARGS
+        assert BrowserPool.DEFAULT_BROWSER_ARGS is ANTI_DETECT_ARGS
+        with pytest.raises(TypeError):
+            DEFAULT_VIEWPORT["width"] = 800
+
+    async def test_initialize_launches_with_shared_args(
+        self, launches: list[dict[str, Any]]
+    ) -> None:
+        """Test that the launch args tuple is passed through without copying."""
+        await BrowserPool().initialize(headless=True)
+
+        assert launches == [{"headless": True, "args": ANTI_DETECT_ARGS}]
+        assert launches[0]["args"] is ANTI_DETECT_ARGS
+
+    async def test_default_viewport_is_copied_per_context(self, pool: BrowserPool) -> None:
+        """Test that contexts get a fresh viewport dict built from the default."""
+        received = []
+        browser = pool._browser
+        original = browser.new_context
+
+        async def recording_new_context(**kwargs: Any) -> FakeContext:
+            received.append(kwargs["viewport"])
+            return await original(**kwargs)
+
+        browser.new_context = recording_new_context
+        await pool.get_context("chatgpt")
+
+        assert received == [{"width": 1280, "height": 720}]
+        assert type(received[0]) is dict
+
+
+def test_browser_modules_defer_playwright_import() -> None:
+    """Test that importing the browser modules doesn't load Playwright."""
+    code = (
+        "import sys, gateway.browser_manager, gateway.provider_context; "
+        "print('playwright.async_api' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(gateway.__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+class TestContextLiveness:
+    """Tests for tracking closed contexts through the close event."""
+
+    async def test_existing_context_is_reused(self, pool: BrowserPool) -> None:
+        """Test that a live context is returned without creating another."""
+        first = await pool.get_context("chatgpt")
+
+        assert await pool.get_context("chatgpt") is first
+        assert len(pool._browser.contexts) == 1
+
+    async def test_externally_closed_context_is_replaced(self, pool: BrowserPool) -> None:
+        """Test that a context closed outside the pool is recreated on next use."""
+        first = await pool.get_context("chatgpt")
+        await first.close()
+
+        assert pool.context_count == 0
+        assert pool._providers["chatgpt"].context is None
+        second = await pool.get_context("chatgpt")
+        assert second is not first
+
+    async def test_concurrent_first_use_creates_one_context(self, pool: BrowserPool) -> None:
+        """Test that racing get_context calls share the provider slot and its lock."""
+        first, second = await asyncio.gather(
+            pool.get_context("chatgpt"), pool.get_context("chatgpt")
+        )
+
+        assert first is second
+        assert len(pool._browser.contexts) == 1
+
+    async def test_slot_kept_when_context_is_recreated(self, pool: BrowserPool) -> None:
+        """Test that recreating a closed context reuses the existing slot."""
+        first = await pool.get_context("chatgpt")
+        slot = pool._providers["chatgpt"]
+        await first.close()
+
+        await pool.get_context("chatgpt")
+
+        assert pool._providers["chatgpt"] is slot
+
+    async def test_stale_close_event_keeps_newer_context(self, pool: BrowserPool) -> None:
+        """Test that a late close event from a replaced context is ignored."""
+        first = await pool.get_context("chatgpt")
+        await pool.close_context("chatgpt")
+        await pool.get_context("chatgpt")
+
+        pool._on_context_closed("chatgpt", first)
+
+        assert pool.active_contexts == ["chatgpt"]
+
+
+class TestInitialize:
+    """Tests for launching the pool."""
+
+    async def test_preload_providers_are_created_concurrently(
+        self, launches: list[dict[str, Any]]
+    ) -> None:
+        """Test that listed provider contexts exist as soon as initialize returns."""
+        pool = BrowserPool()
+
+        await pool.initialize(preload_providers=["chatgpt", "claude", "gemini"])
+
+        assert sorted(pool.active_contexts) == ["chatgpt", "claude", "gemini"]
+        assert pool._browser.max_in_flight == 3
+
+    async def test_prewarm_failure_does_not_fail_initialize(
+        self, launches: list[dict[str, Any]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a context that can't be prewarmed is left for first use."""
+        pool = BrowserPool()
+        original = pool.get_context
+
+        async def flaky(provider_name: str, *args: Any) -> Any:
+            if provider_name == "claude":
+                raise RuntimeError("boom")
+            return await original(provider_name, *args)
+
+        monkeypatch.setattr(pool, "get_context", flaky)
+        await pool.initialize(preload_providers=["chatgpt", "claude"])
+
+        assert pool.is_initialized is True
+        assert pool.active_contexts == ["chatgpt"]
+
+
+class TestSharedCdpBrowser:
+    """Tests for connecting to an existing browser over CDP."""
+
+    async def test_connects_instead_of_launching(self, launches: list[dict[str, Any]]) -> None:
+        """Test that a CDP endpoint replaces the local launch."""
+        pool = BrowserPool()
+
+        await pool.initialize(cdp_endpoint="http://localhost:9222")
+
+        assert launches == [{"cdp_endpoint": "http://localhost:9222"}]
+        assert pool._over_cdp is True
+
+    async def test_endpoint_read_from_environment(
+        self, launches: list[dict[str, Any]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that AIGENFLOW_CDP_ENDPOINT is used when no endpoint is passed."""
+        monkeypatch.setenv("AIGENFLOW_CDP_ENDPOINT", "http://browser:9222")
+
+        await BrowserPool().initialize()
+
+        assert launches == [{"cdp_endpoint": "http://browser:9222"}]
+
+    async def test_close_all_leaves_other_processes_contexts(
+        self, launches: list[dict[str, Any]]
+    ) -> None:
+        """Test that only the pool's own contexts are closed on a shared browser."""
+        pool = BrowserPool()
+        await pool.initialize(cdp_endpoint="http://localhost:9222")
+        browser = pool._browser
+        foreign = await browser.new_context()
+        own = await pool.get_context("chatgpt")
+
+        await pool.close_all()
+
+        assert own.closed is True
+        assert foreign.closed is False
+
+
+class TestGetInstance:
+    """Tests for singleton access."""
+
+    async def test_existing_instance_skips_lock(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an existing pool is returned without taking the class lock."""
+        lock = asyncio.Lock()
+        await lock.acquire()
+        monkeypatch.setitem(BrowserPool._locks, asyncio.get_running_loop(), lock)
+        monkeypatch.setattr(BrowserPool, "_instance", pool)
+
+        assert await asyncio.wait_for(BrowserPool.get_instance(), timeout=1) is pool
+
+    async def test_failed_initialization_is_not_published(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a pool whose initialization failed isn't kept as the singleton."""
+        monkeypatch.setattr(BrowserPool, "_instance", None)
+
+        async def failing_initialize(self: BrowserPool, headless: bool = True) -> None:
+            raise RuntimeError("launch failed")
+
+        monkeypatch.setattr(BrowserPool, "initialize", failing_initialize)
+
+        with pytest.raises(RuntimeError):
+            await BrowserPool.get_instance()
+        assert BrowserPool._instance is None
+
+    def test_lock_usable_from_successive_event_loops(self) -> None:
+        """Test that singleton creation can be contended on more than one loop."""
+
+        async def contend() -> asyncio.Lock:
+            lock = BrowserPool._get_lock()
+            async with lock:
+                waiter = asyncio.create_task(lock.acquire())
+                await asyncio.sleep(0)
+            await waiter
+            lock.release()
+            assert BrowserPool._get_lock() is lock
+            return lock
+
+        first = asyncio.run(contend())
+        second = asyncio.run(contend())
+
+        assert first is not second
+
+
+class TestSharedDriver:
+    """Tests for BrowserManager borrowing the pooled browser."""
+
+    @pytest.fixture
+    def shared_pool(self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch) -> BrowserPool:
+        """Install the fake-backed pool as the singleton."""
+        monkeypatch.setattr(BrowserPool, "_instance", pool)
+        return pool
+
+    async def test_manager_borrows_pool_browser(self, shared_pool: BrowserPool) -> None:
+        """Test that a headless BrowserManager reuses the pool's browser."""
+        manager = BrowserManager(headless=True)
+
+        browser = await manager.start_browser()
+
+        assert browser is shared_pool._browser
+        assert manager._playwright is shared_pool.playwright
+        assert shared_pool._borrowers == 1
+
+    async def test_manager_close_keeps_pool_with_contexts(self, shared_pool: BrowserPool) -> None:
+        """Test that closing a borrower leaves a pool in use running."""
+        await shared_pool.get_context("chatgpt")
+        manager = BrowserManager(headless=True)
+        await manager.start_browser()
+
+        await manager.close()
+
+        assert manager._browser is None
+        assert shared_pool._borrowers == 0
+        assert shared_pool.is_initialized is True
+
+    async def test_close_all_keeps_browser_for_active_borrower(
+        self, shared_pool: BrowserPool
+    ) -> None:
+        """Test that pool shutdown leaves a borrower's context and browser open."""
+        pool_context = await shared_pool.get_context("chatgpt")
+        browser = shared_pool._browser
+        manager = BrowserManager(headless=True)
+        await manager.start_browser()
+        borrowed_context = await manager.create_context()
+
+        await shared_pool.close_all()
+
+        assert pool_context.closed is True
+        assert borrowed_context.closed is False
+        assert browser.closed is False
+
+        await manager.close()
+
+        assert borrowed_context.closed is True
+        assert browser.closed is True
+        assert shared_pool.is_initialized is False
+
+    async def test_manager_does_not_borrow_when_pool_disabled(
+        self,
+        shared_pool: BrowserPool,
+        launches: list[dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that AIGENFLOW_USE_BROWSER_POOL=false keeps managers off the pool."""
+        monkeypatch.setattr("gateway.browser_manager.USE_BROWSER_POOL", False)
+        manager = BrowserManager(headless=True)
+
+        browser = await manager.start_browser()
+
+        assert browser is not shared_pool._browser
+        assert len(launches) == 1
+        assert shared_pool._borrowers == 0
+
+    async def test_last_borrower_shuts_down_idle_pool(self, shared_pool: BrowserPool) -> None:
+        """Test that the pool closes once its last borrower leaves and it is unused."""
+        first = BrowserManager(headless=True)
+        second = BrowserManager(headless=True)
+        await first.start_browser()
+        await second.start_browser()
+
+        await first.close()
+        assert shared_pool.is_initialized is True
+        await second.close()
+
+        assert shared_pool.is_initialized is False
+
+    def test_instance_exists_does_not_create_pool(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that instance_exists reports the singleton without creating it."""
+        monkeypatch.setattr(BrowserPool, "_instance", None)
+        assert BrowserPool.instance_exists() is False
+        assert BrowserPool._instance is None
+
+        monkeypatch.setattr(BrowserPool, "_instance", pool)
+        assert BrowserPool.instance_exists() is True
+
+    async def test_mode_mismatch_is_not_shared(self, pool: BrowserPool) -> None:
+        """Test that a headed borrower doesn't get the headless pooled browser."""
+        assert await pool.acquire_browser(headless=False) is None
+        assert pool._borrowers == 0
+
+
+class FakeRoute:
+    """Records whether a routed request was aborted or continued."""
+
+    def __init__(self, resource_type: str) -> None:
+        self.request = type("Request", (), {"resource_type": resource_type})()
+        self.outcome: str | None = None
+
+    async def abort(self) -> None:
+        self.outcome = "abort"
+
+    async def continue_(self) -> None:
+        self.outcome = "continue"
+
+
+class TestResourceBlocking:
+    """Tests for aborting heavy resources in headless contexts."""
+
+    async def test_headless_context_blocks_heavy_resources(self, pool: BrowserPool) -> None:
+        """Test that images, media and fonts are aborted while documents load."""
+        context = await pool.get_context("chatgpt")
+        [(pattern, handler)] = context.routes
+        outcomes = {}
+        for resource_type in ("image", "font", "media", "document", "stylesheet", "script"):
+            route = FakeRoute(resource_type)
+            await handler(route)
+            outcomes[resource_type] = route.outcome
+
+        assert pattern == "**/*"
+        assert outcomes == {
+            "image": "abort",
+            "font": "abort",
+            "media": "abort",
+            "document": "continue",
+            "stylesheet": "continue",
+            "script": "continue",
+        }
+
+    async def test_headed_pool_does_not_block_by_default(self, pool: BrowserPool) -> None:
+        """Test that a headed pool leaves resources alone unless asked."""
+        pool.headless = False
+
+        context = await pool.get_context("chatgpt")
+        blocked = await pool.get_context("claude", block_resources=True)
+
+        assert context.routes == []
+        assert len(blocked.routes) == 1
+
+
+class TestStealth:
+    """Tests for the context-level playwright-stealth init script."""
+
+    def test_stealth_script_is_built_once(self) -> None:
+        """Test that the combined stealth script is memoized."""
+        assert get_stealth_script() is get_stealth_script()
+
+    async def test_context_gets_stealth_script_once(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the script is added per context, not per page."""
+        monkeypatch.setattr("gateway.browser_pool.get_stealth_script", lambda: "stealth();")
+        context, _ = await pool.get_page("chatgpt")
+        await pool.get_page("chatgpt")
+
+        assert context.init_scripts == ["stealth();"]
+        assert len(context.pages) == 2
+
+    async def test_get_page_without_stealth(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pages are still created when stealth is unavailable."""
+        monkeypatch.setattr("gateway.browser_pool.get_stealth_script", lambda: None)
+        context, page = await pool.get_page("chatgpt")
+
+        assert context.pages == [page]
+        assert context.init_scripts == []
+
+
+class TestPageReuse:
+    """Tests for handing released pages out again."""
+
+    async def test_released_page_is_reused(self, pool: BrowserPool) -> None:
+        """Test that a released page is reset and returned by the next get_page."""
+        context, page = await pool.get_page("chatgpt")
+        await pool.release_page("chatgpt", page)
+
+        _, reused = await pool.get_page("chatgpt")
+
+        assert reused is page
+        assert page.urls == ["about:blank"]
+        assert context.pages == [page]
+
+    async def test_pages_are_not_shared_across_providers(self, pool: BrowserPool) -> None:
+        """Test that an idle page is only reused for its own provider."""
+        _, page = await pool.get_page("chatgpt")
+        await pool.release_page("chatgpt", page)
+
+        _, other = await pool.get_page("claude")
+
+        assert other is not page
+
+    async def test_page_closed_after_reuse_limit(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pages are retired once MAX_PAGE_REUSES is reached."""
+        monkeypatch.setattr(BrowserPool, "MAX_PAGE_REUSES", 1)
+        _, page = await pool.get_page("chatgpt")
+        await pool.release_page("chatgpt", page)
+        await pool.get_page("chatgpt")
+        await pool.release_page("chatgpt", page)
+
+        _, fresh = await pool.get_page("chatgpt")
+
+        assert page.closed is True
+        assert fresh is not page
+
+    async def test_idle_pages_bounded(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pages released beyond MAX_IDLE_PAGES are closed."""
+        monkeypatch.setattr(BrowserPool, "MAX_IDLE_PAGES", 2)
+        pages = [(await pool.get_page("chatgpt"))[1] for _ in range(3)]
+
+        await asyncio.gather(*(pool.release_page("chatgpt", page) for page in pages))
+
+        assert pool._providers["chatgpt"].idle_pages == pages[:2]
+        assert [page.closed for page in pages] == [False, False, True]
+
+    async def test_closed_idle_page_is_skipped(self, pool: BrowserPool) -> None:
+        """Test that idle pages closed in the meantime are not handed out."""
+        _, page = await pool.get_page("chatgpt")
+        await pool.release_page("chatgpt", page)
+        page.closed = True
+
+        _, fresh = await pool.get_page("chatgpt")
+
+        assert fresh is not page
+        assert page not in pool._page_reuses
+
+    async def test_page_failing_reset_is_closed(self, pool: BrowserPool) -> None:
+        """Test that a page that cannot navigate to about:blank is discarded."""
+        _, page = await pool.get_page("chatgpt")
+        page.fail_goto = True
+
+        await pool.release_page("chatgpt", page)
+
+        assert page.closed is True
+        assert pool._providers["chatgpt"].idle_pages == []
+
+    async def test_close_context_drops_idle_pages(self, pool: BrowserPool) -> None:
+        """Test that closing a context forgets its idle pages."""
+        _, page = await pool.get_page("chatgpt")
+        await pool.release_page("chatgpt", page)
+
+        await pool.close_context("chatgpt")
+
+        assert "chatgpt" not in pool._providers
+        assert pool._page_reuses == {}
+
+
+class TestProviderContextPages:
+    """Tests for ProviderContext taking its pages from the pool."""
+
+    async def test_closed_page_is_reused_by_next_request(self, pool: BrowserPool) -> None:
+        """Test that close() releases the page and the next get_page() reuses it."""
+        provider = ProviderContext("chatgpt", pool=pool)
+        page = await provider.get_page()
+
+        await provider.close()
+        reused = await provider.get_page()
+
+        assert reused is page
+        assert page.closed is False
+        assert page.urls == ["about:blank"]
+        assert await provider.get_context() is pool._providers["chatgpt"].context
+
+    async def test_page_kept_until_close(self, pool: BrowserPool) -> None:
+        """Test that repeated get_page() calls return the page in use."""
+        provider = ProviderContext("chatgpt", pool=pool)
+        page = await provider.get_page()
+
+        assert await provider.get_page() is page
+        assert pool._providers["chatgpt"].usage == 1
+
+    async def test_idle_pages_bounded_across_provider_contexts(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pages released by concurrent requests respect MAX_IDLE_PAGES."""
+        monkeypatch.setattr(BrowserPool, "MAX_IDLE_PAGES", 2)
+        providers = [ProviderContext("chatgpt", pool=pool) for _ in range(3)]
+        pages = [await provider.get_page() for provider in providers]
+
+        await asyncio.gather(*(provider.close() for provider in providers))
+
+        assert pool._providers["chatgpt"].idle_pages == pages[:2]
+        assert [page.closed for page in pages] == [False, False, True]
+
+    async def test_close_without_page_is_noop(self, pool: BrowserPool) -> None:
+        """Test that closing before any page was requested touches nothing."""
+        provider = ProviderContext("chatgpt", pool=pool)
+
+        await provider.close()
+
+        assert pool._providers == {}
+
+
+class TestContextRecycling:
+    """Tests for replacing long-lived contexts."""
+
+    async def test_context_recycled_after_page_limit(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a context is replaced after MAX_PAGES_PER_CONTEXT pages."""
+        monkeypatch.setattr(BrowserPool, "MAX_PAGES_PER_CONTEXT", 2)
+        cookies = [{"name": "session", "value": "abc"}]
+        old = await pool.preload_context("chatgpt", cookies)
+        for _ in range(2):
+            _, page = await pool.get_page("chatgpt")
+            await pool.release_page("chatgpt", page)
+
+        new, _ = await pool.get_page("chatgpt")
+
+        assert new is not old
+        assert old.closed is True
+        assert new.cookies == cookies
+        assert pool._providers["chatgpt"].usage == 1
+
+    async def test_context_recycled_after_max_age(self, pool: BrowserPool) -> None:
+        """Test that a context older than MAX_CONTEXT_AGE is replaced."""
+        old, page = await pool.get_page("chatgpt")
+        await pool.release_page("chatgpt", page)
+        pool._providers["chatgpt"].created_at -= BrowserPool.MAX_CONTEXT_AGE + 1
+
+        new, _ = await pool.get_page("chatgpt")
+
+        assert new is not old
+        assert old.closed is True
+
+    async def test_recycle_waits_for_checked_out_pages(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a context is not recycled while one of its pages is in use."""
+        monkeypatch.setattr(BrowserPool, "MAX_PAGES_PER_CONTEXT", 1)
+        old, in_use = await pool.get_page("chatgpt")
+
+        same, _ = await pool.get_page("chatgpt")
+
+        assert same is old
+        assert old.closed is False
+        assert in_use.closed is False
+
+        for page in old.pages:
+            await pool.release_page("chatgpt", page)
+        new, _ = await pool.get_page("chatgpt")
+
+        assert new is not old
+        assert old.closed is True
+
+    async def test_page_closed_without_release_does_not_block_recycle(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pages closed by their user stop counting as checked out."""
+        monkeypatch.setattr(BrowserPool, "MAX_PAGES_PER_CONTEXT", 1)
+        old, page = await pool.get_page("chatgpt")
+        await page.close()
+
+        new, _ = await pool.get_page("chatgpt")
+
+        assert new is not old
+
+    async def test_recycle_keeps_context_without_storage_state(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a context whose state can't be saved is kept and counters reset."""
+        monkeypatch.setattr(BrowserPool, "MAX_PAGES_PER_CONTEXT", 1)
+        old, page = await pool.get_page("chatgpt")
+        await pool.release_page("chatgpt", page)
+        old.fail_storage_state = True
+
+        new, _ = await pool.get_page("chatgpt")
+
+        assert new is old
+        assert old.closed is False
+        assert pool._providers["chatgpt"].usage == 1
+
+
+class TestPreloadContexts:
+    """Tests for concurrent context preloading."""
+
+    async def test_preload_contexts_overlaps_providers(self, pool: BrowserPool) -> None:
+        """Test that contexts for different providers are created concurrently."""
+        specs = [
+            ("chatgpt", [{"name": "a", "value": "1"}]),
+            ("claude", [{"name": "b", "value": "2"}]),
+            ("gemini", []),
+        ]
+
+        results = await pool.preload_contexts(specs)
+
+        assert list(results) == ["chatgpt", "claude", "gemini"]
+        assert results["claude"].cookies == [{"name": "b", "value": "2"}]
+        assert pool._browser.max_in_flight == 3
+        assert sorted(pool.active_contexts) == ["chatgpt", "claude", "gemini"]
+
+    async def test_context_creation_is_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that no more than MAX_CONCURRENT_CONTEXT_CREATES contexts are created at once."""
+        monkeypatch.setattr(BrowserPool, "MAX_CONCURRENT_CONTEXT_CREATES", 2)
+        pool = BrowserPool()
+        pool._browser = FakeBrowser()
+        pool._initialized = True
+
+        results = await pool.preload_contexts([(name, []) for name in "abcde"])
+
+        assert len(results) == 5
+        assert pool._browser.max_in_flight == 2
+
+    async def test_preload_skips_expired_cookies(self, pool: BrowserPool) -> None:
+        """Test that expired cookies are not sent to the context."""
+        cookies = [
+            {"name": "session", "value": "1"},
+            {"name": "persistent", "value": "2", "expires": 2**40},
+            {"name": "stale", "value": "3", "expires": 1},
+        ]
+
+        context = await pool.preload_context("chatgpt", cookies)
+
+        assert [c["name"] for c in context.cookies] == ["session", "persistent"]
+
+    async def test_preload_without_live_cookies_skips_injection(
+        self, pool: BrowserPool
+    ) -> None:
+        """Test that add_cookies isn't called when every cookie has expired."""
+        await pool.get_context("chatgpt")
+        pool._browser.max_in_flight = 0
+
+        await pool.preload_context("chatgpt", [{"name": "old", "value": "x", "expires": 0}])
+
+        assert pool._browser.max_in_flight == 0
+
+    def test_drop_expired_cookies_keeps_session_cookies(self) -> None:
+        """Test the expiry filter against a fixed clock."""
+        cookies = [
+            {"name": "a", "expires": -1},
+            {"name": "b", "expires": 99},
+            {"name": "c", "expires": 101},
+        ]
+
+        kept = _drop_expired_cookies(cookies, now=100)
+
+        assert [c["name"] for c in kept] == ["a", "c"]
+
+    async def test_preload_contexts_reports_failures(self, pool: BrowserPool) -> None:
+        """Test that one failing provider doesn't stop the others."""
+        original = pool.preload_context
+
+        async def flaky(provider_name: str, cookies: list[dict[str, Any]]) -> Any:
+            if provider_name == "claude":
+                raise RuntimeError("boom")
+            return await original(provider_name, cookies)
+
+        pool.preload_context = flaky
+        results = await pool.preload_contexts([("chatgpt", []), ("claude", [])])
+
+        assert isinstance(results["claude"], RuntimeError)
+        assert pool.active_contexts == ["chatgpt"]
+
+
+class TestCloseAll:
+    """Tests for pool shutdown."""
+
+    async def test_close_all_closes_contexts_concurrently(self, pool: BrowserPool) -> None:
+        """Test that all contexts close together and state is cleared."""
+        await pool.preload_contexts([("chatgpt", []), ("claude", []), ("gemini", [])])
+        browser = pool._browser
+        browser.max_in_flight = 0
+
+        await pool.close_all()
+
+        assert all(context.closed for context in browser.contexts)
+        assert browser.max_in_flight == 3
+        assert pool.context_count == 0
+        assert pool.is_initialized is False
+
+    async def test_close_all_closes_untracked_contexts_in_same_batch(
+        self, pool: BrowserPool
+    ) -> None:
+        """Test that contexts opened outside the pool close alongside pool contexts."""
+        await pool.preload_contexts([("chatgpt", []), ("claude", [])])
+        browser = pool._browser
+        untracked = await browser.new_context()
+        browser.max_in_flight = 0
+
+        await pool.close_all()
+
+        assert untracked.closed is True
+        assert browser.max_in_flight == 3
+
+    async def test_close_all_does_not_wait_on_hung_contexts(
+        self, pool: BrowserPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a context that never finishes closing doesn't block shutdown."""
+        monkeypatch.setattr(BrowserPool, "CONTEXT_CLOSE_TIMEOUT", 0.05)
+        await pool.preload_contexts([("chatgpt", []), ("claude", [])])
+        pool._browser.hang_close = True
+
+        await asyncio.wait_for(pool.close_all(), timeout=2)
+
+        assert pool._browser is None
+        assert pool.context_count == 0
+
+    async def test_concurrent_close_all_closes_once(self, pool: BrowserPool) -> None:
+        """Test that overlapping shutdowns don't double-close contexts."""
+        await pool.preload_contexts([("chatgpt", []), ("claude", [])])
+        browser = pool._browser
+
+        await asyncio.gather(pool.close_all(), pool.close_all())
+        await pool.close_all()
+
+        assert [context.close_count for context in browser.contexts] == [1, 1]
+        assert pool.is_initialized is False
+
+    async def test_failed_launch_is_cleaned_up(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a failed launch stops the driver and raises RuntimeError."""
+        stopped = []
+
+        class FailingPlaywright:
+            class chromium:  # noqa: N801 - mirrors the Playwright attribute
+                @staticmethod
+                async def launch(**_: Any) -> None:
+                    raise OSError("no chromium")
+
+            async def stop(self) -> None:
+                stopped.append(True)
+
+        class FakeStarter:
+            async def start(self) -> FailingPlaywright:
+                return FailingPlaywright()
+
+        monkeypatch.setattr("playwright.async_api.async_playwright", FakeStarter)
+        monkeypatch.delenv("AIGENFLOW_CDP_ENDPOINT", raising=False)
+        pool = BrowserPool()
+
+        with pytest.raises(RuntimeError, match="no chromium"):
+            await pool.initialize()
+
+        assert stopped == [True]
+        assert pool._playwright is None
+
+    async def test_close_all_tolerates_close_errors(self, pool: BrowserPool) -> None:
+        """Test that context close failures don't abort cleanup."""
+        await pool.preload_contexts([("chatgpt", []), ("claude", [])])
+        pool._browser.fail_close = True
+
+        await pool.close_all()
+
+        assert pool._browser is None
+        assert pool.context_count == 0
+
+    @pytest.mark.skipif(not Path("/proc").is_dir(), reason="requires /proc")
+    async def test_signal_fallback_kills_children_ignoring_sigterm(self) -> None:
+        """Test that the signal fallback escalates to SIGKILL for stubborn children."""
+        stubborn = (
+            "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+            "print('ready', flush=True); time.sleep(30)"
+        )
+        driver_script = (
+            "import subprocess, sys, time; "
+            f"child = subprocess.Popen([sys.executable, '-c', {stubborn!r}], "
+            "stdout=subprocess.PIPE, text=True); "
+            "child.stdout.readline(); print(child.pid, flush=True); time.sleep(30)"
+        )
+        driver = subprocess.Popen(
+            [sys.executable, "-c", driver_script], stdout=subprocess.PIPE, text=True
+        )
+        try:
+            browser_pid = int(driver.stdout.readline())
+            pool = BrowserPool()
+            pool._driver_pid = driver.pid
+            pool._driver_started_at = time.time()
+            pool._driver_start_ticks = _process_start_ticks(driver.pid)
+
+            await pool._signal_terminate_subprocesses()
+
+            assert _exited(browser_pid)
+            assert driver.poll() is None
+        finally:
+            driver.kill()
+            driver.wait()
+
+    @pytest.mark.skipif(not Path("/proc").is_dir(), reason="requires /proc")
+    async def test_signal_fallback_spares_non_browser_children(self) -> None:
+        """Test that without a driver PID only browser-named children are signalled."""
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            await BrowserPool()._signal_terminate_subprocesses()
+
+            assert proc.poll() is None
+        finally:
+            proc.kill()
+            proc.wait()
+
+    @pytest.mark.skipif(not Path("/proc").is_dir(), reason="requires /proc")
+    async def test_termination_limited_to_driver_subtree(self) -> None:
+        """Test that only processes beneath the Playwright driver are terminated."""
+        sleeper = "import time; time.sleep(30)"
+        driver_script = (
+            "import subprocess, sys, time; "
+            f"child = subprocess.Popen([sys.executable, '-c', {sleeper!r}]); "
+            "print(child.pid, flush=True); time.sleep(30)"
+        )
+        driver = subprocess.Popen(
+            [sys.executable, "-c", driver_script], stdout=subprocess.PIPE, text=True
+        )
+        other = subprocess.Popen([sys.executable, "-c", sleeper])
+        try:
+            browser_pid = int(driver.stdout.readline())
+            pool = BrowserPool()
+            pool._driver_pid = driver.pid
+            pool._driver_started_at = time.time()
+            pool._driver_start_ticks = _process_start_ticks(driver.pid)
+
+            await pool._terminate_browser_subprocesses()
+
+            assert _exited(browser_pid)
+            assert driver.poll() is None
+            assert other.poll() is None
+        finally:
+            for proc in (driver, other):
+                proc.kill()
+                proc.wait()
+
+    @pytest.mark.skipif(not Path("/proc").is_dir(), reason="requires /proc")
+    async def test_signal_fallback_skips_reused_driver_pid(self) -> None:
+        """Test that a driver PID now held by another process is not walked."""
+        sleeper = "import time; time.sleep(30)"
+        driver_script = (
+            "import subprocess, sys, time; "
+            f"child = subprocess.Popen([sys.executable, '-c', {sleeper!r}]); "
+            "print(child.pid, flush=True); time.sleep(30)"
+        )
+        driver = subprocess.Popen(
+            [sys.executable, "-c", driver_script], stdout=subprocess.PIPE, text=True
+        )
+        try:
+            child_pid = int(driver.stdout.readline())
+            pool = BrowserPool()
+            pool._driver_pid = driver.pid
+            pool._driver_start_ticks = _process_start_ticks(driver.pid) - 1
+
+            await pool._signal_terminate_subprocesses()
+
+            stat = Path(f"/proc/{child_pid}/stat").read_text()
+            assert stat.rpartition(")")[2].split()[0] != "Z"
+        finally:
+            os.kill(child_pid, signal.SIGKILL)
+            driver.kill()
+            driver.wait()
+
+    async def test_close_all_forgets_driver_pid(self, pool: BrowserPool) -> None:
+        """Test that the exited driver's PID is not kept for later cleanup."""
+        pool._driver_pid = 12345
+        pool._driver_start_ticks = 678
+
+        await pool.close_all()
+
+        assert pool._driver_pid is None
+        assert pool._driver_start_ticks is None
+
+    async def test_launch_does_not_scan_processes(
+        self, launches: list[dict[str, Any]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that starting the pool leaves the process-tree walk to cleanup."""
+        import gateway.browser_pool as browser_pool
+
+        walked = []
+        monkeypatch.setattr(browser_pool, "_descendant_pids", lambda root=None: walked.append(root))
+
+        await BrowserPool().initialize()
+
+        assert walked == []
+
+    def test_driver_pid_unknown_without_transport(self) -> None:
+        """Test that an unexpected Playwright layout yields no driver PID."""
+        from gateway.browser_pool import _driver_pid
+
+        assert _driver_pid(object()) is None
+
+    async def test_cdp_browser_is_not_terminated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a shared browser reached over CDP is left running."""
+        import gateway.browser_pool as browser_pool
+
+        walked = []
+        monkeypatch.setattr(browser_pool, "_descendant_pids", lambda root=None: walked.append(root))
+        pool = BrowserPool()
+        pool._over_cdp = True
+
+        await pool._terminate_browser_subprocesses()
+
+        assert walked == []
@@ -2,7 +2,13 @@
 Tests for gateway models.
 """
 
+import dataclasses
 
+import pytest
+from pydantic import ValidationError
+
+from gateway.base import GatewayRequest as ProviderRequest
+from gateway.base import GatewayResponse as ProviderResponse
 from gateway.models import GatewayRequest, GatewayResponse
 
 
@@ -65,3 +71,33 @@ class TestGatewayResponse:
             metadata={"key": "value"},
         )
         assert response.metadata == {"key": "value"}
+
+    def test_response_is_frozen(self):
+        """Test responses reject field assignment after construction."""
+        response = GatewayResponse(content="Test content", success=True)
+
+        with pytest.raises(ValidationError):
+            response.content = "changed"
+        assert response.model_copy(update={"content": "new"}).content == "new"
+
+
+class TestProviderMessageTypes:
+    """Tests for the lightweight request/response types in gateway.base."""
+
+    def test_request_is_frozen_and_hashable(self):
+        """Test provider requests are immutable value objects."""
+        request = ProviderRequest(task_name="test_task", prompt="Test prompt")
+
+        assert not hasattr(request, "__dict__")
+        assert hash(request) == hash(ProviderRequest(task_name="test_task", prompt="Test prompt"))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            request.prompt = "changed"
+
+    def test_response_metadata_not_shared(self):
+        """Test each provider response gets its own metadata dict."""
+        first = ProviderResponse(content="a", success=True)
+        second = ProviderResponse(content="b", success=True)
+        first.metadata["fallback_used"] = True
+
+        assert second.metadata == {}
+        assert dataclasses.asdict(first)["metadata"] == {"fallback_used": True}
@@ -12,7 +12,7 @@ from src.gateway.chatgpt_provider import ChatGPTProvider
 from src.gateway.claude_provider import ClaudeProvider
 from src.gateway.gemini_provider import GeminiProvider
 from src.gateway.perplexity_provider import PerplexityProvider
-from src.gateway.selector_loader import SelectorLoader
+from src.gateway.selector_loader import SelectorLoader, SelectorValidationError
 
 
 class TestBaseProvider:
@@ -38,6 +38,9 @@ class TestBaseProviderSelectorIntegration:
         # Without selector_loader, get_selector returns None
         assert provider.get_selector("chat_input") is None
         assert provider.get_all_selectors() == {}
+        assert provider.get_all_selectors() is provider.get_all_selectors()
+        with pytest.raises(TypeError):
+            provider.get_all_selectors()["chat_input"] = "textarea"
 
     def test_provider_with_selector_loader(self, tmp_path: Path) -> None:
         """Test provider with selector loader returns correct selectors."""
@@ -71,6 +74,117 @@ class TestBaseProviderSelectorIntegration:
         assert selectors["chat_input"] == "[contenteditable='true']"
         assert selectors["send_button"] == "button[aria-label='Send']"
 
+    def test_providers_share_loaded_selector_config(self, tmp_path: Path) -> None:
+        """Test providers sharing a loader parse the selector file once."""
+        selectors_data = {
+            "providers": {
+                "claude": {
+                    "chat_input": "[contenteditable='true']",
+                    "send_button": "button[aria-label='Send']",
+                    "response_container": "[data-testid='conversation-turn']",
+                }
+            }
+        }
+        selector_file = tmp_path / "selectors.yaml"
+        with open(selector_file, "w") as f:
+            yaml.dump(selectors_data, f)
+
+        loader = SelectorLoader(selector_file)
+        first = ClaudeProvider(profile_dir=Path("/tmp/claude"), selector_loader=loader)
+        second = ClaudeProvider(profile_dir=Path("/tmp/claude"), selector_loader=loader)
+
+        assert first.get_selector("chat_input") == "[contenteditable='true']"
+        selector_file.unlink()
+        assert second.get_selector("send_button") == "button[aria-label='Send']"
+        assert first.get_all_selectors() is first.get_all_selectors()
+        assert first.__dict__["_selectors"] is first.get_all_selectors()
+
+    def test_selector_values_converted_once(self, tmp_path: Path) -> None:
+        """Test non-string selector values are stringified when the table is built."""
+        selectors_data = {
+            "providers": {
+                "claude": {
+                    "chat_input": "textarea",
+                    "send_button": "button",
+                    "response_container": "div",
+                    "wait_ms": 500,
+                    "stop_button": None,
+                }
+            }
+        }
+        selector_file = tmp_path / "selectors.yaml"
+        with open(selector_file, "w") as f:
+            yaml.dump(selectors_data, f)
+
+        provider = ClaudeProvider(
+            profile_dir=Path("/tmp/claude"), selector_loader=SelectorLoader(selector_file)
+        )
+
+        assert provider.get_selector("wait_ms") == "500"
+        assert provider.__dict__["_selector_strings"]["wait_ms"] == "500"
+        assert "stop_button" not in provider.__dict__["_selector_strings"]
+        assert provider.get_selector("stop_button", optional=True) is None
+
+    def test_get_selectors_resolves_keys_in_order(self, tmp_path: Path) -> None:
+        """Test resolving several selectors at once, including missing ones."""
+        selectors_data = {
+            "providers": {
+                "claude": {
+                    "chat_input": "textarea",
+                    "send_button": "button",
+                    "response_container": "div",
+                    "stop_button": None,
+                }
+            }
+        }
+        selector_file = tmp_path / "selectors.yaml"
+        with open(selector_file, "w") as f:
+            yaml.dump(selectors_data, f)
+
+        provider = ClaudeProvider(
+            profile_dir=Path("/tmp/claude"), selector_loader=SelectorLoader(selector_file)
+        )
+
+        assert provider.get_selectors(
+            "send_button", "stop_button", "unknown", "chat_input", optional=True
+        ) == ("button", None, None, "textarea")
+        with pytest.raises(SelectorValidationError):
+            provider.get_selectors("chat_input", "unknown")
+
+    def test_reassigned_loader_replaces_cached_selectors(self, tmp_path: Path) -> None:
+        """Test that assigning a new loader drops selectors cached from the old one."""
+        loaders = []
+        for name in ("old", "new"):
+            selector_file = tmp_path / f"{name}.yaml"
+            with open(selector_file, "w") as f:
+                yaml.dump(
+                    {
+                        "providers": {
+                            "chatgpt": {
+                                "chat_input": f".{name}-input",
+                                "send_button": f".{name}-send",
+                                "response_container": f".{name}-response",
+                            }
+                        }
+                    },
+                    f,
+                )
+            loaders.append(SelectorLoader(selector_file))
+        provider = ChatGPTProvider(profile_dir=tmp_path / "chatgpt", selector_loader=loaders[0])
+        assert provider.get_selector("chat_input") == ".old-input"
+        assert provider._auth_selector == ".old-input"
+
+        provider.selector_loader = loaders[1]
+
+        assert provider.get_selector("chat_input") == ".new-input"
+        assert provider.get_all_selectors()["send_button"] == ".new-send"
+        assert provider._auth_selector == ".new-input"
+
+        provider.selector_loader = None
+
+        assert provider.get_selector("chat_input") is None
+        assert provider._auth_selector == ChatGPTProvider.DEFAULT_AUTH_SELECTOR
+
     def test_provider_get_base_url_from_selectors(self, tmp_path: Path) -> None:
         """Test getting base URL from selector configuration."""
         selectors_data = {
@@ -169,6 +283,22 @@ class TestBaseProviderSelectorIntegration:
             assert chat_input == f".{provider_name}-input"
 
 
+class _AuthPage:
+    """Page stub whose auth element appears after a number of waits."""
+
+    def __init__(self, url: str, appears_after: int | None) -> None:
+        self.url = url
+        self.appears_after = appears_after
+        self.waits = 0
+        self.timeouts: list[int] = []
+
+    async def wait_for_selector(self, selector: str, timeout: int) -> None:
+        self.waits += 1
+        self.timeouts.append(timeout)
+        if self.appears_after is None or self.waits <= self.appears_after:
+            raise TimeoutError(selector)
+
+
 class TestChatGPTProvider:
     """Tests for ChatGPT provider."""
 
@@ -177,6 +307,51 @@ class TestChatGPTProvider:
         provider = ChatGPTProvider(profile_dir="~/.aigenflow/profiles/chatgpt")
         assert provider.base_url == "https://chat.openai.com"
 
+    def test_auth_selector_from_loader(self, tmp_path: Path) -> None:
+        """Test that the auth selector comes from the configured chat input."""
+        selectors_data = {
+            "providers": {
+                "chatgpt": {
+                    "chat_input": "#prompt-textarea",
+                    "send_button": ".chatgpt-send",
+                    "response_container": ".chatgpt-response",
+                }
+            }
+        }
+        selector_file = tmp_path / "selectors.yaml"
+        with open(selector_file, "w") as f:
+            yaml.dump(selectors_data, f)
+
+        provider = ChatGPTProvider(
+            profile_dir=tmp_path / "chatgpt", selector_loader=SelectorLoader(selector_file)
+        )
+
+        assert provider._auth_selector == "#prompt-textarea"
+        assert "_auth_selector" in vars(provider)  # Resolved once, then cached
+
+    async def test_wait_for_auth_stops_on_login_redirect(self, tmp_path: Path) -> None:
+        """Test that a login redirect ends the session check without waiting."""
+        provider = ChatGPTProvider(profile_dir=tmp_path / "chatgpt")
+        page = _AuthPage(url="https://chatgpt.com/auth/login", appears_after=None)
+
+        assert await provider._wait_for_auth(page) is False
+        assert page.waits == 0
+
+    async def test_wait_for_auth_retries_until_element_appears(self, tmp_path: Path) -> None:
+        """Test that the auth element is polled in slices until it appears."""
+        provider = ChatGPTProvider(profile_dir=tmp_path / "chatgpt")
+        page = _AuthPage(url="https://chatgpt.com/", appears_after=2)
+
+        assert await provider._wait_for_auth(page) is True
+        assert page.waits == 3
+        assert page.timeouts == [ChatGPTProvider.SESSION_CHECK_SLICE] * 3
+
+    def test_auth_selector_default(self, tmp_path: Path) -> None:
+        """Test that the default auth selector is used without a loader."""
+        provider = ChatGPTProvider(profile_dir=tmp_path / "chatgpt")
+
+        assert provider._auth_selector == ChatGPTProvider.DEFAULT_AUTH_SELECTOR
+
     def test_send_message(self):
         """Test send_message method."""
         provider = ChatGPTProvider(profile_dir="~/.aigenflow/profiles/chatgpt")
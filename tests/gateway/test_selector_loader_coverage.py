@@ -501,6 +501,27 @@ class TestSelectorLoader:
 
         assert config1 is config2  # Same cached object
 
+    def test_get_config_parses_once(self, tmp_path: Path) -> None:
+        """Test get_config() loads on first use and then reuses the parse."""
+        selector_file = tmp_path / "test.yaml"
+        config_data = {
+            "providers": {
+                "claude": {
+                    "chat_input": "#input",
+                    "send_button": "#send",
+                    "response_container": ".response",
+                }
+            },
+        }
+        selector_file.write_text(yaml.dump(config_data), encoding="utf-8")
+
+        loader = SelectorLoader(selector_file)
+        config1 = loader.get_config()
+        selector_file.unlink()
+
+        assert loader.get_config() is config1
+        assert loader.config is config1
+
     def test_multiple_providers(self, tmp_path: Path) -> None:
         """Test loading selectors for multiple providers."""
         selector_file = tmp_path / "multi.yaml"
@@ -151,6 +151,10 @@ class TestLogFormatConsistency:
 
         logger.info("Test message", extra_field="extra_value")
 
+        # File output is buffered; flush before reading it back
+        for handler in logging.getLogger("aigenflow").handlers:
+            handler.flush()
+
         # Verify log file exists (still named development.log)
         log_file = temp_log_dir / "development.log"
         assert log_file.exists()
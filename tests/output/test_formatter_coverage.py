@@ -160,6 +160,14 @@ class TestFileExporterCoverage:
             loaded = json.load(f)
         assert loaded == data
 
+    def test_save_json_text_writes_text_verbatim(self, exporter: FileExporter, temp_dir: Path) -> None:
+        """Test save_json_text writes pre-serialized JSON unchanged."""
+        text = '{"korean": "한글"}'
+        result = exporter.save_json_text(filename="raw", text=text)
+
+        assert result == temp_dir / "raw.json"
+        assert result.read_text(encoding="utf-8") == text
+
     def test_save_markdown_creates_file(self, exporter: FileExporter, temp_dir: Path) -> None:
         """Test save_markdown creates a markdown file - Lines 44-48 coverage."""
         content = "# Test Title\n\nTest content here."
@@ -4,7 +4,7 @@ Test configuration for all modules.
 
 from pathlib import Path
 
-from core.config import AigenFlowSettings
+from core.config import AigenFlowSettings, get_output_dir, get_settings, reload_settings
 
 
 def test_settings_loading():
@@ -37,3 +37,62 @@ def test_api_secrets_load_from_environment(monkeypatch):
     assert settings.gemini_api_key == "gemini-test-key"
     assert settings.perplexity_session_token == "px-session"
     assert settings.perplexity_csrf_token == "px-csrf"
+
+
+def test_get_settings_is_cached():
+    """Test that get_settings returns one shared instance until reloaded."""
+    first = get_settings()
+    assert get_settings() is first
+
+    reloaded = reload_settings()
+    assert reloaded is not first
+    assert get_settings() is reloaded
+
+
+def test_directory_creation_runs_once_per_path(tmp_path, monkeypatch):
+    """Test that settings validation creates each directory only once."""
+    target = tmp_path / "out"
+    mkdir_calls = []
+    original_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        if self == target:
+            mkdir_calls.append(self)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    AigenFlowSettings(output_dir=target)
+    AigenFlowSettings(output_dir=target)
+
+    assert target.exists()
+    assert len(mkdir_calls) == 1
+
+
+def test_get_output_dir_creates_session_tree(tmp_path):
+    """Test that the session directory and its phase folders are created."""
+    settings = AigenFlowSettings(output_dir=tmp_path)
+
+    output_path = get_output_dir("session-1", settings)
+
+    assert output_path == tmp_path / "session-1"
+    expected = {"phase1", "phase2", "phase3", "phase4", "phase5", "final"}
+    assert {p.name for p in output_path.iterdir()} == expected
+
+
+def test_get_output_dir_only_creates_missing_dirs(tmp_path, monkeypatch):
+    """Test that existing subdirectories are not created again."""
+    settings = AigenFlowSettings(output_dir=tmp_path)
+    output_path = get_output_dir("session-2", settings)
+    (output_path / "final").rmdir()
+
+    created = []
+    original_mkdir = Path.mkdir
+
+    def recording_mkdir(self, *args, **kwargs):
+        created.append(self.name)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+    get_output_dir("session-2", settings)
+
+    assert created == ["session-2", "final"]
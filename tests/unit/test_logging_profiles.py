@@ -109,6 +109,79 @@ class TestStructlogIntegration:
         # The TimeStamper processor is added in configure_logging
         assert logger is not None
 
+    def test_configure_uses_prebuilt_chain(self, temp_log_dir: Path) -> None:
+        """Test that configure_logging installs the prebuilt processor chains."""
+        import structlog
+
+        from config.logging_profiles import _CONSOLE_PROCESSORS, _JSON_PROCESSORS
+
+        configure_logging(LogEnvironment.PRODUCTION, log_dir=temp_log_dir)
+        assert tuple(structlog.get_config()["processors"]) == _JSON_PROCESSORS
+
+        configure_logging(LogEnvironment.DEVELOPMENT, log_dir=temp_log_dir)
+        assert tuple(structlog.get_config()["processors"]) == _CONSOLE_PROCESSORS
+
+    def test_configure_drops_cached_loggers(self, temp_log_dir: Path) -> None:
+        """Test that reconfiguring hands out loggers bound to the new configuration."""
+        from core.logger import get_logger
+
+        cached = get_logger("test.reconfigure")
+        assert get_logger("test.reconfigure") is cached
+
+        configure_logging(LogEnvironment.DEVELOPMENT, log_dir=temp_log_dir, force=True)
+
+        assert get_logger("test.reconfigure") is not cached
+
+    def test_configure_runs_reconfigure_hooks(
+        self, temp_log_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that registered hooks run on reconfiguration but not on a no-op call."""
+        from config import logging_profiles
+
+        calls: list[bool] = []
+        monkeypatch.setattr(logging_profiles, "_RECONFIGURE_HOOKS", [])
+        logging_profiles.register_reconfigure_hook(lambda: calls.append(True))
+
+        configure_logging(LogEnvironment.DEVELOPMENT, log_dir=temp_log_dir, force=True)
+        configure_logging(LogEnvironment.DEVELOPMENT, log_dir=temp_log_dir)
+
+        assert calls == [True]
+
+    def test_json_renderer_output_round_trips(self) -> None:
+        """Test the JSON renderer emits str output with or without orjson."""
+        import json
+
+        from config.logging_profiles import build_json_renderer
+
+        renderer = build_json_renderer()
+        rendered = renderer(None, "info", {"event": "한글 이벤트", 1: "int key", "obj": object})
+
+        assert isinstance(rendered, str)
+        loaded = json.loads(rendered)
+        assert loaded["event"] == "한글 이벤트"
+        assert loaded["1"] == "int key"
+        assert "object" in loaded["obj"]
+
+    def test_json_renderer_uses_orjson_when_installed(self) -> None:
+        """Test that the JSON renderer serializes through orjson when available."""
+        pytest.importorskip("orjson")
+        from config.logging_profiles import build_json_renderer
+
+        rendered = build_json_renderer()(None, "info", {"event": "x", "n": 2})
+
+        # Compact output: json.dumps would put spaces after the separators
+        assert rendered == '{"event":"x","n":2}'
+
+    def test_json_renderer_falls_back_for_values_orjson_rejects(self) -> None:
+        """Test that events orjson cannot encode still render via json.dumps."""
+        import json
+
+        from config.logging_profiles import build_json_renderer
+
+        rendered = build_json_renderer()(None, "info", {"event": "x", "n": 2**70})
+
+        assert json.loads(rendered) == {"event": "x", "n": 2**70}
+
     def test_json_renderer_for_prod_profile(self, temp_log_dir: Path) -> None:
         """Test that production profile uses JSON renderer."""
         profile = get_logging_profile(LogEnvironment.PRODUCTION, temp_log_dir)
@@ -188,6 +261,115 @@ class TestSecretRedaction:
         assert logger is not None
 
 
+class TestExcAndStackInfoProcessor:
+    """Test suite for the guarded exception/stack info processor."""
+
+    def test_plain_record_passes_through(self) -> None:
+        """Test that records without exc_info/stack_info are untouched."""
+        from config.logging_profiles import _render_exc_and_stack_info
+
+        event_dict = {"event": "plain"}
+        assert _render_exc_and_stack_info(None, "info", event_dict) == {"event": "plain"}
+
+    def test_exception_is_formatted(self) -> None:
+        """Test that exc_info is rendered into an exception string."""
+        from config.logging_profiles import _render_exc_and_stack_info
+
+        try:
+            raise ValueError("boom")
+        except ValueError as exc:
+            event_dict = _render_exc_and_stack_info(None, "error", {"event": "x", "exc_info": exc})
+
+        assert "exc_info" not in event_dict
+        assert "ValueError: boom" in event_dict["exception"]
+
+    def test_stack_info_is_rendered(self) -> None:
+        """Test that stack_info is rendered into a stack string."""
+        from config.logging_profiles import _render_exc_and_stack_info
+
+        event_dict = _render_exc_and_stack_info(None, "info", {"event": "x", "stack_info": True})
+
+        assert "stack_info" not in event_dict
+        assert "stack" in event_dict
+
+
+class TestRedactSecretsProcessor:
+    """Test suite for the _redact_secrets structlog processor."""
+
+    def test_nested_values_are_redacted(self) -> None:
+        """Test redaction inside nested dicts, lists and tuples."""
+        from config.logging_profiles import _redact_secrets
+
+        event_dict = {
+            "event": "call",
+            "request": {"headers": {"authorization": "Bearer abcdefghijkl"}},
+            "tokens": ["short", "a-much-longer-token"],
+            "pair": ("password", ("secret_value_1", 3)),
+            "count": 5,
+        }
+
+        redacted = _redact_secrets(None, "info", event_dict)
+
+        assert redacted["event"] == "call"
+        assert redacted["request"]["headers"]["authorization"] == "Bear...ijkl"
+        assert redacted["tokens"] == ["***", "a-mu...oken"]
+        assert redacted["pair"] == ("password", ("secret_value_1", 3))
+        assert redacted["count"] == 5
+        assert list(redacted) == list(event_dict)
+        # Input is left untouched
+        assert event_dict["tokens"] == ["short", "a-much-longer-token"]
+
+    def test_sensitive_keyword_anywhere_in_key(self) -> None:
+        """Test that keywords are matched anywhere in the key, case-insensitively."""
+        from config.logging_profiles import is_sensitive_key
+
+        assert is_sensitive_key("user_token") is True
+        assert is_sensitive_key("X-Api-KEY") is True
+        assert is_sensitive_key("phase_number") is False
+        assert is_sensitive_key("count") is False
+
+    def test_self_referencing_containers_are_replaced(self) -> None:
+        """Test that a container found inside itself becomes a placeholder."""
+        from config.logging_profiles import CYCLE_PLACEHOLDER, _redact_secrets
+
+        payload: dict = {"name": "run"}
+        payload["self"] = payload
+        shared = ["item"]
+
+        redacted = _redact_secrets(
+            None, "info", {"event": "x", "payload": payload, "a": shared, "b": (shared,)}
+        )
+
+        assert redacted["payload"] == {"name": "run", "self": CYCLE_PLACEHOLDER}
+        assert redacted["a"] == ["item"]
+        assert redacted["b"] == (["item"],)
+
+    def test_non_string_keys_are_not_hints(self) -> None:
+        """Test that int and tuple keys pass through without a sensitivity check."""
+        from config.logging_profiles import _redact_secrets
+
+        event_dict = {"event": "x", "counts": {1: ["a"], (1, 2): ("b",)}}
+
+        assert _redact_secrets(None, "info", event_dict) == event_dict
+
+    def test_deeply_nested_payload_does_not_recurse(self) -> None:
+        """Test that nesting deeper than the recursion limit is handled."""
+        import sys
+
+        from config.logging_profiles import _redact_secrets
+
+        payload: dict = {"session": "session-identifier-value"}
+        for _ in range(sys.getrecursionlimit() + 100):
+            payload = {"child": payload}
+
+        redacted = _redact_secrets(None, "info", {"payload": payload})
+
+        node = redacted["payload"]
+        while "child" in node:
+            node = node["child"]
+        assert node["session"] == "sess...alue"
+
+
 class TestLoggerConfiguration:
     """Test suite for logger setup and configuration."""
 
@@ -226,6 +408,35 @@ class TestLoggerConfiguration:
         )
         assert logger is not None
 
+    def test_identical_reconfigure_is_skipped(self, temp_log_dir: Path) -> None:
+        """Test that repeating a call with the same settings is a no-op."""
+        from unittest.mock import patch
+
+        configure_logging(LogEnvironment.TESTING, log_dir=temp_log_dir)
+        handlers = list(logging.getLogger("aigenflow").handlers)
+
+        with patch("config.logging_profiles.structlog.configure") as configure:
+            configure_logging(LogEnvironment.TESTING, log_dir=temp_log_dir)
+
+        configure.assert_not_called()
+        assert logging.getLogger("aigenflow").handlers == handlers
+
+    def test_force_reconfigures(self, temp_log_dir: Path) -> None:
+        """Test that force=True reconfigures even with unchanged settings."""
+        configure_logging(LogEnvironment.TESTING, log_dir=temp_log_dir)
+        handlers = list(logging.getLogger("aigenflow").handlers)
+
+        configure_logging(LogEnvironment.TESTING, log_dir=temp_log_dir, force=True)
+
+        assert logging.getLogger("aigenflow").handlers != handlers
+
+    def test_changed_settings_reconfigure(self, temp_log_dir: Path) -> None:
+        """Test that a different level triggers reconfiguration."""
+        configure_logging(LogEnvironment.TESTING, log_dir=temp_log_dir)
+        configure_logging(LogEnvironment.TESTING, log_level="error", log_dir=temp_log_dir)
+
+        assert logging.getLogger("aigenflow").level == logging.ERROR
+
     def test_logger_has_correct_name(self, temp_log_dir: Path) -> None:
         """Test that logger has the correct name."""
         logger = configure_logging(LogEnvironment.DEVELOPMENT, log_dir=temp_log_dir)
@@ -308,6 +519,148 @@ class TestFileHandlerCreation:
         assert log_file.exists()
 
 
+class TestLevelFilter:
+    """Test suite for the level short-circuit processor."""
+
+    def test_disabled_records_are_dropped(self, temp_log_dir: Path) -> None:
+        """Test that records below the effective level raise DropEvent."""
+        import structlog
+
+        from config.logging_profiles import _level_filter
+
+        configure_logging(LogEnvironment.PRODUCTION, log_dir=temp_log_dir)
+
+        with pytest.raises(structlog.DropEvent):
+            _level_filter(None, "info", {"event": "dropped"})
+        with pytest.raises(structlog.DropEvent):
+            _level_filter(None, "debug", {"event": "dropped"})
+
+    def test_enabled_records_pass_through(self, temp_log_dir: Path) -> None:
+        """Test that records at or above the effective level are kept."""
+        from config.logging_profiles import _level_filter
+
+        configure_logging(LogEnvironment.PRODUCTION, log_dir=temp_log_dir)
+
+        event_dict = {"event": "kept"}
+        assert _level_filter(None, "warning", event_dict) is event_dict
+        assert _level_filter(None, "exception", event_dict) is event_dict
+
+    def test_reconfigure_updates_effective_level(self, temp_log_dir: Path) -> None:
+        """Test that reconfiguring refreshes the cached level."""
+        from config.logging_profiles import _level_filter
+
+        configure_logging(LogEnvironment.PRODUCTION, log_dir=temp_log_dir)
+        configure_logging(LogEnvironment.DEVELOPMENT, log_dir=temp_log_dir)
+
+        event_dict = {"event": "kept"}
+        assert _level_filter(None, "debug", event_dict) is event_dict
+
+
+class TestCachedTimestamp:
+    """Test suite for the millisecond-cached timestamp processor."""
+
+    def test_timestamp_is_iso_utc(self) -> None:
+        """Test that the timestamp is ISO-8601 UTC with millisecond precision."""
+        from datetime import datetime
+
+        from config.logging_profiles import _cached_iso_timestamp
+
+        event_dict = _cached_iso_timestamp(None, "info", {"event": "x"})
+        timestamp = event_dict["timestamp"]
+        assert timestamp.endswith("Z")
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        assert parsed.microsecond % 1000 == 0
+
+    def test_timestamp_reused_within_same_millisecond(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the formatted string is reused for the same millisecond."""
+        from config import logging_profiles
+
+        monkeypatch.setattr(logging_profiles.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+        first = logging_profiles._cached_iso_timestamp(None, "info", {})["timestamp"]
+        second = logging_profiles._cached_iso_timestamp(None, "info", {})["timestamp"]
+
+        assert first == "2023-11-14T22:13:20.123Z"
+        assert second is first
+
+
+class TestBufferedFileHandler:
+    """Test suite for the buffered rotating file handler."""
+
+    def test_file_handler_is_buffered(self, temp_log_dir: Path) -> None:
+        """Test that configure_logging installs the buffered handler."""
+        from config.logging_profiles import BufferedRotatingFileHandler
+
+        configure_logging(LogEnvironment.TESTING, log_dir=temp_log_dir)
+        handlers = logging.getLogger("aigenflow").handlers
+        assert any(isinstance(h, BufferedRotatingFileHandler) for h in handlers)
+
+    def test_records_below_flush_level_stay_buffered(self, temp_log_dir: Path) -> None:
+        """Test that low-severity records are not flushed per record."""
+        from config.logging_profiles import BufferedRotatingFileHandler
+
+        log_file = temp_log_dir / "buffered.log"
+        handler = BufferedRotatingFileHandler(log_file, encoding="utf-8")
+        record = logging.makeLogRecord({"msg": "buffered", "levelno": logging.INFO})
+        try:
+            handler.emit(record)
+            assert log_file.read_text(encoding="utf-8") == ""
+
+            handler.flush()
+            assert log_file.read_text(encoding="utf-8") == "buffered\n"
+        finally:
+            handler.close()
+
+    def test_error_record_flushes_immediately(self, temp_log_dir: Path) -> None:
+        """Test that records at ERROR or above are flushed right away."""
+        from config.logging_profiles import BufferedRotatingFileHandler
+
+        log_file = temp_log_dir / "buffered.log"
+        handler = BufferedRotatingFileHandler(log_file, encoding="utf-8")
+        try:
+            handler.emit(logging.makeLogRecord({"msg": "info", "levelno": logging.INFO}))
+            handler.emit(logging.makeLogRecord({"msg": "boom", "levelno": logging.ERROR}))
+            assert log_file.read_text(encoding="utf-8") == "info\nboom\n"
+        finally:
+            handler.close()
+
+    def test_close_flushes_pending_records(self, temp_log_dir: Path) -> None:
+        """Test that closing the handler writes out buffered records."""
+        from config.logging_profiles import BufferedRotatingFileHandler
+
+        log_file = temp_log_dir / "buffered.log"
+        handler = BufferedRotatingFileHandler(log_file, encoding="utf-8")
+        handler.emit(logging.makeLogRecord({"msg": "pending", "levelno": logging.DEBUG}))
+        handler.close()
+        assert log_file.read_text(encoding="utf-8") == "pending\n"
+
+    def test_rotation_uses_tracked_size(self, temp_log_dir: Path) -> None:
+        """Test that rollover happens once maxBytes is reached."""
+        from config.logging_profiles import BufferedRotatingFileHandler
+
+        log_file = temp_log_dir / "buffered.log"
+        handler = BufferedRotatingFileHandler(log_file, maxBytes=20, backupCount=1, encoding="utf-8")
+        try:
+            for _ in range(3):
+                handler.emit(logging.makeLogRecord({"msg": "0123456789", "levelno": logging.INFO}))
+            handler.flush()
+        finally:
+            handler.close()
+
+        assert (temp_log_dir / "buffered.log.1").exists()
+        assert log_file.read_text(encoding="utf-8") == "0123456789\n"
+
+    def test_buffer_size_is_block_aligned(self, temp_log_dir: Path) -> None:
+        """Test that the buffer size is a multiple of the block size."""
+        import os
+
+        from config.logging_profiles import _MIN_LOG_BUFFER_SIZE, _block_aligned_buffer_size
+
+        size = _block_aligned_buffer_size(temp_log_dir)
+        assert size >= _MIN_LOG_BUFFER_SIZE
+        if hasattr(os, "statvfs"):
+            assert size % os.statvfs(temp_log_dir).f_bsize == 0
+
+
 class TestProfileJsonOutputSettings:
     """Test suite for JSON output settings in profiles."""
 
@@ -334,9 +687,14 @@ __all__ = [
     "TestStructlogIntegration",
     "TestLogLevelNormalization",
     "TestSecretRedaction",
+    "TestExcAndStackInfoProcessor",
+    "TestRedactSecretsProcessor",
     "TestLoggerConfiguration",
     "TestLogEnvironment",
     "TestLogLevelMap",
     "TestFileHandlerCreation",
+    "TestLevelFilter",
+    "TestCachedTimestamp",
+    "TestBufferedFileHandler",
     "TestProfileJsonOutputSettings",
 ]